@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify, Response
 from flask_jwt_extended import jwt_required
 from database.database_setup import Session
 from services.schedule_service import ScheduleService
+from services.clinic_request_precheck import InfeasibleRequestError
 from flasgger import swag_from
 import logging
 
@@ -23,14 +24,16 @@ schedule_blueprint = Blueprint('schedule', __name__)
                 'type': 'object',
                 'properties': {
                     'month': {'type': 'string', 'example': 'January'},
-                    'year': {'type': 'integer', 'example': 2025}
+                    'year': {'type': 'integer', 'example': 2025},
+                    'engine': {'type': 'string', 'enum': ['ga', 'sa', 'tabu', 'flow', 'exact', 'nsga2', 'portfolio'], 'example': 'ga'}
                 },
                 'required': ['month', 'year']
             }
         }
     ],
     'responses': {
-        201: {'description': 'Schedule generated successfully'},
+        201: {'description': 'Schedule generated successfully; with nsga2 the body lists the Pareto front and its run id'},
+        422: {'description': 'Clinic request cannot be covered; the body lists the offending days and doctors'},
         500: {'description': 'Internal server error'}
     }
 })
@@ -40,9 +43,13 @@ def generate_schedule():
         data = request.json
         month = data.get('month')
         year = data.get('year')
-        result = ScheduleService.generate_schedule(session, month, year)
+        engine = data.get('engine', 'ga')
+        result = ScheduleService.generate_schedule(session, month, year, engine)
         logging.info(f"Schedule generated for {month} {year}.")
         return jsonify(result), 201
+    except InfeasibleRequestError as e:
+        logging.warning(f"Infeasible clinic request: {str(e)}")
+        return jsonify({'error': str(e), 'diagnostic': e.diagnostic}), 422
     except Exception as e:
         logging.error(f"Error generating schedule: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -50,6 +57,54 @@ def generate_schedule():
         session.close()
 
 
+@schedule_blueprint.route('/pareto/<string:run_id>', methods=['POST'])
+@jwt_required()
+@swag_from({
+    'tags': ['Schedules'],
+    'summary': 'Save a Pareto front point',
+    'description': 'Saves another point of the Pareto front returned by an nsga2 generate, without solving again.',
+    'parameters': [
+        {'name': 'run_id', 'in': 'path', 'type': 'string', 'required': True, 'description': 'pareto_run of the generate response'},
+        {
+            'name': 'body',
+            'in': 'body',
+            'required': True,
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'pareto_point': {'type': 'integer', 'example': 1}
+                },
+                'required': ['pareto_point']
+            }
+        }
+    ],
+    'responses': {
+        200: {'description': 'Pareto front point saved successfully'},
+        400: {'description': 'pareto_point is not an integer id of the front'},
+        404: {'description': 'Pareto run not found or no longer kept'},
+        500: {'description': 'Internal server error'}
+    }
+})
+def save_pareto_point(run_id):
+    session = Session()
+    try:
+        pareto_point = (request.json or {}).get('pareto_point')
+        if isinstance(pareto_point, bool) or not isinstance(pareto_point, int):
+            return jsonify({'error': 'pareto_point must be an integer'}), 400
+        result = ScheduleService.save_pareto_point(session, run_id, pareto_point)
+        logging.info(f"Saved Pareto front point {pareto_point} of run {run_id}.")
+        return jsonify(result), 200
+    except LookupError as e:
+        return jsonify({'error': str(e)}), 404
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logging.error(f"Error saving Pareto front point: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+    finally:
+        session.close()
+
+
 @schedule_blueprint.route('/history', methods=['GET'])
 @jwt_required()
 @swag_from({
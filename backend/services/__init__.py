@@ -3,6 +3,7 @@
 from .database_to_clinic_request_service import DatabaseToClinicRequestService
 from .doctor_scheduling_service import DoctorSchedulingProblem
 from .genetic_algorithm import eaSimpleWithElitism
+from .incremental_evaluator import IncrementalEvaluator
 from .solution_service import SolutionService
 from .monthly_clinic_request import create_monthly_clinic_request
 
@@ -10,6 +11,7 @@ __all__ = [
     "DatabaseToClinicRequestService",
     "DoctorSchedulingProblem",
     "eaSimpleWithElitism",
+    "IncrementalEvaluator",
     "SolutionService",
     "create_monthly_clinic_request"
 ]
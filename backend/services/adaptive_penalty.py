@@ -0,0 +1,77 @@
+import numpy as np
+
+# Constraint names in the column order of DoctorSchedulingProblem.getPopulationViolations
+CONSTRAINTS = ("preference", "per_day", "per_month", "consecutive")
+
+
+class AdaptivePenalty:
+    """
+    Per-constraint penalty weights that adapt to the population. After every generation,
+    the weight of a constraint violated by at least *high_share* of the population is
+    multiplied by *increase*, and the weight of a constraint violated by at most *low_share*
+    of it is multiplied by *decrease*. The weights are then rescaled so the smallest equals
+    *min_weight*, and capped at *max_weight*.
+
+    Acts as a generation hook: when the weights change it clears the fitness cache and
+    re-scores the population and the hall of fame, then reports the weights.
+    """
+    fields = [f"w_{name}" for name in CONSTRAINTS]
+
+    def __init__(self, problem, representation, fitness_cache=None, increase=1.5, decrease=0.8,
+                 high_share=0.5, low_share=0.1, min_weight=1.0, max_weight=50.0):
+        """
+        Initializes the weights to 1.
+
+        Parameters:
+        - problem (DoctorSchedulingProblem): The scheduling problem instance.
+        - representation: Genome representation used to convert individuals to matrices.
+        - fitness_cache (FitnessCache): Cache holding costs under the current weights.
+        """
+        self.problem = problem
+        self.representation = representation
+        self.fitness_cache = fitness_cache
+        self.increase = increase
+        self.decrease = decrease
+        self.high_share = high_share
+        self.low_share = low_share
+        self.min_weight = min_weight
+        self.max_weight = max_weight
+        self.weights = np.ones(len(CONSTRAINTS))
+
+    def costs(self, individuals):
+        """
+        Returns the weighted cost of every individual as a float array.
+        """
+        return self.problem.getPopulationCosts(self.representation.toMatrix(individuals), self.weights)
+
+    def rescore(self, individuals):
+        """
+        Replaces the fitness of the individuals with their cost under the current weights.
+        """
+        for individual, cost in zip(individuals, self.costs(individuals).tolist()):
+            individual.fitness.values = (cost,)
+
+    def __call__(self, gen, population, halloffame):
+        """
+        Generation hook: adapts the weights to the share of the population violating each
+        constraint and re-scores the run when they change.
+        """
+        violated = (self.problem.getPopulationViolations(self.representation.toMatrix(population)) > 0).mean(axis=0)
+        weights = self.weights.copy()
+        weights[violated >= self.high_share] *= self.increase
+        weights[violated <= self.low_share] *= self.decrease
+        # Only the ratios between weights change the ranking, so the smallest is kept at min_weight
+        weights = np.clip(weights * self.min_weight / weights.min(), self.min_weight, self.max_weight)
+
+        if not np.array_equal(weights, self.weights):
+            self.weights = weights
+            if self.fitness_cache is not None:
+                self.fitness_cache.clear()
+            self.rescore(population)
+            if halloffame is not None and len(halloffame):
+                elites = list(halloffame.items)
+                self.rescore(elites)
+                halloffame.clear()
+                halloffame.update(elites)
+
+        return {field: round(float(weight), 3) for field, weight in zip(self.fields, self.weights)}
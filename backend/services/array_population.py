@@ -0,0 +1,181 @@
+import numpy as np
+from deap import tools
+
+
+class ArrayPopulation:
+    """
+    Population stored as one contiguous uint8 array of shape (individuals, genes) with a
+    parallel fitness vector, where NaN marks individuals that still have to be evaluated.
+
+    Cloning is a fancy-indexing copy of rows, and selection and variation work on whole
+    arrays, instead of deep-copying one list and Fitness object per individual.
+    """
+
+    def __init__(self, genomes, fitness=None):
+        """
+        Initializes the population.
+
+        Parameters:
+        - genomes (np.ndarray): Flat genomes, or schedules of shape (individuals, doctors, days).
+        - fitness (np.ndarray): Cost of each individual, defaults to all unevaluated.
+        """
+        self.genomes = np.ascontiguousarray(genomes, dtype=np.uint8).reshape(len(genomes), -1)
+        if fitness is None:
+            self.fitness = np.full(len(self.genomes), np.nan)
+        else:
+            self.fitness = np.array(fitness, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.genomes)
+
+    def take(self, indices):
+        """
+        Returns a new population holding copies of the given individuals.
+        """
+        return ArrayPopulation(self.genomes[indices], self.fitness[indices])
+
+    @staticmethod
+    def concatenate(populations):
+        """
+        Returns a new population with the individuals of all given populations.
+        """
+        return ArrayPopulation(
+            np.concatenate([population.genomes for population in populations]),
+            np.concatenate([population.fitness for population in populations])
+        )
+
+    def invalid(self):
+        """
+        Returns the indices of the individuals without a fitness.
+        """
+        return np.flatnonzero(np.isnan(self.fitness))
+
+    def evaluate(self, evaluate):
+        """
+        Scores the individuals without a fitness in one call.
+
+        Parameters:
+        - evaluate (callable): Maps a (individuals, genes) array to an array of costs.
+
+        Returns:
+        - int: Number of individuals evaluated.
+        """
+        invalid = self.invalid()
+        if invalid.size:
+            self.fitness[invalid] = evaluate(self.genomes[invalid])
+        return int(invalid.size)
+
+    def best(self, k):
+        """
+        Returns the indices of the k best individuals with distinct genomes, best first.
+        """
+        chosen, seen = [], set()
+        for index in np.argsort(self.fitness, kind="stable").tolist():
+            key = self.genomes[index].tobytes()
+            if key not in seen:
+                seen.add(key)
+                chosen.append(index)
+                if len(chosen) == k:
+                    break
+        return np.asarray(chosen, dtype=np.intp)
+
+
+def selTournamentArray(fitness, k, tournsize, rng):
+    """
+    Tournament selection on a fitness vector (lower is better).
+
+    Returns:
+    - np.ndarray: Indices of the k winners.
+    """
+    contestants = rng.integers(0, len(fitness), size=(k, tournsize))
+    return contestants[np.arange(k), np.argmin(fitness[contestants], axis=1)]
+
+
+def cxTwoPointArray(genomes, cxpb, rng):
+    """
+    Two-point crossover of consecutive pairs of rows, in place; each pair is crossed with
+    probability cxpb.
+    """
+    first, second = genomes[0:len(genomes) - 1:2], genomes[1::2]
+    crossed = rng.random(len(first)) < cxpb
+    positions = np.arange(genomes.shape[1])
+    cuts = np.sort(rng.integers(1, genomes.shape[1], size=(len(first), 2)), axis=1)
+    mask = (positions >= cuts[:, :1]) & (positions < cuts[:, 1:]) & crossed[:, np.newaxis]
+    swapped = np.where(mask, second, first)
+    second[:] = np.where(mask, first, second)
+    first[:] = swapped
+
+
+def mutFlipBitArray(genomes, mutpb, indpb, rng):
+    """
+    Bit-flip mutation in place: each row is mutated with probability mutpb, and each gene
+    of a mutated row is flipped with probability indpb.
+    """
+    mutated = rng.random(len(genomes)) < mutpb
+    genomes[mutated] ^= (rng.random((int(mutated.sum()), genomes.shape[1])) < indpb).astype(np.uint8)
+
+
+def eaArrayElitism(population, evaluate, cxpb, mutpb, indpb, ngen, elite_size, rng, tournsize=2,
+                   repair=None, stopping=None, verbose=False):
+    """
+    eaSimpleWithElitism on an ArrayPopulation: the elite_size best distinct individuals
+    play the part of the hall of fame, and are carried into every generation unchanged.
+
+    Offspring are picked by tournament, crossed with two-point crossover and bit-flip
+    mutated as whole arrays. Only the offspring whose genome actually changed lose their
+    fitness; these are repaired, when *repair* is given, and scored in one call to
+    *evaluate*.
+
+    Parameters:
+    - population (ArrayPopulation): Initial population.
+    - evaluate (callable): Maps a (individuals, genes) array to an array of costs.
+    - cxpb (float): Probability of crossing a pair of offspring.
+    - mutpb (float): Probability of mutating an offspring.
+    - indpb (float): Probability of flipping each gene of a mutated offspring.
+    - ngen (int): Maximum number of generations.
+    - elite_size (int): Number of elites carried over.
+    - rng (np.random.Generator): Random number generator.
+    - repair (callable): Optional map of a (individuals, genes) array to repaired genomes.
+    - stopping (EarlyStopping): Optional stopping rules.
+
+    Returns:
+    - tuple: The final population, the elites (best first) and the logbook.
+    """
+    logbook = tools.Logbook()
+    logbook.header = ['gen', 'nevals', 'min', 'avg', 'stop']
+
+    def record(gen, nevals, elites):
+        reason = stopping.checkCosts(elites.fitness[0], population.fitness) if stopping else None
+        if reason is None and gen == ngen:
+            reason = "max_generations"
+        entry = {"gen": gen, "nevals": nevals, "min": population.fitness.min(), "avg": population.fitness.mean()}
+        logbook.record(**entry, **({"stop": reason} if reason else {}))
+        if verbose:
+            print(logbook.stream)
+        return reason
+
+    invalid = population.invalid()
+    if repair is not None and invalid.size:
+        population.genomes[invalid] = repair(population.genomes[invalid])
+    nevals = population.evaluate(evaluate)
+    elites = population.take(population.best(elite_size))
+    reason = record(0, nevals, elites)
+
+    for gen in range(1, ngen + 1):
+        if reason:
+            break
+        offspring = population.take(selTournamentArray(population.fitness, len(population) - len(elites), tournsize, rng))
+        parents = offspring.genomes.copy()
+        cxTwoPointArray(offspring.genomes, cxpb, rng)
+        mutFlipBitArray(offspring.genomes, mutpb, indpb, rng)
+        changed = np.flatnonzero((offspring.genomes != parents).any(axis=1))
+        if repair is not None and changed.size:
+            offspring.genomes[changed] = repair(offspring.genomes[changed])
+        offspring.fitness[changed] = np.nan
+        nevals = offspring.evaluate(evaluate)
+
+        population = ArrayPopulation.concatenate([offspring, elites])
+        elites = population.take(population.best(elite_size))
+        reason = record(gen, nevals, elites)
+
+    return population, elites, logbook
@@ -0,0 +1,157 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import maximum_flow
+
+
+class InfeasibleRequestError(ValueError):
+    """
+    Raised when a clinic request cannot be covered by any schedule. The structured result
+    of check_clinic_request is available as the *diagnostic* attribute.
+    """
+
+    def __init__(self, diagnostic):
+        self.diagnostic = diagnostic
+        super().__init__("; ".join(issue["message"] for issue in diagnostic["errors"]))
+
+
+def _max_non_adjacent(available):
+    """
+    Returns, per doctor, the most shifts that fit on available days without working two
+    consecutive days: every run of k available days holds ceil(k / 2) shifts.
+    """
+    padded = np.pad(available.astype(np.int8), ((0, 0), (1, 1)))
+    edges = np.diff(padded, axis=1)
+    starts = np.argwhere(edges == 1)
+    ends = np.argwhere(edges == -1)
+    runs = ends[:, 1] - starts[:, 1]
+    return np.bincount(starts[:, 0], weights=(runs + 1) // 2, minlength=available.shape[0]).astype(int)
+
+
+def _coverage_flow(available, capacity, required):
+    """
+    Returns the largest total coverage up to *required* per day that doctors limited to
+    *capacity* shifts can give on their available days, as a max flow
+    source -> doctor -> day -> sink.
+    """
+    num_doctors, num_days = available.shape
+    source, sink = 0, num_doctors + num_days + 1
+    doctor_nodes = 1 + np.arange(num_doctors)
+    day_nodes = 1 + num_doctors + np.arange(num_days)
+    doctor_of_cell, day_of_cell = np.nonzero(available)
+    tails = np.concatenate([np.full(num_doctors, source), doctor_nodes[doctor_of_cell], day_nodes])
+    heads = np.concatenate([doctor_nodes, day_nodes[day_of_cell], np.full(num_days, sink)])
+    capacities = np.concatenate([capacity, np.ones(len(doctor_of_cell), dtype=int), required]).astype(np.int32)
+    graph = csr_matrix((capacities, (tails, heads)), shape=(sink + 1, sink + 1))
+    return int(maximum_flow(graph, source, sink).flow_value)
+
+
+def check_clinic_request(clinic_request, minShiftsPerMonth, maxShiftsPerMonth):
+    """
+    Checks a MonthlyClinicRequest for conditions that no schedule can satisfy, using
+    vectorized counts and a max-flow bound instead of a solver run.
+
+    Errors make the daily coverage impossible: a request without doctors, a day with fewer
+    available doctors than minShifts, a day whose minShifts exceeds maxShifts, or doctor
+    capacity (days available, capped at the monthly maximum) below the required coverage. Warnings list the rules a
+    best-effort schedule will have to break: doctors who cannot reach the monthly minimum,
+    pairs of adjacent days that cannot both be covered without consecutive shifts, and a
+    required coverage above what doctors can give without consecutive shifts.
+
+    Parameters:
+    - clinic_request (dict): Output of DatabaseToClinicRequestService.get_monthly_clinic_request.
+    - minShiftsPerMonth (int): Minimum shifts per doctor in the month, as
+      DoctorSchedulingProblem.doctorMinShiftPerMonth.
+    - maxShiftsPerMonth (int): Maximum shifts per doctor in the month, as
+      DoctorSchedulingProblem.doctorMaxShiftPerMonth.
+
+    Returns:
+    - dict: {"feasible": bool, "errors": [...], "warnings": [...]}, where each issue has a
+      "code", a "message" and the offending "days" (1-based day numbers with available and
+      required counts) and/or "doctors" (names with available and required counts).
+    """
+    doctor_names = list(clinic_request["doctorNames"])
+    shift_min = np.asarray(clinic_request["minShifts"], dtype=int)
+    shift_max = np.asarray(clinic_request["maxShifts"], dtype=int)
+    num_days = len(shift_min)
+    if not doctor_names:
+        return {
+            "feasible": False,
+            "errors": [{"code": "no_doctors", "message": "The request has no doctors to schedule",
+                        "available": 0, "required": int(shift_min.sum())}],
+            "warnings": [],
+        }
+    available = np.asarray(clinic_request["doctorPreference"], dtype=int).reshape(len(doctor_names), -1)
+    available = available[:, :num_days] == 1
+    errors, warnings = [], []
+
+    def days_issue(code, message, days, counts, required):
+        return {
+            "code": code, "message": message,
+            "days": [{"day": int(day) + 1, "available": int(counts[day]), "required": int(required[day])} for day in days],
+        }
+
+    def doctors_issue(code, message, doctors, counts, required):
+        return {
+            "code": code, "message": message,
+            "doctors": [{"doctor": doctor_names[doctor], "available": int(counts[doctor]), "required": int(required)}
+                        for doctor in doctors],
+        }
+
+    per_day = available.sum(axis=0)
+    days = np.flatnonzero(per_day < shift_min)
+    if days.size:
+        errors.append(days_issue(
+            "day_understaffed", f"{days.size} day(s) have fewer available doctors than minShifts",
+            days, per_day, shift_min
+        ))
+
+    days = np.flatnonzero(shift_min > shift_max)
+    if days.size:
+        errors.append(days_issue(
+            "day_bounds", f"{days.size} day(s) have minShifts above maxShifts", days, shift_max, shift_min
+        ))
+
+    required = int(shift_min.sum())
+    per_doctor = available.sum(axis=1)
+    capacity = np.minimum(per_doctor, maxShiftsPerMonth)
+    if int(capacity.sum()) < required:
+        errors.append({
+            "code": "capacity", "message": f"Doctors can cover {int(capacity.sum())} shifts, {required} are required",
+            "available": int(capacity.sum()), "required": required,
+        })
+    elif not errors:
+        covered = _coverage_flow(available, capacity, shift_min)
+        if covered < required:
+            errors.append({
+                "code": "coverage_flow",
+                "message": f"At most {covered} of the {required} required shifts can be assigned to available doctors",
+                "available": covered, "required": required,
+            })
+
+    doctors = np.flatnonzero(per_doctor < minShiftsPerMonth)
+    if doctors.size:
+        warnings.append(doctors_issue(
+            "doctor_monthly_minimum", f"{doctors.size} doctor(s) have fewer available days than the monthly minimum",
+            doctors, per_doctor, minShiftsPerMonth
+        ))
+
+    pair_available = (available[:, 1:] | available[:, :-1]).sum(axis=0)
+    pair_required = shift_min[1:] + shift_min[:-1]
+    days = np.flatnonzero(pair_available < pair_required)
+    if days.size:
+        warnings.append({
+            "code": "adjacent_days",
+            "message": f"{days.size} pair(s) of adjacent days cannot be covered without consecutive shifts",
+            "days": [{"day": int(day) + 1, "available": int(pair_available[day]), "required": int(pair_required[day])}
+                     for day in days],
+        })
+
+    rested_capacity = int(np.minimum(_max_non_adjacent(available), maxShiftsPerMonth).sum())
+    if rested_capacity < required:
+        warnings.append({
+            "code": "rest_capacity",
+            "message": f"Without consecutive shifts doctors can cover {rested_capacity} shifts, {required} are required",
+            "available": rested_capacity, "required": required,
+        })
+
+    return {"feasible": not errors, "errors": errors, "warnings": warnings}
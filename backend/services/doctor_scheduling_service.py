@@ -27,9 +27,21 @@ class DoctorSchedulingProblem:
         self.doctorshiftMax = doctorshiftMax
         self.doctorshiftMin = doctorshiftMin
         self.doctorMaxShiftPerMonth = 7
+        self.doctorMinShiftPerMonth = 5
         self.weeks = 4
         self.num_days = num_days
 
+        # Array views of the constraints used by the vectorized evaluators
+        self.unavailableArray = np.zeros((len(self.doctors), self.num_days), dtype=bool)
+        for doctorIndex, shiftPreference in enumerate(self.doctorShiftPreference[:len(self.doctors)]):
+            row = list(shiftPreference)[:self.num_days]
+            self.unavailableArray[doctorIndex, :len(row)] = [pref == 0 for pref in row]
+        self.shiftMaxArray = np.asarray(list(self.doctorshiftMax)[:self.num_days], dtype=np.int32)
+        self.shiftMinArray = np.asarray(list(self.doctorshiftMin)[:self.num_days], dtype=np.int32)
+        self.weekendArray = np.zeros(self.num_days, dtype=bool)
+        weekends = list(self.weekendPositionArray)[:self.num_days]
+        self.weekendArray[:len(weekends)] = [position == 1 for position in weekends]
+
         # Debugging information
         print("DoctorSchedulingProblem initialized with:")
         print("Hard Constraint Penalty:", self.hardConstraintPenalty)
@@ -76,6 +88,100 @@ class DoctorSchedulingProblem:
 
         return self.hardConstraintPenalty * hardContstraintViolations
 
+    def toMatrix(self, population):
+        """
+        Converts a population into a (population, doctors, days) array.
+
+        Parameters:
+        - population (list or np.ndarray): Flat binary schedules, or an array that is already
+          shaped (population, doctors, days).
+
+        Returns:
+        - np.ndarray: uint8 array of shape (population, doctors, days).
+        """
+        matrix = np.asarray(population, dtype=np.uint8)
+        return matrix.reshape(-1, len(self.doctors), self.num_days)
+
+    def getPopulationViolations(self, population):
+        """
+        Counts the hard constraint violations of a whole population in one vectorized pass.
+
+        Parameters:
+        - population (list or np.ndarray): Schedules accepted by toMatrix.
+
+        Returns:
+        - np.ndarray: int array of shape (population, 4) with the preference, per day,
+          per month and consecutive shift violations of each schedule.
+        """
+        matrix = self.toMatrix(population)
+        violations = np.zeros((matrix.shape[0], 4), dtype=np.int64)
+
+        # Shifts assigned on requested days off
+        violations[:, 0] = (matrix & self.unavailableArray).sum(axis=(1, 2))
+
+        # Daily coverage outside the [min, max] range
+        coverage = matrix.sum(axis=1, dtype=np.int32)
+        violations[:, 1] = (
+            np.maximum(coverage - self.shiftMaxArray, 0) +
+            np.maximum(self.shiftMinArray - coverage, 0)
+        ).sum(axis=1)
+
+        # Monthly shift totals outside the allowed range per doctor
+        totals = matrix.sum(axis=2, dtype=np.int32)
+        violations[:, 2] = (
+            np.maximum(totals - self.doctorMaxShiftPerMonth, 0) +
+            np.maximum(self.doctorMinShiftPerMonth - totals, 0)
+        ).sum(axis=1)
+
+        # Shifts on two consecutive days
+        violations[:, 3] = (matrix[:, :, 1:] & matrix[:, :, :-1]).sum(axis=(1, 2))
+
+        return violations
+
+    def getPopulationCosts(self, population, weights=None):
+        """
+        Calculates the cost of every schedule in a population at once.
+
+        Equivalent to calling getCost on each schedule, without the per-individual Python loops.
+
+        Parameters:
+        - population (list or np.ndarray): Schedules accepted by toMatrix.
+        - weights (np.ndarray): Optional multipliers of the preference, per day, per month and
+          consecutive violations, e.g. adaptive penalty weights (default: all 1).
+
+        Returns:
+        - np.ndarray: Total penalty cost of each schedule (int, or float when weighted).
+        """
+        violations = self.getPopulationViolations(population)
+        if weights is None:
+            return self.hardConstraintPenalty * violations.sum(axis=1)
+        return self.hardConstraintPenalty * (violations @ np.asarray(weights, dtype=float))
+
+    def getPopulationSoftViolations(self, population):
+        """
+        Counts the soft constraint violations of a whole population in one vectorized pass,
+        using the rules of the original prototype: weekend shifts of each doctor beyond two,
+        and pairs of shifts with a single day off between them.
+
+        Parameters:
+        - population (list or np.ndarray): Schedules accepted by toMatrix.
+
+        Returns:
+        - np.ndarray: int array of shape (population, 2) with the weekend and rest spacing
+          violations of each schedule.
+        """
+        matrix = self.toMatrix(population)
+        violations = np.zeros((matrix.shape[0], 2), dtype=np.int64)
+
+        # Weekend shifts beyond two per doctor
+        weekends = matrix[:, :, self.weekendArray].sum(axis=2, dtype=np.int32)
+        violations[:, 0] = np.maximum(weekends - 2, 0).sum(axis=1)
+
+        # Shifts two days apart (work, day off, work)
+        violations[:, 1] = (matrix[:, :, 2:] & (1 - matrix[:, :, 1:-1]) & matrix[:, :, :-2]).sum(axis=(1, 2))
+
+        return violations
+
     def getDoctorWeekShifts(self, schedule):
         """
         Converts the schedule into a dictionary format, grouped by doctors.
@@ -128,8 +234,8 @@ class DoctorSchedulingProblem:
             weeklyShifts = sum(doctorShifts)
             if weeklyShifts > self.doctorMaxShiftPerMonth:
                 violations += weeklyShifts - self.doctorMaxShiftPerMonth
-            if weeklyShifts < 5:
-                violations += 5 - weeklyShifts
+            if weeklyShifts < self.doctorMinShiftPerMonth:
+                violations += self.doctorMinShiftPerMonth - weeklyShifts
         return violations
 
     def doctorsCountShiftsPerDayViolation(self, doctorShiftDic):
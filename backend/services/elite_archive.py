@@ -0,0 +1,86 @@
+import bisect
+import itertools
+
+
+class EliteArchive:
+    """
+    Drop-in replacement for deap.tools.HallOfFame with the same ordering and duplicate
+    rules, and cheaper bookkeeping.
+
+    The elites are kept best first in a list, next to a list of their sort keys. The worst
+    elite is the last one, so an individual that cannot enter is rejected with one
+    comparison, and one that can is placed with a binary search and one list insertion,
+    evicting the last elite, instead of re-sorting the archive. A hash set of genomes
+    rejects duplicates in O(1) instead of comparing with every elite. Elites are stored as
+    shallow copies with their fitness, not deep copies.
+    """
+
+    def __init__(self, maxsize):
+        """
+        Initializes an empty archive.
+
+        Parameters:
+        - maxsize (int): Number of elites kept.
+        """
+        self.maxsize = maxsize
+        self.clear()
+
+    def clear(self):
+        """
+        Removes all elites.
+        """
+        self.keys = []
+        self.genomes = set()
+        self.counter = itertools.count()
+        self._items = []
+
+    @staticmethod
+    def _copy(individual):
+        elite = type(individual)(individual)
+        elite.fitness.values = individual.fitness.values
+        return elite
+
+    def update(self, population):
+        """
+        Offers every individual of *population* to the archive. Like HallOfFame, an
+        individual enters while the archive is not full or when it is strictly better than
+        the worst elite, which it then replaces, and never when its genome is already in
+        the archive.
+        """
+        for individual in population:
+            wvalues = individual.fitness.wvalues
+            full = len(self._items) == self.maxsize
+            if full and (not self.maxsize or wvalues <= self._items[-1].fitness.wvalues):
+                continue
+            genome = tuple(individual)
+            if genome in self.genomes:
+                continue
+            if full:
+                self.keys.pop()
+                self.genomes.discard(tuple(self._items.pop()))
+            # Ascending keys put the best first and, among equal fitness, the newest first,
+            # so the oldest of the worst elites is the last one and is evicted first
+            key = (tuple(-value for value in wvalues), -next(self.counter))
+            position = bisect.bisect(self.keys, key)
+            self.keys.insert(position, key)
+            self._items.insert(position, self._copy(individual))
+            self.genomes.add(genome)
+
+    @property
+    def items(self):
+        """
+        The elites, best first; among equal fitness, the latest inserted first.
+        """
+        return self._items
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __reversed__(self):
+        return reversed(self._items)
@@ -0,0 +1,121 @@
+import math
+import time
+
+import numpy as np
+from deap import tools
+from scipy.optimize import Bounds, LinearConstraint, milp
+from scipy.sparse import coo_matrix
+
+
+def solveExact(problem, time_limit=60.0, mip_rel_gap=0.0):
+    """
+    Solves the scheduling problem as a 0/1 integer program with HiGHS.
+
+    One binary variable per (doctor, day) cell, plus non-negative slack variables for
+    coverage above maxShifts or below minShifts on each day, monthly totals outside the
+    doctor bounds, and shifts on two consecutive days. The objective is the number of hard
+    constraint violations, so the optimum equals the minimum of getCost.
+
+    The proven lower bound is rounded up to a whole number of violations, because every
+    schedule costs a multiple of the hard constraint penalty.
+
+    Parameters:
+    - problem (DoctorSchedulingProblem): The scheduling problem instance.
+    - time_limit (float): Wall-clock limit in seconds handed to the MIP solver.
+    - mip_rel_gap (float): Relative gap at which the solver may stop early.
+
+    Returns:
+    - tuple: The incumbent flat schedule, its cost and a logbook with the solver status,
+      seconds, cost, proven lower bound and relative gap.
+    """
+    num_doctors, num_days = len(problem.doctors), problem.num_days
+    num_cells = num_doctors * num_days
+    num_pairs = num_doctors * (num_days - 1)
+
+    # Variables: cells, consecutive pairs, day over/under, doctor over/under
+    cost = np.concatenate([
+        problem.unavailableArray.ravel().astype(float), np.ones(num_pairs),
+        np.ones(2 * num_days), np.ones(2 * num_doctors)
+    ])
+    cells = np.arange(num_cells)
+    pairs = num_cells + np.arange(num_pairs)
+    day_over = num_cells + num_pairs + np.arange(num_days)
+    day_under = day_over + num_days
+    doctor_over = num_cells + num_pairs + 2 * num_days + np.arange(num_doctors)
+    doctor_under = doctor_over + num_doctors
+
+    doctor_of_cell, day_of_cell = np.divmod(cells, num_days)
+    first_of_pair = (cells.reshape(num_doctors, num_days)[:, :-1]).ravel()
+
+    rows, cols, values, lower, upper = [], [], [], [], []
+
+    def add(row_index, col_index, value):
+        rows.append(np.asarray(row_index))
+        cols.append(np.asarray(col_index))
+        values.append(np.full(np.shape(col_index), value, dtype=float))
+
+    # Daily coverage: covered - over <= max, covered + under >= min
+    offset = 0
+    add(offset + day_of_cell, cells, 1.0)
+    add(offset + np.arange(num_days), day_over, -1.0)
+    lower.append(np.full(num_days, -np.inf))
+    upper.append(problem.shiftMaxArray)
+    offset += num_days
+    add(offset + day_of_cell, cells, 1.0)
+    add(offset + np.arange(num_days), day_under, 1.0)
+    lower.append(problem.shiftMinArray)
+    upper.append(np.full(num_days, np.inf))
+
+    # Monthly totals: total - over <= max, total + under >= min
+    offset += num_days
+    add(offset + doctor_of_cell, cells, 1.0)
+    add(offset + np.arange(num_doctors), doctor_over, -1.0)
+    lower.append(np.full(num_doctors, -np.inf))
+    upper.append(np.full(num_doctors, problem.doctorMaxShiftPerMonth))
+    offset += num_doctors
+    add(offset + doctor_of_cell, cells, 1.0)
+    add(offset + np.arange(num_doctors), doctor_under, 1.0)
+    lower.append(np.full(num_doctors, problem.doctorMinShiftPerMonth))
+    upper.append(np.full(num_doctors, np.inf))
+
+    # Consecutive days: x[i, j] + x[i, j + 1] - pair <= 1
+    offset += num_doctors
+    add(offset + np.arange(num_pairs), first_of_pair, 1.0)
+    add(offset + np.arange(num_pairs), first_of_pair + 1, 1.0)
+    add(offset + np.arange(num_pairs), pairs, -1.0)
+    lower.append(np.full(num_pairs, -np.inf))
+    upper.append(np.ones(num_pairs))
+    offset += num_pairs
+
+    matrix = coo_matrix(
+        (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))), shape=(offset, len(cost))
+    ).tocsr()
+    integrality = np.zeros(len(cost))
+    integrality[:num_cells] = 1
+    bounds = Bounds(np.zeros(len(cost)), np.concatenate([np.ones(num_cells), np.full(len(cost) - num_cells, np.inf)]))
+
+    start = time.perf_counter()
+    result = milp(
+        cost, constraints=LinearConstraint(matrix, np.concatenate(lower), np.concatenate(upper)),
+        integrality=integrality, bounds=bounds,
+        options={"time_limit": time_limit, "mip_rel_gap": mip_rel_gap, "disp": False}
+    )
+    seconds = time.perf_counter() - start
+    if result.x is None:
+        raise ValueError(f"Exact solver found no schedule: {result.message}")
+
+    schedule = (np.rint(result.x[:num_cells]) > 0).astype(int).tolist()
+    best_cost = int(problem.getPopulationCosts([schedule])[0])
+    dual_bound = getattr(result, "mip_dual_bound", None)
+    if dual_bound is None or not np.isfinite(dual_bound):
+        dual_bound = 0.0
+    bound = min(problem.hardConstraintPenalty * math.ceil(dual_bound - 1e-6), best_cost)
+    gap = (best_cost - bound) / best_cost if best_cost else 0.0
+
+    logbook = tools.Logbook()
+    logbook.header = ['status', 'seconds', 'cost', 'bound', 'gap']
+    logbook.record(
+        status="optimal" if best_cost == bound else "feasible",
+        seconds=round(seconds, 3), cost=best_cost, bound=bound, gap=gap
+    )
+    return schedule, best_cost, logbook
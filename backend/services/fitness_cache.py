@@ -0,0 +1,71 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+class FitnessCache:
+    """
+    Bounded least-recently-used cache of schedule costs, keyed by the bit-packed genome.
+    """
+    fields = ["hits", "misses"]
+
+    def __init__(self, maxsize):
+        """
+        Initializes an empty cache.
+
+        Parameters:
+        - maxsize (int): Maximum number of costs kept before the least recently used are dropped.
+        """
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def keys(population):
+        """
+        Returns one hashable key per schedule of a (population, doctors, days) array.
+        """
+        population = np.asarray(population, dtype=np.uint8)
+        packed = np.packbits(population.reshape(len(population), -1), axis=1)
+        return [row.tobytes() for row in packed]
+
+    def lookup(self, keys):
+        """
+        Returns the cached cost of each key, or None when it is not cached.
+        """
+        costs = []
+        for key in keys:
+            cost = self.entries.get(key)
+            if cost is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.entries.move_to_end(key)
+            costs.append(cost)
+        return costs
+
+    def store(self, keys, costs):
+        """
+        Adds the given costs to the cache, evicting the least recently used entries.
+        """
+        for key, cost in zip(keys, costs):
+            self.entries[key] = cost
+            self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Drops all cached costs, e.g. after the cost function changed.
+        """
+        self.entries.clear()
+
+    def __call__(self, gen, population, halloffame):
+        """
+        Generation hook: reports and resets the hit/miss counters of the generation.
+        """
+        record = {"hits": self.hits, "misses": self.misses}
+        self.hits = 0
+        self.misses = 0
+        return record
@@ -0,0 +1,104 @@
+import numpy as np
+from scipy.optimize import linprog
+from scipy.sparse import coo_matrix
+
+# Cost of one unit of unmet coverage or unmet monthly minimum, well above any assignment cost
+SHORTFALL_COST = 1000.0
+
+
+def solveCoverageFlow(problem, weekend_cost=1.0, noise=0.0, rng=None):
+    """
+    Solves the coverage relaxation of the scheduling problem as a min-cost flow.
+
+    Flow goes from a source through each doctor (bounded by the monthly minimum and
+    maximum), over an arc to each available day, into a sink through each day (bounded by
+    minShifts and maxShifts). Weekend arcs of a doctor pass through a per-doctor weekend
+    node whose k-th unit costs k * *weekend_cost*, which spreads weekend load across doctors.
+    Unmet lower bounds are allowed at SHORTFALL_COST per unit, so the relaxation always has
+    a solution. Consecutive-day shifts are not part of the relaxation.
+
+    The flow is solved as a linear program with HiGHS. Its constraint matrix is a network
+    matrix, so the optimal vertex is integral.
+
+    Parameters:
+    - problem (DoctorSchedulingProblem): The scheduling problem instance.
+    - weekend_cost (float): Marginal cost step per weekend shift of the same doctor.
+    - noise (float): Scale of random perturbations added to the arc costs, used to get
+      different optimal schedules from repeated solves.
+    - rng (np.random.Generator): Random number generator for the perturbations.
+
+    Returns:
+    - list: Flat binary schedule (doctor by doctor).
+    """
+    num_doctors, num_days = len(problem.doctors), problem.num_days
+    weekend = np.asarray(problem.weekendPositionArray[:num_days], dtype=bool)
+    num_weekend = int(weekend.sum())
+    num_cells = num_doctors * num_days
+    num_steps = num_doctors * num_weekend
+
+    # Variables: cells x[i, j], weekend steps y[i, k], day shortfall, doctor shortfall
+    cell_cost = np.ones((num_doctors, num_days))
+    if noise:
+        cell_cost += noise * (rng or np.random.default_rng()).random((num_doctors, num_days))
+    step_cost = np.tile(weekend_cost * np.arange(1, num_weekend + 1), num_doctors)
+    cost = np.concatenate([
+        cell_cost.ravel(), step_cost,
+        np.full(num_days, SHORTFALL_COST), np.full(num_doctors, SHORTFALL_COST)
+    ])
+
+    doctor_of_cell = np.repeat(np.arange(num_doctors), num_days)
+    day_of_cell = np.tile(np.arange(num_days), num_doctors)
+    weekday_cell = ~weekend[day_of_cell]
+    cells = np.arange(num_cells)
+    steps = num_cells + np.arange(num_steps)
+    doctor_of_step = np.repeat(np.arange(num_doctors), num_weekend)
+    day_slack = num_cells + num_steps + np.arange(num_days)
+    doctor_slack = num_cells + num_steps + num_days + np.arange(num_doctors)
+
+    ub_entries, eq_entries, upper = [], [], []
+
+    def entries(row_index, col_index, value):
+        return np.asarray(row_index), np.asarray(col_index), np.full(np.shape(col_index), value)
+
+    # Day coverage: covered + shortfall >= min, covered <= max
+    ub_entries.append(entries(day_of_cell, cells, -1.0))
+    ub_entries.append(entries(np.arange(num_days), day_slack, -1.0))
+    upper.append(-problem.shiftMinArray)
+    ub_entries.append(entries(num_days + day_of_cell, cells, 1.0))
+    upper.append(problem.shiftMaxArray)
+
+    # Doctor totals (weekday cells plus weekend steps): total + shortfall >= min, total <= max
+    offset = 2 * num_days
+    ub_entries.append(entries(offset + doctor_of_cell[weekday_cell], cells[weekday_cell], -1.0))
+    ub_entries.append(entries(offset + doctor_of_step, steps, -1.0))
+    ub_entries.append(entries(offset + np.arange(num_doctors), doctor_slack, -1.0))
+    upper.append(np.full(num_doctors, -problem.doctorMinShiftPerMonth))
+    offset += num_doctors
+    ub_entries.append(entries(offset + doctor_of_cell[weekday_cell], cells[weekday_cell], 1.0))
+    ub_entries.append(entries(offset + doctor_of_step, steps, 1.0))
+    upper.append(np.full(num_doctors, problem.doctorMaxShiftPerMonth))
+
+    # Weekend node conservation: weekend cells of a doctor equal its weekend steps
+    eq_entries.append(entries(doctor_of_cell[~weekday_cell], cells[~weekday_cell], 1.0))
+    eq_entries.append(entries(doctor_of_step, steps, -1.0))
+
+    def matrix(parts, num_rows):
+        row_index, col_index, value = (np.concatenate(part) for part in zip(*parts))
+        return coo_matrix((value, (row_index, col_index)), shape=(num_rows, len(cost))).tocsr()
+
+    bounds = np.zeros((len(cost), 2))
+    bounds[:num_cells, 1] = ~problem.unavailableArray.ravel()
+    bounds[num_cells:num_cells + num_steps, 1] = 1
+    bounds[num_cells + num_steps:, 1] = np.inf
+
+    result = linprog(
+        cost,
+        A_ub=matrix(ub_entries, 2 * num_days + 2 * num_doctors), b_ub=np.concatenate(upper).astype(float),
+        A_eq=matrix(eq_entries, num_doctors) if num_steps else None,
+        b_eq=np.zeros(num_doctors) if num_steps else None,
+        bounds=bounds, method="highs-ds"
+    )
+    if result.status != 0:
+        raise ValueError(f"Coverage flow could not be solved: {result.message}")
+
+    return (np.rint(result.x[:num_cells]) > 0).astype(int).tolist()
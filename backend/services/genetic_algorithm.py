@@ -2,21 +2,115 @@
 from deap import tools
 from deap import algorithms
 
+
+def evaluateInvalid(individuals, toolbox):
+    """Assigns fitness values to the given individuals. Individuals carrying a
+    ``fitnessHint`` (set by incremental mutation operators) take it as their fitness. When
+    the toolbox provides an ``evaluatePopulation`` operator the rest are scored in one call,
+    otherwise every individual goes through ``toolbox.map(toolbox.evaluate, ...)``.
+    """
+    pending = []
+    for ind in individuals:
+        hint = ind.__dict__.pop("fitnessHint", None)
+        if hint is None:
+            pending.append(ind)
+        else:
+            ind.fitness.values = hint
+    individuals = pending
+    if not individuals:
+        return
+    if hasattr(toolbox, "evaluatePopulation"):
+        fitnesses = toolbox.evaluatePopulation(individuals)
+    else:
+        fitnesses = toolbox.map(toolbox.evaluate, individuals)
+    for ind, fit in zip(individuals, fitnesses):
+        ind.fitness.values = fit
+
+
+class EarlyStopping:
+    """Stopping rules for eaSimpleWithElitism. A run stops when the hall-of-fame best
+    reaches *target_cost*, when it has not improved for *stall_generations* generations,
+    or when the gap between the average and minimum population fitness drops below
+    *min_gap*. Rules left as None are disabled.
+    """
+
+    def __init__(self, target_cost=None, stall_generations=None, min_gap=None):
+        self.target_cost = target_cost
+        self.stall_generations = stall_generations
+        self.min_gap = min_gap
+        self.best = None
+        self.stalled = 0
+
+    def check(self, population, halloffame):
+        """Returns the reason to stop after the current generation, or None to continue."""
+        costs = None if self.min_gap is None else [ind.fitness.values[0] for ind in population]
+        return self.checkCosts(halloffame[0].fitness.values[0], costs)
+
+    def checkCosts(self, best, costs):
+        """Same as check, from the best cost so far and the costs of the population (only
+        read by the *min_gap* rule)."""
+        gap = None if self.min_gap is None else sum(costs) / len(costs) - min(costs)
+        return self.checkGap(best, gap)
+
+    def checkGap(self, best, gap):
+        """Same as check, from the best cost so far and the gap between the average and
+        minimum population fitness (only read by the *min_gap* rule)."""
+        if self.best is None or best < self.best:
+            self.best = best
+            self.stalled = 0
+        else:
+            self.stalled += 1
+
+        if self.target_cost is not None and best <= self.target_cost:
+            return "target"
+        if self.stall_generations is not None and self.stalled >= self.stall_generations:
+            return "stall"
+        if self.min_gap is not None and gap < self.min_gap:
+            return "converged"
+        return None
+
+
+def compileRecord(population, halloffame, gen, stats=None, hooks=None):
+    """Builds the logbook entry of a generation from the statistics and the values
+    returned by each generation hook.
+    """
+    record = stats.compile(population) if stats else {}
+    for hook in hooks or ():
+        record.update(hook(gen, population, halloffame) or {})
+    return record
+
+
 def eaSimpleWithElitism(population, toolbox, cxpb, mutpb, ngen, stats=None,
-             halloffame=None, verbose=__debug__):
+             halloffame=None, verbose=__debug__, hooks=None, stopping=None):
     """This algorithm is similar to DEAP eaSimple() algorithm, with the modification that
     halloffame is used to implement an elitism mechanism. The individuals contained in the
     halloffame are directly injected into the next generation and are not subject to the
     genetic operators of selection, crossover and mutation.
+
+    Each callable in *hooks* is called as ``hook(gen, population, halloffame)`` after every
+    generation, and the dict it returns is added to that generation's logbook record. The
+    names listed in a hook's ``fields`` attribute are added to the logbook header.
+
+    When the toolbox provides a ``repair`` operator, it is applied in place to the
+    individuals with an invalid fitness right before they are evaluated.
+
+    When an EarlyStopping instance is given as *stopping*, the run may end before *ngen*
+    generations; the reason is recorded as ``stop`` in the last logbook record.
+
+    A hook returning ``cxpb`` or ``mutpb`` sets the crossover or mutation probability used
+    from the next generation on.
     """
     logbook = tools.Logbook()
     logbook.header = ['gen', 'nevals'] + (stats.fields if stats else [])
+    for hook in hooks or ():
+        logbook.header += getattr(hook, "fields", [])
+    logbook.header.append('stop')
 
     # Evaluate the individuals with an invalid fitness
     invalid_ind = [ind for ind in population if not ind.fitness.valid]
-    fitnesses = toolbox.map(toolbox.evaluate, invalid_ind)
-    for ind, fit in zip(invalid_ind, fitnesses):
-        ind.fitness.values = fit
+    if hasattr(toolbox, "repair"):
+        toolbox.repair(invalid_ind)
+    evaluateInvalid(invalid_ind, toolbox)
 
     if halloffame is None:
         raise ValueError("halloffame parameter must not be empty!")
@@ -24,13 +118,21 @@ def eaSimpleWithElitism(population, toolbox, cxpb, mutpb, ngen, stats=None,
     halloffame.update(population)
     hof_size = len(halloffame.items) if halloffame.items else 0
 
-    record = stats.compile(population) if stats else {}
+    record = compileRecord(population, halloffame, 0, stats, hooks)
+    cxpb, mutpb = record.get("cxpb", cxpb), record.get("mutpb", mutpb)
+    reason = stopping.check(population, halloffame) if stopping else None
+    if reason is None and ngen == 0:
+        reason = "max_generations"
+    if reason:
+        record["stop"] = reason
     logbook.record(gen=0, nevals=len(invalid_ind), **record)
     if verbose:
         print(logbook.stream)
 
     # Begin the generational process
     for gen in range(1, ngen + 1):
+        if reason:
+            break
 
         # Select the next generation individuals
         offspring = toolbox.select(population, len(population) - hof_size)
@@ -40,9 +142,9 @@ def eaSimpleWithElitism(population, toolbox, cxpb, mutpb, ngen, stats=None,
 
         # Evaluate the individuals with an invalid fitness
         invalid_ind = [ind for ind in offspring if not ind.fitness.valid]
-        fitnesses = toolbox.map(toolbox.evaluate, invalid_ind)
-        for ind, fit in zip(invalid_ind, fitnesses):
-            ind.fitness.values = fit
+        if hasattr(toolbox, "repair"):
+            toolbox.repair(invalid_ind)
+        evaluateInvalid(invalid_ind, toolbox)
 
         # add the best back to population:
         offspring.extend(halloffame.items)
@@ -54,7 +156,13 @@ def eaSimpleWithElitism(population, toolbox, cxpb, mutpb, ngen, stats=None,
         population[:] = offspring
 
         # Append the current generation statistics to the logbook
-        record = stats.compile(population) if stats else {}
+        record = compileRecord(population, halloffame, gen, stats, hooks)
+        cxpb, mutpb = record.get("cxpb", cxpb), record.get("mutpb", mutpb)
+        reason = stopping.check(population, halloffame) if stopping else None
+        if reason is None and gen == ngen:
+            reason = "max_generations"
+        if reason:
+            record["stop"] = reason
         logbook.record(gen=gen, nevals=len(invalid_ind), **record)
         if verbose:
             print(logbook.stream)
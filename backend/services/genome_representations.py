@@ -0,0 +1,416 @@
+import random
+
+import numpy as np
+from deap import creator, tools
+
+from services.incremental_evaluator import flipPositions, mutFlipBitDelta
+
+
+class BinaryRepresentation:
+    """
+    Flat genome with one 0/1 gene per (doctor, day) cell, laid out doctor by doctor.
+    """
+    name = "binary"
+
+    def __init__(self, problem):
+        """
+        Initializes the representation for the given scheduling problem.
+
+        Parameters:
+        - problem (DoctorSchedulingProblem): The scheduling problem instance.
+        """
+        self.problem = problem
+        self.weekIds = weekIds(problem)
+
+    def register(self, toolbox, indpb):
+        """
+        Registers the individual creator and the variation operators in the toolbox.
+
+        Parameters:
+        - toolbox (deap.base.Toolbox): Toolbox to configure.
+        - indpb (float): Independent probability of each gene being mutated.
+        """
+        creator.create("Individual", list, fitness=creator.FitnessMin)
+        toolbox.register("zeroOrOne", random.randint, 0, 1)
+        toolbox.register(
+            "individualCreator", tools.initRepeat, creator.Individual, toolbox.zeroOrOne, len(self.problem)
+        )
+        toolbox.register("mate", tools.cxTwoPoint)
+        toolbox.register("mutate", mutFlipBitDelta, indpb=indpb, problem=self.problem)
+
+    def defaultIndpb(self):
+        """
+        Returns the per-gene mutation probability that changes one gene per mutation on
+        average, i.e. one over the genome length.
+        """
+        return 1.0 / len(self.problem)
+
+    def matrixCrossover(self, kind):
+        """
+        Returns a mate operator exchanging the cells of a random (doctors, days) mask.
+
+        Parameters:
+        - kind (str): "rows" (whole doctors), "columns" (whole days) or "weeks" (a block of
+          consecutive doctors over consecutive weeks).
+        """
+        num_doctors = len(self.problem.doctors)
+
+        def mate(ind1, ind2):
+            return cxMasked(ind1, ind2, crossoverMask(kind, num_doctors, self.weekIds).ravel())
+        return mate
+
+    def toMatrix(self, individuals):
+        """
+        Returns the individuals as a (population, doctors, days) uint8 array.
+        """
+        return self.problem.toMatrix(individuals)
+
+    def fromMatrix(self, matrix):
+        """
+        Builds individuals from a (population, doctors, days) array.
+        """
+        return [creator.Individual(row) for row in np.asarray(matrix).reshape(len(matrix), len(self.problem)).tolist()]
+
+    def evaluate(self, individuals):
+        """
+        Returns the cost of every individual as an int array.
+        """
+        return self.problem.getPopulationCosts(self.toMatrix(individuals))
+
+    def decode(self, individual):
+        """
+        Returns the individual as a flat binary schedule.
+        """
+        return list(individual)
+
+
+class BitPackedRepresentation(BinaryRepresentation):
+    """
+    Genome with one integer bitmask per doctor, where bit d is set when the doctor works day d.
+
+    Constraint counts are computed with popcounts on the packed masks, and an individual
+    stores one integer per doctor instead of one per cell.
+    """
+    name = "bitpacked"
+
+    def __init__(self, problem):
+        super().__init__(problem)
+        if problem.num_days > 64:
+            raise ValueError("Bit-packed genomes support at most 64 days per schedule.")
+        self.days = np.arange(problem.num_days, dtype=np.uint64)
+        self.unavailableMasks = np.array(
+            [self.pack(row) for row in problem.unavailableArray.astype(np.uint8).tolist()], dtype=np.uint64
+        )
+
+    @staticmethod
+    def pack(row):
+        """
+        Packs a list of 0/1 values into an integer bitmask (bit d = row[d]).
+        """
+        mask = 0
+        for day, value in enumerate(row):
+            if value:
+                mask |= 1 << day
+        return mask
+
+    def register(self, toolbox, indpb):
+        creator.create("PackedIndividual", list, fitness=creator.FitnessMin)
+        num_days = self.problem.num_days
+        toolbox.register("doctorMask", random.getrandbits, num_days)
+        toolbox.register(
+            "individualCreator", tools.initRepeat, creator.PackedIndividual, toolbox.doctorMask,
+            len(self.problem.doctors)
+        )
+        toolbox.register("mate", cxTwoPointPacked, num_days=num_days)
+        toolbox.register("mutate", mutFlipBitPacked, indpb=indpb, num_days=num_days)
+
+    def matrixCrossover(self, kind):
+        num_doctors = len(self.problem.doctors)
+        weights = np.left_shift(np.uint64(1), self.days)
+
+        def mate(ind1, ind2):
+            mask = crossoverMask(kind, num_doctors, self.weekIds)
+            return cxMaskedPacked(ind1, ind2, (mask * weights).sum(axis=1, dtype=np.uint64).tolist())
+        return mate
+
+    def toMatrix(self, individuals):
+        packed = np.array(individuals, dtype='<u8').reshape(-1, len(self.problem.doctors))
+        bits = np.unpackbits(packed.view(np.uint8).reshape(*packed.shape, 8), axis=-1, bitorder='little')
+        return bits[..., :self.problem.num_days]
+
+    def fromMatrix(self, matrix):
+        weights = np.left_shift(np.uint64(1), self.days)
+        packed = (np.asarray(matrix, dtype=np.uint64) * weights).sum(axis=2, dtype=np.uint64)
+        return [creator.PackedIndividual(row) for row in packed.tolist()]
+
+    def evaluate(self, individuals):
+        problem = self.problem
+        packed = np.array(individuals, dtype=np.uint64).reshape(-1, len(problem.doctors))
+
+        preference = np.bitwise_count(packed & self.unavailableMasks).sum(axis=1, dtype=np.int64)
+        consecutive = np.bitwise_count(packed & (packed >> np.uint64(1))).sum(axis=1, dtype=np.int64)
+
+        totals = np.bitwise_count(packed).astype(np.int64)
+        per_month = (
+            np.maximum(totals - problem.doctorMaxShiftPerMonth, 0) +
+            np.maximum(problem.doctorMinShiftPerMonth - totals, 0)
+        ).sum(axis=1)
+
+        coverage = self.toMatrix(packed).sum(axis=1, dtype=np.int64)
+        per_day = (
+            np.maximum(coverage - problem.shiftMaxArray, 0) +
+            np.maximum(problem.shiftMinArray - coverage, 0)
+        ).sum(axis=1)
+
+        return problem.hardConstraintPenalty * (preference + per_day + per_month + consecutive)
+
+    def decode(self, individual):
+        return [(mask >> day) & 1 for mask in individual for day in range(self.problem.num_days)]
+
+
+class ReducedRepresentation(BinaryRepresentation):
+    """
+    Flat genome with one 0/1 gene per available (doctor, day) cell only. Cells on requested
+    days off have no gene, so preference violations cannot occur and the search space shrinks
+    with every day off.
+    """
+    name = "reduced"
+
+    def __init__(self, problem):
+        super().__init__(problem)
+        # Index of each gene in the full doctor-major schedule
+        self.cells = np.flatnonzero(~problem.unavailableArray.ravel())
+
+    def register(self, toolbox, indpb):
+        creator.create("Individual", list, fitness=creator.FitnessMin)
+        toolbox.register("zeroOrOne", random.randint, 0, 1)
+        toolbox.register(
+            "individualCreator", tools.initRepeat, creator.Individual, toolbox.zeroOrOne, len(self.cells)
+        )
+        toolbox.register("mate", tools.cxTwoPoint)
+        toolbox.register("mutate", tools.mutFlipBit, indpb=indpb)
+
+    def defaultIndpb(self):
+        return 1.0 / len(self.cells)
+
+    def matrixCrossover(self, kind):
+        num_doctors = len(self.problem.doctors)
+
+        def mate(ind1, ind2):
+            return cxMasked(ind1, ind2, crossoverMask(kind, num_doctors, self.weekIds).ravel()[self.cells])
+        return mate
+
+    def toMatrix(self, individuals):
+        genomes = np.asarray(individuals, dtype=np.uint8).reshape(-1, len(self.cells))
+        schedules = np.zeros((len(genomes), len(self.problem)), dtype=np.uint8)
+        schedules[:, self.cells] = genomes
+        return schedules.reshape(len(genomes), len(self.problem.doctors), self.problem.num_days)
+
+    def fromMatrix(self, matrix):
+        genomes = np.asarray(matrix).reshape(len(matrix), len(self.problem))[:, self.cells]
+        return [creator.Individual(row) for row in genomes.tolist()]
+
+    def decode(self, individual):
+        return self.toMatrix([individual])[0].ravel().tolist()
+
+
+class DaySetRepresentation(BinaryRepresentation):
+    """
+    Genome with one gene per day holding the sorted tuple of doctor indices on duty, with
+    between minShifts and maxShifts doctors. Operators keep every day within those bounds,
+    so daily coverage violations only come from schedules converted with fromMatrix.
+    """
+    name = "dayset"
+
+    def __init__(self, problem):
+        super().__init__(problem)
+        num_doctors = len(problem.doctors)
+        self.minSizes = np.minimum(problem.shiftMinArray, num_doctors).tolist()
+        self.maxSizes = np.minimum(problem.shiftMaxArray, num_doctors).tolist()
+
+    def register(self, toolbox, indpb):
+        creator.create("DayIndividual", list, fitness=creator.FitnessMin)
+        toolbox.register("individualCreator", self.randomIndividual)
+        toolbox.register("mate", tools.cxTwoPoint)
+        toolbox.register(
+            "mutate", mutReplaceDoctor, indpb=indpb, num_doctors=len(self.problem.doctors),
+            min_sizes=self.minSizes, max_sizes=self.maxSizes
+        )
+
+    def defaultIndpb(self):
+        # mutReplaceDoctor rolls once per day, not once per cell
+        return 1.0 / self.problem.num_days
+
+    def matrixCrossover(self, kind):
+        """
+        Day-set genomes can only exchange whole days: "columns" exchanges random days and
+        "weeks" a run of consecutive weeks for all doctors.
+        """
+        if kind not in ("columns", "weeks"):
+            raise ValueError(f"Crossover '{kind}' is not supported by the day-set representation.")
+        num_doctors = len(self.problem.doctors)
+
+        def mate(ind1, ind2):
+            for day in np.flatnonzero(crossoverMask(kind, num_doctors, self.weekIds).any(axis=0)).tolist():
+                ind1[day], ind2[day] = ind2[day], ind1[day]
+            return ind1, ind2
+        return mate
+
+    def randomIndividual(self):
+        """
+        Returns an individual with a random doctor set of allowed size on every day.
+        """
+        doctors = range(len(self.problem.doctors))
+        return creator.DayIndividual(
+            tuple(sorted(random.sample(doctors, random.randint(low, high))))
+            for low, high in zip(self.minSizes, self.maxSizes)
+        )
+
+    def toMatrix(self, individuals):
+        num_doctors, num_days = len(self.problem.doctors), self.problem.num_days
+        matrix = np.zeros((len(individuals), num_doctors, num_days), dtype=np.uint8)
+        sizes = [len(doctors) for individual in individuals for doctors in individual]
+        if sum(sizes):
+            cells = np.arange(len(individuals) * num_days).repeat(sizes)
+            doctors = [doctor for individual in individuals for day in individual for doctor in day]
+            matrix[cells // num_days, doctors, cells % num_days] = 1
+        return matrix
+
+    def fromMatrix(self, matrix):
+        matrix = np.asarray(matrix)
+        return [
+            creator.DayIndividual(tuple(np.flatnonzero(column).tolist()) for column in schedule.T)
+            for schedule in matrix
+        ]
+
+    def decode(self, individual):
+        return self.toMatrix([individual])[0].ravel().tolist()
+
+
+def mutReplaceDoctor(individual, indpb, num_doctors, min_sizes, max_sizes):
+    """Changes each day of a day-set individual with probability *indpb*: usually one
+    doctor on duty is replaced by one who is not, and otherwise a doctor is added or
+    removed when the day's size bounds allow it.
+    """
+    for day, doctors in enumerate(individual):
+        if random.random() >= indpb:
+            continue
+        on_duty = list(doctors)
+        off_duty = [doctor for doctor in range(num_doctors) if doctor not in doctors]
+        kind = random.random()
+        if kind < 0.2 and len(on_duty) < max_sizes[day] and off_duty:
+            on_duty.append(random.choice(off_duty))
+        elif kind < 0.4 and len(on_duty) > min_sizes[day]:
+            on_duty.remove(random.choice(on_duty))
+        elif on_duty and off_duty:
+            on_duty[random.randrange(len(on_duty))] = random.choice(off_duty)
+        individual[day] = tuple(sorted(on_duty))
+    return individual,
+
+
+def weekIds(problem):
+    """
+    Returns the week number of every day. A week starts on the first day and on every
+    weekday that follows a weekend day.
+    """
+    weekend = np.asarray(problem.weekendPositionArray[:problem.num_days], dtype=bool)
+    starts = np.zeros(problem.num_days, dtype=np.int64)
+    starts[1:] = weekend[:-1] & ~weekend[1:]
+    return np.cumsum(starts)
+
+
+def randomBits(count):
+    """
+    Returns *count* random booleans from one random.getrandbits call; bit i of the drawn
+    integer is element i, for any count.
+    """
+    packed = random.getrandbits(count).to_bytes(-(-count // 8), "little")
+    return np.unpackbits(np.frombuffer(packed, dtype=np.uint8), count=count, bitorder="little").astype(bool)
+
+
+def crossoverMask(kind, num_doctors, week_ids):
+    """
+    Draws a random (doctors, days) boolean mask of the cells a matrix crossover exchanges.
+
+    Parameters:
+    - kind (str): "rows" picks each doctor with probability 0.5, "columns" each day, and
+      "weeks" a random range of doctors over a random range of whole weeks.
+    - num_doctors (int): Number of doctors.
+    - week_ids (np.ndarray): Week number of every day, see weekIds.
+
+    Returns:
+    - np.ndarray: Boolean mask of shape (doctors, days).
+    """
+    num_days = len(week_ids)
+    if kind == "rows":
+        return np.repeat(randomBits(num_doctors)[:, np.newaxis], num_days, axis=1)
+    if kind == "columns":
+        return np.repeat(randomBits(num_days)[np.newaxis, :], num_doctors, axis=0)
+    if kind == "weeks":
+        first, last = sorted(random.sample(range(num_doctors + 1), 2))
+        start, stop = sorted(random.sample(range(int(week_ids[-1]) + 2), 2))
+        mask = np.zeros((num_doctors, num_days), dtype=bool)
+        mask[first:last] = (week_ids >= start) & (week_ids < stop)
+        return mask
+    raise ValueError(f"Unknown matrix crossover '{kind}'.")
+
+
+def cxMasked(ind1, ind2, mask):
+    """Exchanges the genes of two flat binary individuals where *mask* is set."""
+    first, second = np.asarray(ind1), np.asarray(ind2)
+    ind1[:] = np.where(mask, second, first).tolist()
+    ind2[:] = np.where(mask, first, second).tolist()
+    return ind1, ind2
+
+
+def cxMaskedPacked(ind1, ind2, masks):
+    """Exchanges the bits of two bit-packed individuals set in the per-doctor *masks*."""
+    for doctor, mask in enumerate(masks):
+        diff = (ind1[doctor] ^ ind2[doctor]) & mask
+        ind1[doctor] ^= diff
+        ind2[doctor] ^= diff
+    return ind1, ind2
+
+
+def cxTwoPointPacked(ind1, ind2, num_days):
+    """Two-point crossover on bit-packed individuals. The cut points are drawn over the
+    flattened (doctor, day) cells, so the result matches tools.cxTwoPoint applied to the
+    equivalent flat genomes.
+    """
+    size = len(ind1) * num_days
+    cxpoint1 = random.randint(1, size)
+    cxpoint2 = random.randint(1, size - 1)
+    if cxpoint2 >= cxpoint1:
+        cxpoint2 += 1
+    else:
+        cxpoint1, cxpoint2 = cxpoint2, cxpoint1
+
+    first_doctor = cxpoint1 // num_days
+    last_doctor = min((cxpoint2 - 1) // num_days, len(ind1) - 1)
+    for doctor in range(first_doctor, last_doctor + 1):
+        low = max(cxpoint1 - doctor * num_days, 0)
+        high = min(cxpoint2 - doctor * num_days, num_days)
+        mask = ((1 << high) - 1) ^ ((1 << low) - 1)
+        a, b = ind1[doctor], ind2[doctor]
+        ind1[doctor] = (a & ~mask) | (b & mask)
+        ind2[doctor] = (b & ~mask) | (a & mask)
+    return ind1, ind2
+
+
+def mutFlipBitPacked(individual, indpb, num_days):
+    """Flips each bit of a bit-packed individual with probability *indpb*. Flip positions
+    are drawn with geometric skips, so the cost grows with the number of flips rather
+    than with the number of cells.
+    """
+    for position in flipPositions(len(individual) * num_days, indpb):
+        doctor, day = divmod(position, num_days)
+        individual[doctor] ^= 1 << day
+    return individual,
+
+
+REPRESENTATIONS = {
+    BinaryRepresentation.name: BinaryRepresentation,
+    BitPackedRepresentation.name: BitPackedRepresentation,
+    ReducedRepresentation.name: ReducedRepresentation,
+    DaySetRepresentation.name: DaySetRepresentation,
+}
@@ -0,0 +1,149 @@
+import math
+import random
+
+import numpy as np
+
+
+class IncrementalEvaluator:
+    """
+    Keeps the running constraint counters of one schedule of a DoctorSchedulingProblem,
+    so that the cost change of flipping or swapping cells can be computed in O(1).
+    """
+
+    def __init__(self, problem, schedule):
+        """
+        Initializes the evaluator from a complete schedule.
+
+        Parameters:
+        - problem (DoctorSchedulingProblem): The scheduling problem instance.
+        - schedule (list or np.ndarray): Flat binary schedule or a (doctors, days) matrix.
+        """
+        self.problem = problem
+        self.matrix = problem.toMatrix(schedule)[0].copy()
+        self.doctorTotals = self.matrix.sum(axis=1, dtype=np.int64).tolist()
+        self.dayCoverage = self.matrix.sum(axis=0, dtype=np.int64).tolist()
+        self.adjacency = int((self.matrix[:, 1:] & self.matrix[:, :-1]).sum())
+        self.violations = problem.getPopulationViolations(self.matrix[np.newaxis])[0].tolist()
+
+    @property
+    def cost(self):
+        """
+        Returns the cost of the current schedule.
+        """
+        return self.problem.hardConstraintPenalty * sum(self.violations)
+
+    def schedule(self):
+        """
+        Returns the current schedule as a flat binary list.
+        """
+        return self.matrix.ravel().tolist()
+
+    def _monthPenalty(self, total):
+        return (max(total - self.problem.doctorMaxShiftPerMonth, 0) +
+                max(self.problem.doctorMinShiftPerMonth - total, 0))
+
+    def _dayPenalty(self, day, coverage):
+        return (max(coverage - int(self.problem.shiftMaxArray[day]), 0) +
+                max(int(self.problem.shiftMinArray[day]) - coverage, 0))
+
+    def flipViolationDelta(self, doctor, day):
+        """
+        Computes the change of each violation count if cell (doctor, day) is flipped.
+
+        Returns:
+        - list: Deltas of the preference, per day, per month and consecutive violations.
+        """
+        step = 1 - 2 * int(self.matrix[doctor, day])
+        total = self.doctorTotals[doctor]
+        coverage = self.dayCoverage[day]
+        neighbours = 0
+        if day > 0:
+            neighbours += int(self.matrix[doctor, day - 1])
+        if day < self.problem.num_days - 1:
+            neighbours += int(self.matrix[doctor, day + 1])
+        return [
+            step * int(self.problem.unavailableArray[doctor, day]),
+            self._dayPenalty(day, coverage + step) - self._dayPenalty(day, coverage),
+            self._monthPenalty(total + step) - self._monthPenalty(total),
+            step * neighbours,
+        ]
+
+    def flipDelta(self, doctor, day):
+        """
+        Computes the cost change of flipping cell (doctor, day) without applying it.
+        """
+        return self.problem.hardConstraintPenalty * sum(self.flipViolationDelta(doctor, day))
+
+    def flip(self, doctor, day):
+        """
+        Flips cell (doctor, day), updates the counters and returns the cost change.
+        """
+        delta = self.flipViolationDelta(doctor, day)
+        step = 1 - 2 * int(self.matrix[doctor, day])
+        self.matrix[doctor, day] ^= 1
+        self.doctorTotals[doctor] += step
+        self.dayCoverage[day] += step
+        self.adjacency += delta[3]
+        self.violations = [count + change for count, change in zip(self.violations, delta)]
+        return self.problem.hardConstraintPenalty * sum(delta)
+
+    def swapDelta(self, first, second):
+        """
+        Computes the cost change of swapping the values of two cells without applying it.
+
+        Parameters:
+        - first (tuple): (doctor, day) of the first cell.
+        - second (tuple): (doctor, day) of the second cell.
+        """
+        if self.matrix[first] == self.matrix[second]:
+            return 0
+        delta = self.flip(*first)
+        delta += self.flipDelta(*second)
+        self.flip(*first)
+        return delta
+
+    def swap(self, first, second):
+        """
+        Swaps the values of two cells and returns the cost change.
+        """
+        if self.matrix[first] == self.matrix[second]:
+            return 0
+        return self.flip(*first) + self.flip(*second)
+
+
+def flipPositions(size, indpb):
+    """
+    Yields the positions, in increasing order, of a genome of *size* genes that are
+    flipped when each one flips with probability *indpb*. Positions are drawn with
+    geometric skips, so the cost grows with the number of flips rather than with *size*.
+    """
+    if indpb <= 0:
+        return
+    if indpb >= 1:
+        yield from range(size)
+        return
+    log_q = math.log(1.0 - indpb)
+    position = int(math.log(1.0 - random.random()) / log_q)
+    while position < size:
+        yield position
+        position += 1 + int(math.log(1.0 - random.random()) / log_q)
+
+
+def mutFlipBitDelta(individual, indpb, problem):
+    """Flips each bit of the individual with probability *indpb*, like DEAP's mutFlipBit.
+    When the individual still carries a valid fitness, the cost change of every flip is
+    computed in O(1) by an IncrementalEvaluator of the individual and stored as
+    ``fitnessHint``, which the evaluation step uses instead of re-scoring the individual
+    from scratch.
+    """
+    positions = list(flipPositions(len(individual), indpb))
+    if individual.fitness.valid:
+        cost = individual.fitness.values[0]
+        if positions:
+            evaluator = IncrementalEvaluator(problem, individual)
+            for position in positions:
+                cost += evaluator.flip(*divmod(position, problem.num_days))
+        individual.fitnessHint = (cost,)
+    for position in positions:
+        individual[position] = type(individual[position])(not individual[position])
+    return individual,
@@ -0,0 +1,169 @@
+import logging
+import multiprocessing
+import random
+
+from deap import tools
+
+from services.elite_archive import EliteArchive
+from services.genetic_algorithm import EarlyStopping
+
+
+def _run_island(connection, problem, config, island):
+    """
+    Worker process of one island. Keeps its own population and hall of fame, and on every
+    "evolve" command takes in the immigrants, evolves for the requested number of
+    generations and sends back its best individuals with the logbook of the epoch. On
+    "stop" it sends its whole hall of fame.
+    """
+    # Imported here because solution_service imports this module
+    from services.solution_service import SolutionService
+
+    service = SolutionService(problem, config=config)
+    population = service.create_population()
+    hof = EliteArchive(config["hall_of_fame_size"])
+    individual_class = type(population[0])
+
+    while True:
+        command, payload = connection.recv()
+        if command == "stop":
+            connection.send([(list(ind), ind.fitness.values[0]) for ind in hof.items])
+            break
+
+        immigrants, ngen = payload
+        if immigrants:
+            population.sort(key=lambda ind: ind.fitness.values[0] if ind.fitness.valid else float("inf"))
+            for position, (genome, cost) in enumerate(immigrants, start=len(population) - len(immigrants)):
+                individual = individual_class(genome)
+                individual.fitness.values = (cost,)
+                population[position] = individual
+
+        population, logbook = service.evolve(population, hof, ngen)
+        emigrants = [(list(ind), ind.fitness.values[0]) for ind in hof.items[:config["migration_size"]]]
+        connection.send((emigrants, list(logbook)))
+
+
+class IslandModel:
+    """
+    Runs the genetic algorithm as K islands in separate processes that exchange their best
+    individuals every few generations over a ring or random topology.
+
+    The stopping rules are applied by the master to the global best and the population of
+    all islands, generation by generation, and take effect at the end of the epoch in
+    which one of them fires.
+    """
+
+    def __init__(self, problem, config):
+        """
+        Initializes the island model.
+
+        Parameters:
+        - problem (DoctorSchedulingProblem): The scheduling problem instance.
+        - config (dict): SolutionService configuration; the population and hall of fame
+          sizes are split evenly across the islands.
+        """
+        self.problem = problem
+        self.config = config
+        self.islands = config["islands"]
+        self.rng = random.Random(config["random_seed"])
+        self.elites = []
+
+    def _island_config(self, island):
+        """
+        Returns the configuration of a single island. Islands run their epochs in full; the
+        stopping rules are left to the master.
+        """
+        return {
+            **self.config,
+            "islands": 1,
+            "target_cost": None,
+            "stall_generations": None,
+            "min_fitness_gap": None,
+            "workers": None,
+            "verbose": False,
+            "random_seed": self.config["random_seed"] + island,
+            "population_size": max(self.config["population_size"] // self.islands, 2 * self.config["migration_size"]),
+            "hall_of_fame_size": max(self.config["hall_of_fame_size"] // self.islands, self.config["migration_size"]),
+        }
+
+    def _sources(self):
+        """
+        Returns, for every island, the island it receives migrants from.
+        """
+        if self.config["migration_topology"] == "ring":
+            return [(island - 1) % self.islands for island in range(self.islands)]
+        if self.config["migration_topology"] == "random":
+            sources = list(range(self.islands))
+            while any(source == island for island, source in enumerate(sources)):
+                self.rng.shuffle(sources)
+            return sources
+        raise ValueError(f"Unknown migration topology '{self.config['migration_topology']}'.")
+
+    def run(self):
+        """
+        Evolves all islands and returns the global best. The final halls of fame of all
+        islands are kept in self.elites as (genome, fitness) pairs, best first.
+
+        Returns:
+        - tuple: The best genome, its cost and a logbook with one record per island and epoch.
+        """
+        connections, processes = [], []
+        for island in range(self.islands):
+            parent_end, child_end = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_run_island, args=(child_end, self.problem, self._island_config(island), island)
+            )
+            process.start()
+            connections.append(parent_end)
+            processes.append(process)
+
+        logbook = tools.Logbook()
+        logbook.header = ['gen', 'island', 'nevals', 'min', 'avg', 'stop']
+        stopping = EarlyStopping(
+            target_cost=self.config["target_cost"],
+            stall_generations=self.config["stall_generations"],
+            min_gap=self.config["min_fitness_gap"]
+        )
+        try:
+            emigrants = [[] for _ in range(self.islands)]
+            generation = 0
+            reason = None
+            while reason is None:
+                ngen = min(self.config["migration_interval"], self.config["max_generations"] - generation)
+                sources = self._sources()
+                for island, connection in enumerate(connections):
+                    connection.send(("evolve", (emigrants[sources[island]], ngen)))
+
+                histories = []
+                for island, connection in enumerate(connections):
+                    emigrants[island], history = connection.recv()
+                    # Record 0 of a later epoch re-scores the previous epoch's last generation
+                    histories.append(history if generation == 0 else history[1:])
+                for records in zip(*histories):
+                    if reason is None:
+                        # Islands have equal sizes, so the mean of their averages is the global average
+                        best = min(record["min"] for record in records)
+                        average = sum(record["avg"] for record in records) / len(records)
+                        reason = stopping.checkGap(best, average - best)
+                generation += ngen
+                if reason is None and generation >= self.config["max_generations"]:
+                    reason = "max_generations"
+
+                for island, history in enumerate(histories):
+                    record = history[-1]
+                    logbook.record(gen=generation, island=island, nevals=record["nevals"],
+                                   min=record["min"], avg=record["avg"], **({"stop": reason} if reason else {}))
+
+            elites = []
+            for connection in connections:
+                connection.send(("stop", None))
+                elites.extend(connection.recv())
+        finally:
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+
+        self.elites = sorted(elites, key=lambda elite: elite[1])
+        best_genome, best_cost = self.elites[0]
+        logging.info("Island model finished after %d generations, best cost %s", generation, best_cost)
+        return best_genome, best_cost, logbook
@@ -0,0 +1,260 @@
+import math
+import time
+
+import numpy as np
+from deap import tools
+
+from services.incremental_evaluator import IncrementalEvaluator
+
+
+def randomMove(problem, rng):
+    """
+    Draws a random move on a schedule of the problem.
+
+    Half of the moves hand a shift to another doctor on the same day, a quarter move a
+    doctor's shift to another day, and the rest flip a single cell.
+
+    Returns:
+    - tuple: ("flip", (doctor, day)) or ("swap", ((doctor, day), (doctor, day))).
+    """
+    num_doctors, num_days = len(problem.doctors), problem.num_days
+    doctor, day = int(rng.integers(num_doctors)), int(rng.integers(num_days))
+    kind = rng.random()
+    if kind < 0.5:
+        return "swap", ((doctor, day), (int(rng.integers(num_doctors)), day))
+    if kind < 0.75:
+        return "swap", ((doctor, day), (doctor, int(rng.integers(num_days))))
+    return "flip", (doctor, day)
+
+
+def moveDelta(evaluator, move):
+    """
+    Returns the cost change of a move without applying it.
+    """
+    kind, cells = move
+    if kind == "flip":
+        return evaluator.flipDelta(*cells)
+    return evaluator.swapDelta(*cells)
+
+
+def applyMove(evaluator, move):
+    """
+    Applies a move and returns its cost change.
+    """
+    kind, cells = move
+    if kind == "flip":
+        return evaluator.flip(*cells)
+    return evaluator.swap(*cells)
+
+
+def moveCells(move):
+    """
+    Returns the cells touched by a move.
+    """
+    kind, cells = move
+    return (cells,) if kind == "flip" else cells
+
+
+class _ProgressReporter:
+    """
+    Passes the best schedule of a local search to its progress callback, once when the
+    search starts and afterwards only when the cost improved since the last call.
+    """
+
+    def __init__(self, progress, schedule, cost):
+        self.progress = progress
+        self.cost = cost
+        if progress is not None:
+            progress(schedule, cost)
+
+    def report(self, schedule, cost):
+        if self.progress is not None and cost < self.cost:
+            self.cost = cost
+            self.progress(schedule, cost)
+
+
+def simulatedAnnealing(problem, schedule, rng, max_moves=200000, time_limit=None,
+                       initial_temperature=2.0, final_temperature=0.05, log_interval=10000,
+                       check_interval=1000, progress=None):
+    """
+    Single-trajectory simulated annealing over flip and swap moves with delta evaluation.
+
+    Temperatures are given in units of the hard constraint penalty and cool geometrically
+    from *initial_temperature* to *final_temperature* over *max_moves*.
+
+    Parameters:
+    - problem (DoctorSchedulingProblem): The scheduling problem instance.
+    - schedule (list): Flat binary schedule to start from.
+    - rng (np.random.Generator): Random number generator.
+    - max_moves (int): Maximum number of moves tried.
+    - time_limit (float): Optional wall-clock limit in seconds.
+    - check_interval (int): Moves between two checks of the time limit.
+    - progress (callable): Optional progress(schedule, cost), called with the starting
+      schedule and then, at every time check, with the best schedule when it improved.
+
+    Returns:
+    - tuple: The best flat schedule, its cost and a logbook.
+    """
+    evaluator = IncrementalEvaluator(problem, schedule)
+    penalty = problem.hardConstraintPenalty
+    temperature = initial_temperature * penalty
+    cooling = (final_temperature / initial_temperature) ** (1.0 / max(max_moves, 1))
+    best_cost, best_schedule = evaluator.cost, evaluator.schedule()
+    logbook = tools.Logbook()
+    logbook.header = ['moves', 'cost', 'best', 'temperature']
+    deadline = time.perf_counter() + time_limit if time_limit else None
+    reporter = _ProgressReporter(progress, best_schedule, best_cost)
+
+    moves = 0
+    for moves in range(1, max_moves + 1):
+        move = randomMove(problem, rng)
+        delta = moveDelta(evaluator, move)
+        if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+            applyMove(evaluator, move)
+            if evaluator.cost < best_cost:
+                best_cost, best_schedule = evaluator.cost, evaluator.schedule()
+        temperature *= cooling
+
+        if moves % log_interval == 0:
+            logbook.record(moves=moves, cost=evaluator.cost, best=best_cost, temperature=temperature / penalty)
+        if moves % check_interval == 0:
+            reporter.report(best_schedule, best_cost)
+            if deadline and time.perf_counter() > deadline:
+                break
+        if best_cost == 0:
+            break
+
+    logbook.record(moves=moves, cost=evaluator.cost, best=best_cost, temperature=temperature / penalty)
+    return best_schedule, best_cost, logbook
+
+
+def tabuSearch(problem, schedule, rng, max_iterations=5000, tenure=10, sample_size=40,
+               time_limit=None, log_interval=500, check_interval=25, progress=None):
+    """
+    Tabu search over sampled flip and swap neighbourhoods with delta evaluation.
+
+    Each iteration scores *sample_size* random moves and applies the best one whose cells
+    are not tabu, unless a tabu move would improve on the best schedule found so far.
+    Touched cells stay tabu for *tenure* iterations.
+
+    Parameters:
+    - problem (DoctorSchedulingProblem): The scheduling problem instance.
+    - schedule (list): Flat binary schedule to start from.
+    - rng (np.random.Generator): Random number generator.
+    - max_iterations (int): Maximum number of iterations.
+    - time_limit (float): Optional wall-clock limit in seconds.
+    - check_interval (int): Iterations between two checks of the time limit.
+    - progress (callable): Optional progress(schedule, cost), as in simulatedAnnealing.
+
+    Returns:
+    - tuple: The best flat schedule, its cost and a logbook.
+    """
+    evaluator = IncrementalEvaluator(problem, schedule)
+    best_cost, best_schedule = evaluator.cost, evaluator.schedule()
+    tabu_until = {}
+    logbook = tools.Logbook()
+    logbook.header = ['moves', 'cost', 'best']
+    deadline = time.perf_counter() + time_limit if time_limit else None
+    reporter = _ProgressReporter(progress, best_schedule, best_cost)
+
+    iteration = 0
+    for iteration in range(1, max_iterations + 1):
+        chosen, chosen_delta = None, None
+        for _ in range(sample_size):
+            move = randomMove(problem, rng)
+            if move[0] == "swap" and evaluator.matrix[move[1][0]] == evaluator.matrix[move[1][1]]:
+                continue
+            delta = moveDelta(evaluator, move)
+            if chosen_delta is not None and delta >= chosen_delta:
+                continue
+            is_tabu = any(tabu_until.get(cell, 0) > iteration for cell in moveCells(move))
+            if is_tabu and evaluator.cost + delta >= best_cost:
+                continue
+            chosen, chosen_delta = move, delta
+
+        if chosen is not None:
+            applyMove(evaluator, chosen)
+            for cell in moveCells(chosen):
+                tabu_until[cell] = iteration + tenure
+            if evaluator.cost < best_cost:
+                best_cost, best_schedule = evaluator.cost, evaluator.schedule()
+
+        if iteration % log_interval == 0:
+            logbook.record(moves=iteration, cost=evaluator.cost, best=best_cost)
+        if iteration % check_interval == 0:
+            reporter.report(best_schedule, best_cost)
+            if deadline and time.perf_counter() > deadline:
+                break
+        if best_cost == 0:
+            break
+
+    logbook.record(moves=iteration, cost=evaluator.cost, best=best_cost)
+    return best_schedule, best_cost, logbook
+
+
+def neighbourhood(evaluator):
+    """
+    Lists every flip move and every swap move that hands a shift to another doctor on the
+    same day or moves a doctor's shift to another day of the same doctor.
+    """
+    matrix = evaluator.matrix
+    num_doctors, num_days = matrix.shape
+    moves = [("flip", (doctor, day)) for doctor in range(num_doctors) for day in range(num_days)]
+    worked = [tuple(cell) for cell in np.argwhere(matrix == 1).tolist()]
+    for doctor, day in worked:
+        moves.extend(("swap", ((doctor, day), (other, day)))
+                     for other in np.flatnonzero(matrix[:, day] == 0).tolist())
+        moves.extend(("swap", ((doctor, day), (doctor, other)))
+                     for other in np.flatnonzero(matrix[doctor] == 0).tolist())
+    return moves
+
+
+def hillClimb(problem, schedule, rng, strategy="first", max_moves=20000, time_limit_ms=None):
+    """
+    Hill climbing over the full flip and swap neighbourhood with delta evaluation, meant to
+    polish a schedule returned by another engine.
+
+    With the "first" strategy the neighbourhood is scanned in random order and the first
+    improving move is applied; with "steepest" the best move of the whole neighbourhood is
+    applied. The climb stops at a local optimum or when a budget runs out.
+
+    Parameters:
+    - problem (DoctorSchedulingProblem): The scheduling problem instance.
+    - schedule (list): Flat binary schedule to start from.
+    - rng (np.random.Generator): Random number generator.
+    - strategy (str): "first" (first improvement) or "steepest" (steepest descent).
+    - max_moves (int): Maximum number of moves evaluated.
+    - time_limit_ms (float): Optional wall-clock limit in milliseconds.
+
+    Returns:
+    - tuple: The polished flat schedule, its cost and a logbook.
+    """
+    if strategy not in ("first", "steepest"):
+        raise ValueError(f"Unknown hill climbing strategy '{strategy}'.")
+    evaluator = IncrementalEvaluator(problem, schedule)
+    logbook = tools.Logbook()
+    logbook.header = ['moves', 'cost']
+    deadline = time.perf_counter() + time_limit_ms / 1000.0 if time_limit_ms else None
+
+    moves = 0
+    improved = True
+    while improved and evaluator.cost > 0:
+        improved = False
+        candidates = neighbourhood(evaluator)
+        chosen, chosen_delta = None, 0
+        for index in rng.permutation(len(candidates)).tolist():
+            if moves >= max_moves or (deadline and time.perf_counter() > deadline):
+                break
+            moves += 1
+            delta = moveDelta(evaluator, candidates[index])
+            if delta < chosen_delta:
+                chosen, chosen_delta = candidates[index], delta
+                if strategy == "first":
+                    break
+        if chosen is not None:
+            applyMove(evaluator, chosen)
+            logbook.record(moves=moves, cost=evaluator.cost)
+            improved = True
+
+    logbook.record(moves=moves, cost=evaluator.cost)
+    return evaluator.schedule(), evaluator.cost, logbook
@@ -1,3 +1,6 @@
+import random
+
+
 def create_monthly_clinic_request(
     googleSheetId=None,
     month="NA",
@@ -59,3 +62,35 @@ def create_monthly_clinic_request(
         "minShifts": minShifts,
         "maxShifts": maxShifts
     }
+
+
+def create_synthetic_clinic_request(numDoctors, numDays, availability=0.85, seed=None):
+    """
+    Function to create a random MonthlyClinicRequest for benchmarks and tuning.
+
+    Parameters:
+    - numDoctors (int): Number of doctors.
+    - numDays (int): Number of days in the month.
+    - availability (float): Probability of each doctor being available on each day.
+    - seed (int): Seed of the random generator (default: None).
+
+    Returns:
+    - dict: A dictionary representing the MonthlyClinicRequest object.
+    """
+    rng = random.Random(seed)
+    dayNames = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+    orderOfDays = [dayNames[day % 7] for day in range(numDays)]
+    return create_monthly_clinic_request(
+        month="Synthetic",
+        orderOfDays=orderOfDays,
+        numberOfDays=list(range(1, numDays + 1)),
+        weekendPositions=[1 if name in ("Saturday", "Sunday") else 0 for name in orderOfDays],
+        doctorNames=[f"Doctor {index + 1}" for index in range(numDoctors)],
+        doctorPreference=[
+            [1 if rng.random() < availability else 0 for _ in range(numDays)]
+            for _ in range(numDoctors)
+        ],
+        totalShifts=[5] * numDays,
+        minShifts=[2] * numDays,
+        maxShifts=[4] * numDays
+    )
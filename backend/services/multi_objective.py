@@ -0,0 +1,127 @@
+import time
+
+import numpy as np
+from deap import base, creator, tools
+
+from services.array_population import cxTwoPointArray, mutFlipBitArray
+from services.population_seeding import seedPopulation
+from services.repair import repairSchedules
+
+# Objective names in the column order of getPopulationObjectives
+OBJECTIVES = ("hard", "weekend", "rest")
+
+
+def getPopulationObjectives(problem, population):
+    """
+    Returns the objectives of a whole population in one vectorized pass: the hard
+    constraint cost (as getCost), the weekend shifts beyond two per doctor and the
+    shifts with a single day off between them.
+
+    Parameters:
+    - problem (DoctorSchedulingProblem): The scheduling problem instance.
+    - population (list or np.ndarray): Schedules accepted by problem.toMatrix.
+
+    Returns:
+    - np.ndarray: int array of shape (population, 3).
+    """
+    matrix = problem.toMatrix(population)
+    return np.column_stack([problem.getPopulationCosts(matrix), problem.getPopulationSoftViolations(matrix)])
+
+
+def _distinctFirst(individuals, size):
+    """
+    Returns at least *size* individuals with duplicate genomes dropped, keeping just enough
+    duplicates to make up the number, so clones do not crowd the front.
+    """
+    seen, distinct, duplicates = set(), [], []
+    for individual in individuals:
+        key = tuple(individual)
+        (duplicates if key in seen else distinct).append(individual)
+        seen.add(key)
+    return distinct + duplicates[:max(size - len(distinct), 0)]
+
+
+def solveParetoFront(problem, rng, population_size=100, generations=60, cxpb=0.9, mutpb=0.3,
+                     random_fraction=0.1, repair=True, time_limit=None):
+    """
+    Runs NSGA-II on the hard cost, weekend and rest spacing objectives and returns the
+    non-dominated schedules of the final population.
+
+    The population starts from greedy seeds plus a share of random schedules. Offspring
+    are picked with DEAP's dominance/crowding tournament, varied with two-point crossover
+    and bit-flip mutation on the whole batch at once, optionally repaired towards
+    feasibility, scored with getPopulationObjectives and merged with their parents by
+    selNSGA2.
+
+    Parameters:
+    - problem (DoctorSchedulingProblem): The scheduling problem instance.
+    - rng (np.random.Generator): Random number generator for seeding and variation.
+    - population_size (int): Individuals per generation, rounded up to a multiple of 4.
+    - generations (int): Maximum number of generations.
+    - cxpb (float): Probability of crossing a pair of offspring.
+    - mutpb (float): Probability of mutating an offspring.
+    - random_fraction (float): Share of the initial population drawn uniformly at random.
+    - repair (bool): Whether offspring are repaired before they are scored.
+    - time_limit (float): Optional wall-clock limit in seconds.
+
+    Returns:
+    - tuple: One flat schedule per point of the front, sorted by objectives, their
+      objectives as an int array of shape (front, 3), and a logbook with the front size
+      and the best value of each objective per generation.
+    """
+    creator.create("FitnessPareto", base.Fitness, weights=(-1.0,) * len(OBJECTIVES))
+    creator.create("ParetoIndividual", list, fitness=creator.FitnessPareto)
+
+    size = -(-population_size // 4) * 4
+    shape = (len(problem.doctors), problem.num_days)
+    genes = len(problem)
+    indpb = 1.0 / genes
+    random_count = int(round(size * random_fraction))
+    matrix = np.concatenate([
+        seedPopulation(problem, size - random_count, rng),
+        rng.integers(0, 2, size=(random_count, *shape), dtype=np.uint8)
+    ])
+
+    def individuals(genomes):
+        batch = [creator.ParetoIndividual(row) for row in genomes.reshape(len(genomes), genes).tolist()]
+        for individual, values in zip(batch, getPopulationObjectives(problem, genomes).tolist()):
+            individual.fitness.values = tuple(values)
+        return batch
+
+    logbook = tools.Logbook()
+    logbook.header = ['gen', 'nevals', 'front', *OBJECTIVES, 'seconds']
+    start = time.perf_counter()
+
+    def record(gen, population, nevals):
+        front = tools.sortNondominated(population, len(population), first_front_only=True)[0]
+        values = np.array([individual.fitness.values for individual in population])
+        logbook.record(gen=gen, nevals=nevals, front=len(front), seconds=round(time.perf_counter() - start, 3),
+                       **{name: int(best) for name, best in zip(OBJECTIVES, values.min(axis=0))})
+
+    # selNSGA2 assigns the crowding distances used by the tournament
+    population = tools.selNSGA2(individuals(matrix), size)
+    record(0, population, size)
+
+    for gen in range(1, generations + 1):
+        if time_limit is not None and time.perf_counter() - start >= time_limit:
+            break
+        parents = tools.selTournamentDCD(population, size)
+        genomes = np.array(parents, dtype=np.uint8)
+        cxTwoPointArray(genomes, cxpb, rng)
+        mutFlipBitArray(genomes, mutpb, indpb, rng)
+        offspring = genomes.reshape(size, *shape)
+        if repair:
+            offspring = repairSchedules(problem, offspring, rng)
+
+        population = tools.selNSGA2(_distinctFirst(population + individuals(offspring), size), size)
+        record(gen, population, size)
+
+    front = tools.sortNondominated(population, len(population), first_front_only=True)[0]
+    # One schedule per trade-off: schedules with equal objectives are interchangeable
+    unique = {}
+    for individual in front:
+        unique.setdefault(individual.fitness.values, list(individual))
+    ordered = sorted(unique.items())
+    schedules = [genome for _, genome in ordered]
+    objectives = np.array([values for values, _ in ordered], dtype=np.int64).reshape(-1, len(OBJECTIVES))
+    return schedules, objectives, logbook
@@ -0,0 +1,117 @@
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Problem instance of the current worker process, set once by the pool initializer
+_worker_problem = None
+# Shared memory block the worker is currently attached to
+_worker_block = None
+
+
+def _init_worker(problem):
+    """
+    Pool initializer: keeps the scheduling problem in the worker for all later tasks.
+    """
+    global _worker_problem
+    _worker_problem = problem
+
+
+def _attach(name):
+    """
+    Returns the worker's attachment to the shared memory block *name*, reattaching only
+    when the parent has replaced the block.
+    """
+    global _worker_block
+    if _worker_block is None or _worker_block.name != name:
+        if _worker_block is not None:
+            _worker_block.close()
+        _worker_block = shared_memory.SharedMemory(name=name)
+    return _worker_block
+
+
+def _evaluate_slice(name, shape, start, stop):
+    """
+    Scores rows [start, stop) of the population stored in the shared memory block *name*.
+    """
+    block = _attach(name)
+    population = np.ndarray(shape, dtype=np.uint8, buffer=block.buf)
+    return _worker_problem.getPopulationCosts(population[start:stop])
+
+
+class ParallelEvaluator:
+    """
+    Evaluates populations of a DoctorSchedulingProblem on a process pool.
+
+    The problem is sent to every worker once through the pool initializer, and each batch
+    of candidates is written to a shared memory block that the workers read in place, so
+    only slice bounds and cost arrays are pickled per generation.
+    """
+
+    def __init__(self, problem, workers, capacity=1):
+        """
+        Allocates the shared population buffer and starts the worker pool.
+
+        Parameters:
+        - problem (DoctorSchedulingProblem): The scheduling problem instance.
+        - workers (int): Number of worker processes.
+        - capacity (int): Number of schedules the shared buffer holds before it has to grow.
+        """
+        self.problem = problem
+        self.workers = workers
+        self._block = None
+        # Allocate before forking so the workers share the parent's resource tracker
+        self._reserve(capacity * len(problem))
+        self.pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(problem,))
+
+    def _reserve(self, nbytes):
+        """
+        Returns a shared memory block of at least *nbytes*, reusing the current one when possible.
+        """
+        if self._block is None or self._block.size < nbytes:
+            self._release()
+            self._block = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+        return self._block
+
+    def _release(self):
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+            self._block = None
+
+    def evaluate(self, population):
+        """
+        Calculates the cost of every schedule of a (population, doctors, days) array.
+
+        Parameters:
+        - population (np.ndarray): Schedules as returned by DoctorSchedulingProblem.toMatrix.
+
+        Returns:
+        - np.ndarray: int array with the cost of each schedule.
+        """
+        population = np.ascontiguousarray(population, dtype=np.uint8)
+        block = self._reserve(population.nbytes)
+        shared = np.ndarray(population.shape, dtype=np.uint8, buffer=block.buf)
+        shared[:] = population
+        del shared
+
+        bounds = np.linspace(0, len(population), min(self.workers, len(population)) + 1, dtype=int)
+        tasks = [
+            (block.name, population.shape, int(start), int(stop))
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        return np.concatenate(self.pool.starmap(_evaluate_slice, tasks))
+
+    def close(self):
+        """
+        Stops the worker pool and frees the shared memory block.
+        """
+        self.pool.close()
+        self.pool.join()
+        self._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
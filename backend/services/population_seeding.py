@@ -0,0 +1,61 @@
+import numpy as np
+
+
+def dailyTargets(problem, size, rng):
+    """
+    Draws the number of doctors to schedule on each day for *size* schedules.
+
+    The targets average the coverage that keeps every doctor between the monthly minimum
+    and maximum, clipped to each day's [minShifts, maxShifts] range.
+
+    Returns:
+    - np.ndarray: int array of shape (size, days).
+    """
+    monthly = (problem.doctorMinShiftPerMonth + problem.doctorMaxShiftPerMonth) / 2
+    desired = len(problem.doctors) * monthly / problem.num_days
+    base = int(np.floor(desired))
+    targets = base + (rng.random((size, problem.num_days)) < desired - base)
+    return np.clip(targets, problem.shiftMinArray, problem.shiftMaxArray)
+
+
+def seedPopulation(problem, size, rng):
+    """
+    Builds schedules with a randomized greedy fill, vectorized over the whole population.
+
+    Days are visited in a random order per schedule. On each day, doctors that are
+    available, under the monthly maximum and not working an adjacent day are picked first,
+    with the lowest current load winning and random noise breaking ties. Doctors that are
+    only blocked by adjacency or the monthly maximum fill the rest. Doctors on a
+    requested day off are never scheduled.
+
+    Parameters:
+    - problem (DoctorSchedulingProblem): The scheduling problem instance.
+    - size (int): Number of schedules to build.
+    - rng (np.random.Generator): Random number generator.
+
+    Returns:
+    - np.ndarray: uint8 array of shape (size, doctors, days).
+    """
+    num_doctors, num_days = len(problem.doctors), problem.num_days
+    padded = np.zeros((size, num_doctors, num_days + 2), dtype=np.uint8)
+    load = np.zeros((size, num_doctors), dtype=np.int64)
+    targets = dailyTargets(problem, size, rng)
+    orders = np.argsort(rng.random((size, num_days)), axis=1)
+    rows = np.arange(size)
+    available = ~problem.unavailableArray.T
+
+    for step in range(num_days):
+        day = orders[:, step]
+        candidates = available[day]
+        neighbours = padded[rows, :, day] | padded[rows, :, day + 2]
+        preferred = candidates & (neighbours == 0) & (load < problem.doctorMaxShiftPerMonth)
+
+        score = load + rng.random((size, num_doctors)) + num_days * ~preferred
+        score[~candidates] = np.inf
+        rank = np.argsort(np.argsort(score, axis=1), axis=1)
+        picked = candidates & (rank < targets[rows, day][:, np.newaxis])
+
+        padded[rows, :, day + 1] = picked
+        load += picked
+
+    return padded[:, :, 1:-1]
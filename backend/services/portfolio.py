@@ -0,0 +1,177 @@
+import contextlib
+import io
+import logging
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import wait
+
+from deap import tools
+
+# Seconds of a member's share of the deadline kept back for starting the process and
+# sending its result before the portfolio terminates it
+DEADLINE_MARGIN = 0.5
+
+
+def _run_member(connection, problem, config, engine):
+    """
+    Worker process of one portfolio member. Solves the problem with its own engine and
+    seed, and sends every improvement of its best schedule (per generation for the
+    genetic algorithm, per time check for local search), so the portfolio keeps a result
+    when the member is killed at the deadline.
+    """
+    # Imported here because solution_service imports this module
+    from services.solution_service import SolutionService
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            service = SolutionService(problem, config=config)
+            best_cost = [None]
+
+            def progress(schedule, cost):
+                if best_cost[0] is None or cost < best_cost[0]:
+                    best_cost[0] = cost
+                    connection.send(("progress", list(schedule), cost))
+
+            def report(gen, population, halloffame):
+                schedule = service.representation.decode(halloffame[0])
+                progress(schedule, problem.getCost(schedule))
+                return {}
+            service.hooks.append(report)
+            service.progress = progress
+
+            best = service.solve(engine)
+        connection.send(("done", list(best), problem.getCost(best)))
+    except Exception as error:
+        connection.send(("error", str(error), None))
+    finally:
+        connection.close()
+
+
+class Portfolio:
+    """
+    Races independent solves, each with its own engine and seed, in separate processes.
+    Returns the best schedule reported when every member has finished, when one reaches
+    zero cost or when the deadline passes; members still running are then terminated.
+    """
+
+    def __init__(self, problem, config, members, deadline=None, workers=None):
+        """
+        Initializes the portfolio.
+
+        Parameters:
+        - problem (DoctorSchedulingProblem): The scheduling problem instance.
+        - config (dict): SolutionService configuration shared by the members.
+        - members (list): (engine, random_seed) pair of every member.
+        - deadline (float): Seconds after which the best result so far is returned.
+        - workers (int): Members running at once, defaults to the number of CPUs.
+        """
+        self.problem = problem
+        self.config = config
+        self.members = list(members)
+        self.deadline = deadline
+        self.workers = max(1, min(workers or os.cpu_count() or 1, len(self.members)))
+
+    def _member_config(self, seed, remaining=None):
+        """
+        Returns the configuration of a single member: one process, its own seed, and local
+        search bounded by the time left before the deadline when it is launched.
+
+        Parameters:
+        - seed (int): Random seed of the member.
+        - remaining (float): Seconds left before the deadline, None without a deadline.
+        """
+        time_limit = self.config["time_limit"]
+        if remaining is not None:
+            budget = remaining - DEADLINE_MARGIN
+            time_limit = budget if time_limit is None else min(time_limit, budget)
+        return {
+            **self.config,
+            "islands": 1,
+            "workers": None,
+            "verbose": False,
+            "solver_profiles": None,
+            "random_seed": seed,
+            "time_limit": time_limit,
+        }
+
+    def run(self):
+        """
+        Runs the members and returns the best result.
+
+        Returns:
+        - tuple: The best flat schedule, its cost and a logbook with the engine, seed,
+          status ("done", "killed", "error" or "pending" when it never started), best cost
+          and seconds of every member.
+        """
+        start = time.perf_counter()
+        pending = list(enumerate(self.members))
+        running = {}
+        status = ["pending"] * len(self.members)
+        costs = [None] * len(self.members)
+        seconds = [None] * len(self.members)
+        best_schedule, best_cost = None, None
+
+        def launch():
+            while pending and len(running) < self.workers:
+                remaining = None
+                if self.deadline is not None:
+                    remaining = self.deadline - (time.perf_counter() - start)
+                    if remaining <= DEADLINE_MARGIN:
+                        # Too late to produce anything; the member stays pending
+                        return
+                member, (engine, seed) = pending.pop(0)
+                parent_end, child_end = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(
+                    target=_run_member, args=(child_end, self.problem, self._member_config(seed, remaining), engine),
+                    daemon=True
+                )
+                process.start()
+                child_end.close()
+                running[parent_end] = (member, process, time.perf_counter())
+                status[member] = "running"
+
+        try:
+            launch()
+            while running and best_cost != 0:
+                remaining = None
+                if self.deadline is not None:
+                    remaining = self.deadline - (time.perf_counter() - start)
+                    if remaining <= 0:
+                        break
+                for connection in wait(list(running), timeout=remaining):
+                    member, process, started = running[connection]
+                    try:
+                        kind, payload, cost = connection.recv()
+                    except EOFError:
+                        kind, payload, cost = "error", "member exited without a result", None
+                    if kind == "error":
+                        logging.warning("Portfolio member %d failed: %s", member, payload)
+                    elif best_cost is None or cost < best_cost:
+                        best_schedule, best_cost = payload, cost
+                    if cost is not None and (costs[member] is None or cost < costs[member]):
+                        costs[member] = cost
+                    if kind != "progress":
+                        status[member] = kind
+                        seconds[member] = round(time.perf_counter() - started, 3)
+                        del running[connection]
+                        process.join()
+                launch()
+        finally:
+            for connection, (member, process, started) in running.items():
+                process.terminate()
+                process.join()
+                connection.close()
+                status[member] = "killed"
+                seconds[member] = round(time.perf_counter() - started, 3)
+
+        if best_schedule is None:
+            raise RuntimeError("No portfolio member produced a schedule before the deadline.")
+
+        logbook = tools.Logbook()
+        logbook.header = ['member', 'engine', 'seed', 'status', 'cost', 'seconds']
+        for member, (engine, seed) in enumerate(self.members):
+            logbook.record(member=member, engine=engine, seed=seed, status=status[member],
+                           cost=costs[member], seconds=seconds[member])
+        logging.info("Portfolio finished after %.2fs, best cost %s", time.perf_counter() - start, best_cost)
+        return best_schedule, best_cost, logbook
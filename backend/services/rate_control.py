@@ -0,0 +1,101 @@
+import numpy as np
+
+
+def meanHammingDistance(matrix):
+    """
+    Returns the mean pairwise Hamming distance of a population of binary schedules, as a
+    share of the cells. Computed from per-cell counts in O(population * cells): a cell set
+    in c of n schedules differs in c * (n - c) of the n * (n - 1) / 2 pairs.
+
+    Parameters:
+    - matrix (np.ndarray): Schedules of shape (population, doctors, days).
+
+    Returns:
+    - float: Mean share of differing cells over all pairs of schedules.
+    """
+    flat = np.asarray(matrix).reshape(len(matrix), -1)
+    size, cells = flat.shape
+    if size < 2:
+        return 0.0
+    ones = flat.sum(axis=0, dtype=np.int64)
+    return float((ones * (size - ones)).sum() * 2 / (size * (size - 1) * cells))
+
+
+class AdaptiveRates:
+    """
+    Generation hook adapting the crossover probability, the mutation probability and the
+    mutation's per-gene probability (indpb) to the state of the run.
+
+    When the population diversity (mean Hamming distance) falls below *low_diversity*, or
+    the best fitness has not improved for *patience* generations, the mutation rates are
+    multiplied by *step* and the crossover probability divided by it, to explore. When the
+    best fitness improves or diversity is above *high_diversity*, the rates move back by the
+    same factor, but never past their initial values. The returned ``cxpb`` and ``mutpb``
+    are applied by eaSimpleWithElitism from the next generation; indpb is written to the
+    keywords of the mutation operator, which wrappers around it keep calling.
+    """
+
+    def __init__(self, representation, mutate, cxpb, mutpb, low_diversity=0.05, high_diversity=0.25,
+                 step=1.2, patience=3):
+        """
+        Initializes the controller with the starting rates.
+
+        Parameters:
+        - representation: Genome representation used to convert individuals to matrices.
+        - mutate (functools.partial): Mutation operator whose indpb keyword is adapted, or
+          None when the mutation has no per-gene probability; indpb is then neither adapted
+          nor logged.
+        - cxpb (float): Initial crossover probability.
+        - mutpb (float): Initial mutation probability.
+        - patience (int): Generations without improvement after which the best fitness
+          counts as stalled.
+        """
+        self.representation = representation
+        self.mutate = mutate if "indpb" in getattr(mutate, "keywords", {}) else None
+        self.fields = ["diversity", "improvement", "cxpb", "mutpb"] + (["indpb"] if self.mutate else [])
+        self.cxpb = cxpb
+        self.mutpb = mutpb
+        self.indpb = self.mutate.keywords["indpb"] if self.mutate else None
+        self.base = (cxpb, mutpb, self.indpb)
+        self.low_diversity = low_diversity
+        self.high_diversity = high_diversity
+        self.step = step
+        # Exploration stops at four times the starting number of mutated genes
+        self.max_indpb = min(4.0 * self.indpb, 1.0) if self.mutate else None
+        self.patience = patience
+        self.best = None
+        self.stalled = 0
+
+    def _setIndpb(self, indpb):
+        self.indpb = float(np.clip(indpb, self.base[2], self.max_indpb))
+        self.mutate.keywords["indpb"] = self.indpb
+
+    def __call__(self, gen, population, halloffame):
+        """
+        Generation hook: measures diversity and improvement, then updates the rates.
+        """
+        diversity = meanHammingDistance(self.representation.toMatrix(population))
+        best = halloffame[0].fitness.values[0]
+        improvement = 0.0 if self.best is None else max(self.best - best, 0.0) / max(abs(self.best), 1.0)
+        self.best = best if self.best is None else min(self.best, best)
+        self.stalled = 0 if improvement > 0.0 else self.stalled + 1
+
+        if gen > 0:
+            if diversity < self.low_diversity or self.stalled >= self.patience:
+                factor = self.step
+            elif improvement > 0.0 or diversity > self.high_diversity:
+                factor = 1.0 / self.step
+            else:
+                factor = 1.0
+            self.cxpb = float(np.clip(self.cxpb / factor, min(0.5, self.base[0]), self.base[0]))
+            self.mutpb = float(np.clip(self.mutpb * factor, self.base[1], 1.0))
+            if self.mutate:
+                self._setIndpb(self.indpb * factor)
+
+        record = {
+            "diversity": round(diversity, 4), "improvement": round(improvement, 4),
+            "cxpb": round(self.cxpb, 4), "mutpb": round(self.mutpb, 4),
+        }
+        if self.mutate:
+            record["indpb"] = round(self.indpb, 5)
+        return record
@@ -0,0 +1,101 @@
+import time
+
+import numpy as np
+
+
+def repairSchedules(problem, population, rng):
+    """
+    Moves a population of schedules towards feasibility in one vectorized pass.
+
+    Clears shifts on requested days off, removes the most loaded doctors from days above
+    maxShifts, and fills days below minShifts with the least loaded available doctors,
+    preferring those under the monthly maximum who are not working an adjacent day.
+
+    Parameters:
+    - problem (DoctorSchedulingProblem): The scheduling problem instance.
+    - population (np.ndarray): Schedules of shape (population, doctors, days).
+    - rng (np.random.Generator): Random number generator used to break ties.
+
+    Returns:
+    - np.ndarray: Repaired uint8 schedules of the same shape.
+    """
+    schedules = np.asarray(population).astype(bool) & ~problem.unavailableArray
+    num_days = problem.num_days
+
+    # Trim over-covered days, dropping the doctors with the highest load first
+    load = schedules.sum(axis=2)
+    excess = np.maximum(schedules.sum(axis=1) - problem.shiftMaxArray, 0)
+    score = load[:, :, np.newaxis] + rng.random(schedules.shape)
+    score[~schedules] = -np.inf
+    rank = np.argsort(np.argsort(-score, axis=1), axis=1)
+    schedules &= ~(rank < excess[:, np.newaxis, :])
+
+    # Fill under-covered days from available doctors with the lowest load
+    load = schedules.sum(axis=2)
+    deficit = np.maximum(problem.shiftMinArray - schedules.sum(axis=1), 0)
+    neighbours = np.zeros_like(schedules)
+    neighbours[:, :, 1:] |= schedules[:, :, :-1]
+    neighbours[:, :, :-1] |= schedules[:, :, 1:]
+    candidates = ~schedules & ~problem.unavailableArray
+    preferred = ~neighbours & (load < problem.doctorMaxShiftPerMonth)[:, :, np.newaxis]
+    score = load[:, :, np.newaxis] + rng.random(schedules.shape) + num_days * ~preferred
+    score[~candidates] = np.inf
+    rank = np.argsort(np.argsort(score, axis=1), axis=1)
+    schedules |= candidates & (rank < deficit[:, np.newaxis, :])
+
+    return schedules.astype(np.uint8)
+
+
+class RepairOperator:
+    """
+    Toolbox repair stage applied to offspring before evaluation. Also acts as a generation
+    hook reporting the share of individuals it changed and the time it took.
+    """
+    fields = ["repaired", "repair_ms"]
+
+    def __init__(self, problem, representation, rng):
+        """
+        Initializes the operator.
+
+        Parameters:
+        - problem (DoctorSchedulingProblem): The scheduling problem instance.
+        - representation: Genome representation used to convert individuals to matrices.
+        - rng (np.random.Generator): Random number generator used to break ties.
+        """
+        self.problem = problem
+        self.representation = representation
+        self.rng = rng
+        self.processed = 0
+        self.changed = 0
+        self.seconds = 0.0
+
+    def repair(self, individuals):
+        """
+        Repairs the given individuals in place. Repaired individuals lose any fitness hint
+        left by the mutation step, since it no longer matches their genome.
+        """
+        if not individuals:
+            return
+        start = time.perf_counter()
+        matrix = self.representation.toMatrix(individuals)
+        repaired = repairSchedules(self.problem, matrix, self.rng)
+        changed = np.flatnonzero((repaired != matrix).any(axis=(1, 2)))
+        for index, individual in zip(changed, self.representation.fromMatrix(repaired[changed])):
+            individuals[index][:] = individual
+            individuals[index].__dict__.pop("fitnessHint", None)
+        self.processed += len(individuals)
+        self.changed += len(changed)
+        self.seconds += time.perf_counter() - start
+
+    def __call__(self, gen, population, halloffame):
+        """
+        Generation hook: reports and resets the repair counters of the generation.
+        """
+        record = {
+            "repaired": self.changed / self.processed if self.processed else 0.0,
+            "repair_ms": round(self.seconds * 1000, 2),
+        }
+        self.processed = 0
+        self.changed = 0
+        self.seconds = 0.0
+        return record
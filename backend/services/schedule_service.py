@@ -2,6 +2,7 @@ from repositories.repository import ScheduleRepository
 from services.database_to_clinic_request_service import DatabaseToClinicRequestService
 from services.doctor_scheduling_service import DoctorSchedulingProblem
 from services.solution_service import SolutionService
+from services.clinic_request_precheck import check_clinic_request, InfeasibleRequestError
 import numpy as np
 import logging
 from database.models import Schedule  # Added import
@@ -9,8 +10,14 @@ from flask import Response
 import csv
 from io import StringIO
 import calendar
+import threading
+import uuid
+from collections import OrderedDict
 from repositories.repository import ScheduleRepository  # Import Repository
 
+# Number of recent NSGA-II runs whose Pareto front is kept for save_pareto_point
+PARETO_RUNS_SIZE = 16
+
 class ScheduleService:
     """
     Service layer for handling schedule-related logic.
@@ -19,8 +26,12 @@ class ScheduleService:
     editing schedule details, finalizing schedules, and exporting schedules in CSV format.
     """
 
+    # Pareto fronts of recent NSGA-II runs by run id, oldest first, shared by request threads
+    _pareto_runs = OrderedDict()
+    _pareto_runs_lock = threading.Lock()
+
     @staticmethod
-    def generate_schedule(session, month, year):
+    def generate_schedule(session, month, year, engine="ga"):
         """
         Generates a schedule for a given month and year.
 
@@ -28,11 +39,20 @@ class ScheduleService:
             session: Database session for queries and transactions.
             month (str): Target month for the schedule.
             year (int): Target year for the schedule.
+            engine (str): Solver engine: "ga" (genetic algorithm), "sa" (simulated
+                annealing), "tabu" (tabu search), "flow" (min-cost flow construction),
+                "exact" (integer programming), "nsga2" (multi-objective search) or
+                "portfolio" (several engines and seeds raced in parallel).
 
         Returns:
-            dict: Success message indicating schedule generation.
+            dict: Success message indicating schedule generation. With "nsga2" it also
+                lists every point of the Pareto front, with its id, flat schedule and
+                objectives, under "pareto_front", the id of the saved point (the one with
+                the lowest hard cost) under "pareto_point", and under "pareto_run" the id
+                to pass to save_pareto_point to save another point instead.
 
         Raises:
+            InfeasibleRequestError: If the clinic request cannot be covered by any schedule.
             Exception: Logs and raises errors during processing.
         """
         try:
@@ -61,9 +81,21 @@ class ScheduleService:
                 num_days=num_days
             )
 
-            # Solve the problem using genetic algorithm
+            # Reject requests no schedule can cover before running a solver
+            diagnostic = check_clinic_request(
+                clinic_request, problem.doctorMinShiftPerMonth, problem.doctorMaxShiftPerMonth
+            )
+            for warning in diagnostic["warnings"]:
+                logging.warning(f"Clinic request for {month} {year}: {warning['message']}")
+            if not diagnostic["feasible"]:
+                raise InfeasibleRequestError(diagnostic)
+
+            # Solve the problem with the requested engine
             solution_service = SolutionService(problem)
-            best_solution = solution_service.run_genetic_algorithm()
+            if engine == "ga":
+                best_solution = solution_service.run_genetic_algorithm()
+            else:
+                best_solution = solution_service.solve(engine)
 
             # Reshape output to match schedule format
             num_doctors = len(doctorNames)
@@ -72,11 +104,74 @@ class ScheduleService:
             schedule = ScheduleRepository.add_schedule(session, month, year)
             solution_service.save_solution_to_db(session, month, year, reshaped_solution,doctorPreference)
             logging.info(f"Schedule generated and saved for {month} {year}.")
-            return {"message": f"Schedule for {month} {year} generated successfully!"}
+            result = {"message": f"Schedule for {month} {year} generated successfully!"}
+            front = solution_service.pareto_front
+            if front is not None:
+                result["pareto_front"] = front
+                result["pareto_point"] = next(
+                    (point["id"] for point in front if point["schedule"] == best_solution), None
+                )
+                result["pareto_run"] = ScheduleService._store_pareto_run({
+                    "month": month, "year": year, "front": front, "solution_service": solution_service,
+                    "doctorPreference": doctorPreference, "shape": (num_days, num_doctors),
+                })
+            return result
         except Exception as e:
             logging.error(f"Error in generating schedule: {str(e)}")
             raise
 
+    @staticmethod
+    def _store_pareto_run(run):
+        """
+        Keeps the Pareto front of a run under a new run id, dropping the oldest run when
+        PARETO_RUNS_SIZE runs are kept, and returns the id.
+        """
+        run_id = uuid.uuid4().hex
+        with ScheduleService._pareto_runs_lock:
+            ScheduleService._pareto_runs[run_id] = run
+            while len(ScheduleService._pareto_runs) > PARETO_RUNS_SIZE:
+                ScheduleService._pareto_runs.popitem(last=False)
+        return run_id
+
+    @staticmethod
+    def save_pareto_point(session, run_id, pareto_point):
+        """
+        Saves another point of the Pareto front of an earlier "nsga2" generation, from the
+        kept front and without solving again. It replaces the shifts saved for that month.
+
+        Args:
+            session: Database session for queries and transactions.
+            run_id (str): "pareto_run" returned by generate_schedule.
+            pareto_point (int): Id of the front point to save.
+
+        Returns:
+            dict: Success message with the month, year and saved point.
+
+        Raises:
+            LookupError: If the run is unknown or no longer kept.
+            ValueError: If the point is not on the run's front.
+        """
+        try:
+            with ScheduleService._pareto_runs_lock:
+                run = ScheduleService._pareto_runs.get(run_id)
+            if run is None:
+                raise LookupError(f"Pareto run {run_id} not found; generate the schedule again.")
+            front = run["front"]
+            if isinstance(pareto_point, bool) or not isinstance(pareto_point, int) or not 0 <= pareto_point < len(front):
+                raise ValueError(f"Pareto front point {pareto_point} not found; the front has {len(front)} points.")
+
+            month, year = run["month"], run["year"]
+            solution = np.array(front[pareto_point]["schedule"]).reshape(run["shape"])
+            run["solution_service"].save_solution_to_db(session, month, year, solution, run["doctorPreference"])
+            logging.info(f"Pareto front point {pareto_point} of run {run_id} saved for {month} {year}.")
+            return {
+                "message": f"Schedule for {month} {year} saved from Pareto front point {pareto_point}.",
+                "pareto_point": pareto_point,
+            }
+        except Exception as e:
+            logging.error(f"Error saving Pareto front point: {str(e)}")
+            raise
+
     @staticmethod
     def get_schedules(session, month=None, year=None):
         """
@@ -1,6 +1,7 @@
 from deap import base, creator, tools
 import random
 import os
+import time
 import calendar
 from datetime import datetime
 import logging
@@ -12,7 +13,24 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import json
 
-from services.genetic_algorithm import eaSimpleWithElitism
+from services.genetic_algorithm import eaSimpleWithElitism, EarlyStopping
+from services.array_population import ArrayPopulation, eaArrayElitism
+from services.elite_archive import EliteArchive
+from services.genome_representations import REPRESENTATIONS
+from services.parallel_evaluation import ParallelEvaluator
+from services.fitness_cache import FitnessCache
+from services.island_model import IslandModel
+from services.population_seeding import seedPopulation
+from services.repair import RepairOperator, repairSchedules
+from services.targeted_mutation import AdaptiveMutation
+from services.adaptive_penalty import AdaptivePenalty
+from services.rate_control import AdaptiveRates
+from services.local_search import simulatedAnnealing, tabuSearch, hillClimb
+from services.flow_solver import solveCoverageFlow
+from services.exact_solver import solveExact
+from services.multi_objective import OBJECTIVES, solveParetoFront
+from services.portfolio import Portfolio
+from services.solver_profiles import SOLVER_PROFILES_PATH, loadProfiles, problemFeatures, selectProfile
 from repositories.repository import ShiftRepository, ScheduleRepository
 from database.models import Schedule,Shift
 
@@ -23,23 +41,160 @@ P_MUTATION = 0.3
 MAX_GENERATIONS = 20
 HALL_OF_FAME_SIZE = 450
 RANDOM_SEED = 42
+# Batches smaller than this are evaluated in-process even when workers are configured
+PARALLEL_MIN_BATCH = 64
+FITNESS_CACHE_SIZE = 20000
+# Early stopping rules: cost to reach, generations without improvement, avg/min fitness gap
+TARGET_COST = 0
+STALL_GENERATIONS = None
+MIN_FITNESS_GAP = None
+# Island model: number of islands, generations between migrations, migrants per island
+ISLANDS = 1
+MIGRATION_INTERVAL = 5
+MIGRATION_SIZE = 5
+# Share of the initial population drawn uniformly at random when seeding is enabled
+SEEDING_RANDOM_FRACTION = 0.1
+# Local search engines: annealing moves, tabu iterations and tabu tenure
+LOCAL_SEARCH_MOVES = 200000
+TABU_ITERATIONS = 5000
+TABU_TENURE = 10
+# Post-GA polishing: moves evaluated and milliseconds spent at most
+POLISH_MOVES = 20000
+POLISH_MS = 500
+# Min-cost flow engine: schedules solved with perturbed costs when seeding the GA
+FLOW_SEEDS = 8
+# Exact engine: MIP time limit in seconds and relative gap at which it may stop
+EXACT_TIME_LIMIT = 60.0
+EXACT_MIP_GAP = 0.0
+# Multi-objective engine: NSGA-II population size and generations
+PARETO_POPULATION_SIZE = 100
+PARETO_GENERATIONS = 60
+# Portfolio engine: seeds per engine and seconds until the best result so far is returned
+PORTFOLIO_SEEDS = 2
+PORTFOLIO_DEADLINE = 60.0
 
 setup_logging()
 
+# Default solver configuration, overridable per SolutionService instance
+DEFAULT_CONFIG = {
+    "engine": "ga",
+    "population_size": POPULATION_SIZE,
+    "p_crossover": P_CROSSOVER,
+    "p_mutation": P_MUTATION,
+    "max_generations": MAX_GENERATIONS,
+    "hall_of_fame_size": HALL_OF_FAME_SIZE,
+    "random_seed": RANDOM_SEED,
+    "representation": "binary",
+    "population": "list",
+    "crossover": "two_point",
+    "mutation": "flip",
+    "adaptive_penalty": False,
+    "adaptive_rates": False,
+    "workers": None,
+    "fitness_cache_size": FITNESS_CACHE_SIZE,
+    "target_cost": TARGET_COST,
+    "stall_generations": STALL_GENERATIONS,
+    "min_fitness_gap": MIN_FITNESS_GAP,
+    "islands": ISLANDS,
+    "migration_interval": MIGRATION_INTERVAL,
+    "migration_size": MIGRATION_SIZE,
+    "migration_topology": "ring",
+    "seeding": "greedy",
+    "seeding_random_fraction": SEEDING_RANDOM_FRACTION,
+    "repair": True,
+    "local_search_moves": LOCAL_SEARCH_MOVES,
+    "tabu_iterations": TABU_ITERATIONS,
+    "tabu_tenure": TABU_TENURE,
+    "time_limit": None,
+    "polish": None,
+    "polish_moves": POLISH_MOVES,
+    "polish_ms": POLISH_MS,
+    "flow_fallback": "tabu",
+    "flow_seeds": FLOW_SEEDS,
+    "weekend_cost": 1.0,
+    "exact_time_limit": EXACT_TIME_LIMIT,
+    "exact_mip_gap": EXACT_MIP_GAP,
+    "pareto_population_size": PARETO_POPULATION_SIZE,
+    "pareto_generations": PARETO_GENERATIONS,
+    "solver_profiles": SOLVER_PROFILES_PATH,
+    "portfolio_engines": ["ga", "tabu", "sa"],
+    "portfolio_seeds": PORTFOLIO_SEEDS,
+    "portfolio_deadline": PORTFOLIO_DEADLINE,
+    "portfolio_workers": None,
+    "verbose": True,
+}
+
 class SolutionService:
     """
     Service for solving scheduling problems using a genetic algorithm.
     """
-    def __init__(self, problem, hard_constraint_penalty=10000):
+    def __init__(self, problem, hard_constraint_penalty=10000, config=None):
         """
         Initializes the SolutionService with the given scheduling problem.
 
         Parameters:
         - problem: The scheduling problem instance.
         - hard_constraint_penalty (int): Penalty for constraint violations.
+        - config (dict): Overrides for DEFAULT_CONFIG (e.g. {"representation": "bitpacked"} or
+          {"representation": "reduced"} for genomes over available cells only, or
+          {"representation": "dayset"} for per-day doctor sets sized within the coverage bounds).
+          "population" is "list" (DEAP individuals) or "array", which keeps the binary
+          genomes in one uint8 array with a fitness vector and varies them as arrays.
+          "crossover" is "two_point" on the flat genome, or a matrix crossover exchanging
+          whole doctor "rows", whole day "columns" or a block of whole "weeks". "mutation"
+          is the representation's "flip" mutation or "targeted" constraint-aware moves
+          picked by their recent success rate. "adaptive_penalty" scores the GA with
+          per-constraint weights that follow how much of the population violates each one.
+          "adaptive_rates" adjusts the crossover, mutation and per-gene mutation rates each
+          generation from the population diversity and the improvement of the best cost.
+          Setting "workers" above 1 evaluates each generation on a process pool, and
+          "fitness_cache_size" bounds the LRU cost cache (0 disables it). "target_cost",
+          "stall_generations" and "min_fitness_gap" end the run early (None disables a rule).
+          "islands" above 1 splits the population over that many processes that exchange
+          their best individuals every "migration_interval" generations. "seeding" is
+          "greedy" (constraint-aware initial population) or "random". "repair" moves
+          offspring towards feasibility before they are evaluated. "polish" ("first" or
+          "steepest") hill-climbs the GA result within "polish_moves" and "polish_ms".
+          "engine" selects the solver used by solve(): "ga", "sa" (simulated annealing),
+          "tabu", "flow" (min-cost flow construction, refined by "flow_fallback" when it
+          is not clean), "exact" (integer program, logging the proven lower bound and gap)
+          or "nsga2" (NSGA-II over hard cost, weekend and rest spacing violations, run for
+          "pareto_generations" on "pareto_population_size" schedules).
+          "solver_profiles" is the profile file written by dev_utils/tune_solver_profiles.py;
+          the settings tuned for the closest (doctors, days, availability density) are
+          applied over DEFAULT_CONFIG and under the explicit overrides (None disables it).
+          "portfolio" races every engine in "portfolio_engines" with "portfolio_seeds"
+          seeds each on "portfolio_workers" processes, returning the best result at
+          "portfolio_deadline" seconds or the first one with zero cost.
         """
         self.problem = problem
         self.hard_constraint_penalty = hard_constraint_penalty
+        config = config or {}
+        profiles = loadProfiles(config.get("solver_profiles", DEFAULT_CONFIG["solver_profiles"]))
+        self.profile = selectProfile(profiles, problemFeatures(problem))
+        self.config = {**DEFAULT_CONFIG, **(self.profile or {}), **config}
+        # A profile's hall of fame is sized for its own population, which an explicit
+        # population_size may have shrunk
+        self.config["hall_of_fame_size"] = min(self.config["hall_of_fame_size"], self.config["population_size"])
+        if self.config["representation"] not in REPRESENTATIONS:
+            raise ValueError(f"Unknown genome representation '{self.config['representation']}'.")
+        self.representation = REPRESENTATIONS[self.config["representation"]](problem)
+        self.rng = np.random.default_rng(self.config["random_seed"])
+        self.repair_operator = None
+        self.mutation_operator = None
+        self.rate_controller = None
+        self.parallel_evaluator = None
+        self.logbook = None
+        self.pareto_front = None
+        # Extra generation hooks, e.g. progress reporting of a portfolio member
+        self.hooks = []
+        # Optional progress(schedule, cost) called by the local search engines with their best so far
+        self.progress = None
+        cache_size = self.config["fitness_cache_size"]
+        self.fitness_cache = FitnessCache(cache_size) if cache_size else None
+        self.adaptive_penalty = None
+        if self.config["adaptive_penalty"]:
+            self.adaptive_penalty = AdaptivePenalty(problem, self.representation, self.fitness_cache)
         self.toolbox = base.Toolbox()
         self._setup_genetic_algorithm()
 
@@ -47,52 +202,268 @@ class SolutionService:
         """
         Configures the genetic algorithm parameters and operators.
         """
-        random.seed(RANDOM_SEED)
+        random.seed(self.config["random_seed"])
 
         # Define fitness and individual structure
         creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
-        creator.create("Individual", list, fitness=creator.FitnessMin)
 
         # Register genetic operators
-        self.toolbox.register("zeroOrOne", random.randint, 0, 1)
-        self.toolbox.register(
-            "individualCreator", tools.initRepeat, creator.Individual, self.toolbox.zeroOrOne, len(self.problem)
-        )
+        self.representation.register(self.toolbox, indpb=self.representation.defaultIndpb())
+        # Kept for the rate controller, which adapts its indpb through any wrapper below
+        flip_mutate = self.toolbox.mutate
+        if self.config["crossover"] != "two_point":
+            self.toolbox.register("mate", self.representation.matrixCrossover(self.config["crossover"]))
+        if self.config["mutation"] == "targeted":
+            self.mutation_operator = AdaptiveMutation(self.problem, self.representation, self.rng)
+            self.toolbox.register("mutate", self.mutation_operator.mutate)
+            flip_mutate = None
+        elif self.config["mutation"] != "flip":
+            raise ValueError(f"Unknown mutation '{self.config['mutation']}'.")
+        if self.adaptive_penalty is not None:
+            # Incremental fitness hints are unweighted costs, so mutants are re-scored instead
+            mutate = self.toolbox.mutate
+
+            def mutateWithoutHint(individual):
+                mutant, = mutate(individual)
+                mutant.__dict__.pop("fitnessHint", None)
+                return mutant,
+            self.toolbox.register("mutate", mutateWithoutHint)
+
+        if self.config["adaptive_rates"]:
+            self.rate_controller = AdaptiveRates(
+                self.representation, flip_mutate, self.config["p_crossover"], self.config["p_mutation"]
+            )
         self.toolbox.register("populationCreator", tools.initRepeat, list, self.toolbox.individualCreator)
 
-        self.toolbox.register("evaluate", lambda ind: (self.problem.getCost(ind),))
+        self.toolbox.register("evaluate", lambda ind: (self.problem.getCost(self.representation.decode(ind)),))
+        self.toolbox.register("evaluatePopulation", self._evaluate_population)
         self.toolbox.register("select", tools.selTournament, tournsize=2)
-        self.toolbox.register("mate", tools.cxTwoPoint)
-        self.toolbox.register("mutate", tools.mutFlipBit, indpb=1.0 / len(self.problem))
 
-    def run_genetic_algorithm(self):
+        if self.config["repair"]:
+            self.repair_operator = RepairOperator(self.problem, self.representation, self.rng)
+            self.toolbox.register("repair", self.repair_operator.repair)
+
+    def _evaluate_population(self, individuals):
         """
-        Executes the genetic algorithm and returns the best solution.
+        Scores a batch of individuals with the vectorized cost evaluator.
+
+        Parameters:
+        - individuals (list): Individuals to evaluate.
+
+        Returns:
+        - list: Fitness tuples in the same order as the individuals.
+        """
+        if self.fitness_cache is None:
+            return [(cost,) for cost in self._compute_costs(individuals)]
+
+        keys = self.fitness_cache.keys(self.representation.toMatrix(individuals))
+        costs = self.fitness_cache.lookup(keys)
+        missing = [index for index, cost in enumerate(costs) if cost is None]
+        if missing:
+            computed = self._compute_costs([individuals[index] for index in missing])
+            self.fitness_cache.store([keys[index] for index in missing], computed)
+            for index, cost in zip(missing, computed):
+                costs[index] = cost
+        return [(cost,) for cost in costs]
+
+    def _compute_costs(self, individuals):
+        """
+        Scores individuals in-process or on the worker pool, bypassing the fitness cache.
+
+        Returns:
+        - list: Cost of each individual.
+        """
+        if self.adaptive_penalty is not None:
+            return self.adaptive_penalty.costs(individuals).tolist()
+        if self.parallel_evaluator is not None and len(individuals) >= PARALLEL_MIN_BATCH:
+            costs = self.parallel_evaluator.evaluate(self.representation.toMatrix(individuals))
+        else:
+            costs = self.representation.evaluate(individuals)
+        return costs.tolist()
+
+    def _generation_hooks(self):
+        """
+        Returns the per-generation hooks whose output is recorded in the logbook.
+        """
+        hooks = []
+        if self.fitness_cache is not None:
+            hooks.append(self.fitness_cache)
+        if self.repair_operator is not None:
+            hooks.append(self.repair_operator)
+        if self.mutation_operator is not None:
+            hooks.append(self.mutation_operator)
+        if self.adaptive_penalty is not None:
+            hooks.append(self.adaptive_penalty)
+        if self.rate_controller is not None:
+            hooks.append(self.rate_controller)
+        return hooks + self.hooks
+
+    def _early_stopping(self):
+        """
+        Returns the stopping rules configured for this run.
+        """
+        return EarlyStopping(
+            target_cost=self.config["target_cost"],
+            stall_generations=self.config["stall_generations"],
+            min_gap=self.config["min_fitness_gap"]
+        )
+
+    def create_population(self, size=None, seeding=None):
+        """
+        Creates the initial population. With greedy seeding, all but a configurable fraction
+        of the individuals are built from the doctors' availability and the coverage limits;
+        the rest are drawn uniformly at random.
+
+        Parameters:
+        - size (int): Number of individuals, defaults to the configured population size.
+        - seeding (str): Seeding strategy, defaults to the configured "seeding".
+        """
+        size = size or self.config["population_size"]
+        seeding = seeding or self.config["seeding"]
+        if seeding == "random":
+            return self.toolbox.populationCreator(n=size)
+        if seeding not in ("greedy", "flow"):
+            raise ValueError(f"Unknown seeding strategy '{seeding}'.")
+
+        random_count = int(round(size * self.config["seeding_random_fraction"]))
+        flow_count = 0
+        if seeding == "flow":
+            flow_count = min(self.config["flow_seeds"], size - random_count)
+        seeded = seedPopulation(self.problem, size - random_count - flow_count, self.rng)
+        if flow_count:
+            flows = [self._solve_flow(noise=0.5 if index else 0.0) for index in range(flow_count)]
+            seeded = np.concatenate([self.problem.toMatrix(flows), seeded])
+        return self.representation.fromMatrix(seeded) + self.toolbox.populationCreator(n=random_count)
+
+    def evolve(self, population, hof, ngen):
+        """
+        Runs eaSimpleWithElitism on the given population with the configured operators,
+        evaluation mode, hooks and stopping rules.
+
+        Parameters:
+        - population (list): Population to evolve, updated in place.
+        - hof (EliteArchive): Hall of fame used for elitism.
+        - ngen (int): Maximum number of generations.
 
         Returns:
-        - best (list): The best solution found by the genetic algorithm.
+        - tuple: The final population and the logbook of the run.
         """
-        population = self.toolbox.populationCreator(n=POPULATION_SIZE)
         stats = tools.Statistics(lambda ind: ind.fitness.values)
         stats.register("min", np.min)
         stats.register("avg", np.mean)
 
-        hof = tools.HallOfFame(HALL_OF_FAME_SIZE)
-
-        population, logbook = eaSimpleWithElitism(
-            population,
-            self.toolbox,
-            cxpb=P_CROSSOVER,
-            mutpb=P_MUTATION,
-            ngen=MAX_GENERATIONS,
-            stats=stats,
-            halloffame=hof,
-            verbose=True
+        workers = self.config["workers"]
+        if workers and workers > 1:
+            self.parallel_evaluator = ParallelEvaluator(
+                self.problem, workers, capacity=len(population)
+            )
+        try:
+            return eaSimpleWithElitism(
+                population,
+                self.toolbox,
+                cxpb=self.config["p_crossover"],
+                mutpb=self.config["p_mutation"],
+                ngen=ngen,
+                stats=stats,
+                halloffame=hof,
+                verbose=self.config["verbose"],
+                hooks=self._generation_hooks(),
+                stopping=self._early_stopping()
+            )
+        finally:
+            if self.parallel_evaluator is not None:
+                self.parallel_evaluator.close()
+                self.parallel_evaluator = None
+
+    def evolve_array(self, seeding=None):
+        """
+        Runs the genetic algorithm on an ArrayPopulation: two-point crossover, bit-flip
+        mutation, tournament selection, repair and evaluation all work on the whole
+        (individuals, genes) array, with the best distinct genomes kept as elites. Covers
+        the binary representation with the default operators; evaluation stays in-process
+        and the generation hooks are not called.
+
+        Parameters:
+        - seeding (str): Seeding strategy, defaults to the configured "seeding".
+
+        Returns:
+        - tuple: The best flat genome, its cost and the logbook of the run.
+        """
+        defaults = {"representation": "binary", "crossover": "two_point", "mutation": "flip",
+                    "adaptive_penalty": False, "adaptive_rates": False}
+        unsupported = [key for key, value in defaults.items() if self.config[key] != value]
+        if unsupported:
+            raise ValueError(f"The array population does not support these options: {', '.join(unsupported)}.")
+
+        repair = None
+        if self.config["repair"]:
+            def repair(genomes):
+                return repairSchedules(self.problem, self.problem.toMatrix(genomes), self.rng).reshape(len(genomes), -1)
+
+        population = ArrayPopulation(self.representation.toMatrix(self.create_population(seeding=seeding)))
+        _, elites, logbook = eaArrayElitism(
+            population, self.problem.getPopulationCosts,
+            cxpb=self.config["p_crossover"],
+            mutpb=self.config["p_mutation"],
+            indpb=1.0 / len(self.problem),
+            ngen=self.config["max_generations"],
+            elite_size=self.config["hall_of_fame_size"],
+            rng=self.rng,
+            repair=repair,
+            stopping=self._early_stopping(),
+            verbose=self.config["verbose"]
         )
+        return elites.genomes[0].tolist(), int(elites.fitness[0]), logbook
+
+    def _unweighted_best(self, elites):
+        """
+        Picks the elite with the lowest unweighted cost. With the adaptive penalty the
+        weighted fitness ranks the elites, but the unweighted cost picks the result.
+
+        Parameters:
+        - elites (list): Genomes of the final hall of fame.
+
+        Returns:
+        - tuple: The chosen genome and its unweighted cost.
+        """
+        costs = self.problem.getPopulationCosts(self.representation.toMatrix(elites))
+        return elites[int(np.argmin(costs))], int(costs.min())
+
+    def run_genetic_algorithm(self, seeding=None):
+        """
+        Executes the genetic algorithm and returns the best solution.
+
+        Parameters:
+        - seeding (str): Seeding strategy of the initial population, defaults to the
+          configured "seeding".
+
+        Returns:
+        - best (list): The best solution found by the genetic algorithm, as a flat binary schedule.
+        """
+        if self.config["islands"] > 1:
+            config = {**self.config, "seeding": seeding or self.config["seeding"]}
+            islands = IslandModel(self.problem, config)
+            best_genome, best_cost, logbook = islands.run()
+            if self.adaptive_penalty is not None:
+                best_genome, best_cost = self._unweighted_best([genome for genome, _ in islands.elites])
+        elif self.config["population"] == "array":
+            best_genome, best_cost, logbook = self.evolve_array(seeding)
+        elif self.config["population"] != "list":
+            raise ValueError(f"Unknown population storage '{self.config['population']}'.")
+        else:
+            population = self.create_population(seeding=seeding)
+            hof = EliteArchive(self.config["hall_of_fame_size"])
+            population, logbook = self.evolve(population, hof, self.config["max_generations"])
+            best_genome, best_cost = hof.items[0], hof.items[0].fitness.values[0]
+            if self.adaptive_penalty is not None:
+                best_genome, best_cost = self._unweighted_best(hof.items)
 
-        best = hof.items[0]
+        self.logbook = logbook
+        best = self.representation.decode(best_genome)
+        if self.config["polish"]:
+            best, best_cost = self.polish(best, best_cost)
         logging.info("-- Best Individual = %s", best)
-        logging.info("-- Best Fitness = %s", best.fitness.values[0])
+        logging.info("-- Best Fitness = %s", best_cost)
         self.problem.printScheduleInfo(best)
 
         # # Plot fitness trends
@@ -115,6 +486,197 @@ class SolutionService:
         
         return best
 
+    def polish(self, schedule, cost):
+        """
+        Hill-climbs a schedule with the configured "polish" strategy and records the cost
+        it removed as "polished" (and the time taken as "polish_ms") in the last record
+        of the logbook.
+
+        Parameters:
+        - schedule (list): Flat binary schedule to polish.
+        - cost (float): Cost of the schedule.
+
+        Returns:
+        - tuple: The polished schedule and its cost.
+        """
+        start = time.perf_counter()
+        polished, polished_cost, _ = hillClimb(
+            self.problem, schedule, self.rng, strategy=self.config["polish"],
+            max_moves=self.config["polish_moves"], time_limit_ms=self.config["polish_ms"]
+        )
+        if self.logbook is not None and len(self.logbook):
+            self.logbook.header = list(self.logbook.header or []) + ["polished", "polish_ms"]
+            self.logbook[-1]["polished"] = cost - polished_cost
+            self.logbook[-1]["polish_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        logging.info("-- Polishing removed cost %s", cost - polished_cost)
+        return polished, polished_cost
+
+    def run_local_search(self, method, initial=None):
+        """
+        Runs a single-trajectory local search.
+
+        Parameters:
+        - method (str): "sa" for simulated annealing or "tabu" for tabu search.
+        - initial (list): Flat schedule to start from, defaults to a greedy seed schedule.
+
+        Returns:
+        - best (list): The best solution found, as a flat binary schedule.
+        """
+        if initial is None:
+            initial = seedPopulation(self.problem, 1, self.rng)[0].ravel().tolist()
+        if method == "sa":
+            best, best_cost, logbook = simulatedAnnealing(
+                self.problem, initial, self.rng,
+                max_moves=self.config["local_search_moves"],
+                time_limit=self.config["time_limit"],
+                progress=self.progress
+            )
+        elif method == "tabu":
+            best, best_cost, logbook = tabuSearch(
+                self.problem, initial, self.rng,
+                max_iterations=self.config["tabu_iterations"],
+                tenure=self.config["tabu_tenure"],
+                time_limit=self.config["time_limit"],
+                progress=self.progress
+            )
+        else:
+            raise ValueError(f"Unknown local search method '{method}'.")
+
+        self.logbook = logbook
+        logging.info("-- Best Individual = %s", best)
+        logging.info("-- Best Fitness = %s", best_cost)
+        self.problem.printScheduleInfo(best)
+        return best
+
+    def _solve_flow(self, noise=0.0):
+        """
+        Solves the min-cost flow relaxation and returns its flat schedule.
+        """
+        return solveCoverageFlow(self.problem, weekend_cost=self.config["weekend_cost"], noise=noise, rng=self.rng)
+
+    def run_flow(self):
+        """
+        Builds a schedule from the min-cost flow relaxation. When it still violates
+        constraints the relaxation misses (e.g. consecutive shifts), it is handed to the
+        "flow_fallback" engine: "sa" and "tabu" start from it, "ga" seeds its population
+        with it, and None returns it as is.
+
+        Returns:
+        - best (list): The best solution found, as a flat binary schedule.
+        """
+        schedule = self._solve_flow()
+        cost = self.problem.getCost(schedule)
+        logging.info("-- Flow schedule cost = %s", cost)
+        fallback = self.config["flow_fallback"]
+        if cost == 0 or fallback is None:
+            self.logbook = None
+            return schedule
+        if fallback in ("sa", "tabu"):
+            return self.run_local_search(fallback, initial=schedule)
+        if fallback == "ga":
+            return self.run_genetic_algorithm(seeding="flow")
+        raise ValueError(f"Unknown flow fallback engine '{fallback}'.")
+
+    def run_exact(self):
+        """
+        Solves the problem exactly as an integer program, within "exact_time_limit" seconds.
+        The logbook reports the incumbent cost, the proven lower bound and the relative gap;
+        a zero gap means no schedule can do better.
+
+        Returns:
+        - best (list): The incumbent solution, as a flat binary schedule.
+        """
+        best, best_cost, logbook = solveExact(
+            self.problem, time_limit=self.config["exact_time_limit"], mip_rel_gap=self.config["exact_mip_gap"]
+        )
+        self.logbook = logbook
+        logging.info("-- Best Fitness = %s (lower bound %s, gap %.4f)", best_cost, logbook[-1]["bound"], logbook[-1]["gap"])
+        self.problem.printScheduleInfo(best)
+        return best
+
+    def run_multi_objective(self):
+        """
+        Runs NSGA-II with the hard constraint cost, weekend fairness (weekend shifts beyond
+        two per doctor) and rest spacing (shifts with a single day off between them) as
+        separate objectives.
+
+        Returns:
+        - list: The non-dominated front as dicts with the point's "id" (its position), the
+          flat "schedule" and the value of each objective, sorted by hard cost; also kept
+          as ``pareto_front``. With a fixed seed and no time limit, the same problem gives
+          the same front and ids.
+        """
+        schedules, objectives, logbook = solveParetoFront(
+            self.problem, self.rng,
+            population_size=self.config["pareto_population_size"],
+            generations=self.config["pareto_generations"],
+            cxpb=self.config["p_crossover"],
+            mutpb=self.config["p_mutation"],
+            random_fraction=self.config["seeding_random_fraction"],
+            repair=self.config["repair"],
+            time_limit=self.config["time_limit"]
+        )
+        self.logbook = logbook
+        self.pareto_front = [
+            {"id": point, "schedule": schedule, **dict(zip(OBJECTIVES, values))}
+            for point, (schedule, values) in enumerate(zip(schedules, objectives.tolist()))
+        ]
+        logging.info("-- Pareto front (%s) = %s", ", ".join(OBJECTIVES), objectives.tolist())
+        return self.pareto_front
+
+    def run_portfolio(self):
+        """
+        Races independent solves on a process pool: every engine in "portfolio_engines"
+        with "portfolio_seeds" consecutive seeds from "random_seed", so each member draws
+        from its own generators. Returns the best schedule reported by the deadline, or
+        the first one with zero cost, and terminates the members still running.
+
+        Returns:
+        - best (list): The best solution found, as a flat binary schedule.
+        """
+        if "portfolio" in self.config["portfolio_engines"]:
+            raise ValueError("A portfolio cannot contain the portfolio engine.")
+        seeds = range(self.config["random_seed"], self.config["random_seed"] + self.config["portfolio_seeds"])
+        members = [(engine, seed) for seed in seeds for engine in self.config["portfolio_engines"]]
+        best, best_cost, logbook = Portfolio(
+            self.problem, self.config, members,
+            deadline=self.config["portfolio_deadline"], workers=self.config["portfolio_workers"]
+        ).run()
+        self.logbook = logbook
+        logging.info("-- Best Individual = %s", best)
+        logging.info("-- Best Fitness = %s", best_cost)
+        self.problem.printScheduleInfo(best)
+        return best
+
+    def solve(self, engine=None):
+        """
+        Solves the problem with the requested engine.
+
+        Parameters:
+        - engine (str): "ga", "sa", "tabu", "flow", "exact", "nsga2" or "portfolio";
+          defaults to the configured engine. "nsga2" returns the front schedule with the lowest hard cost,
+          then the fewest soft violations, and keeps the whole front as ``pareto_front``.
+
+        Returns:
+        - best (list): The best solution found, as a flat binary schedule.
+        """
+        engine = engine or self.config["engine"]
+        if engine == "ga":
+            return self.run_genetic_algorithm()
+        if engine in ("sa", "tabu"):
+            return self.run_local_search(engine)
+        if engine == "flow":
+            return self.run_flow()
+        if engine == "exact":
+            return self.run_exact()
+        if engine == "nsga2":
+            front = self.run_multi_objective()
+            best = min(front, key=lambda point: (point["hard"], point["weekend"] + point["rest"]))
+            return best["schedule"]
+        if engine == "portfolio":
+            return self.run_portfolio()
+        raise ValueError(f"Unknown solver engine '{engine}'.")
+
     def save_solution_to_db(self, session, month, year, solution, doctor_preferences):
         """
         Saves the generated solution to the database using the repository layer.
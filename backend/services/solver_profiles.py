@@ -0,0 +1,178 @@
+import json
+import math
+import os
+import time
+
+import numpy as np
+
+# Profile file written by dev_utils/tune_solver_profiles.py and read by SolutionService
+SOLVER_PROFILES_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'config', 'solver_profiles.json'))
+
+# Genetic algorithm settings searched by the tuner and applied from a profile
+SEARCH_SPACE = {
+    "population_size": [100, 200, 400, 900],
+    "hall_of_fame_size": [0.05, 0.1, 0.25, 0.5],
+    "max_generations": [10, 20, 40],
+    "p_crossover": [0.6, 0.8, 0.9],
+    "p_mutation": [0.2, 0.3, 0.5, 0.8],
+}
+
+# Change in availability density worth as much as doubling the doctors or the days
+DENSITY_SCALE = 0.1
+
+# Profiles already read, by file path, with the modification time they were read at
+_loaded_profiles = {}
+
+
+def problemFeatures(problem):
+    """
+    Returns the profile key of a scheduling problem.
+
+    Returns:
+    - tuple: (doctors, days, availability density), the density being the share of
+      (doctor, day) cells not requested off.
+    """
+    return len(problem.doctors), problem.num_days, round(1.0 - float(problem.unavailableArray.mean()), 2)
+
+
+def sampleSettings(rng, count):
+    """
+    Draws distinct settings from SEARCH_SPACE. The hall of fame is drawn as a share of the
+    population and stored as a size.
+
+    Parameters:
+    - rng (np.random.Generator): Random number generator.
+    - count (int): Number of settings, capped at the size of the search space.
+
+    Returns:
+    - list: Settings dicts with SolutionService config keys.
+    """
+    total = math.prod(len(values) for values in SEARCH_SPACE.values())
+    samples = []
+    for index in rng.permutation(total)[:count].tolist():
+        settings = {}
+        for key, values in SEARCH_SPACE.items():
+            index, position = divmod(index, len(values))
+            settings[key] = values[position]
+        settings["hall_of_fame_size"] = max(1, int(settings["population_size"] * settings["hall_of_fame_size"]))
+        samples.append(settings)
+    return samples
+
+
+def successiveHalving(candidates, evaluate, min_budget=1, rounds=3, eta=2):
+    """
+    Successive halving: every round scores the surviving candidates with the round's
+    budget and keeps the best 1/eta of them; the budget grows by eta each round.
+
+    Parameters:
+    - candidates (list): Candidate settings.
+    - evaluate (callable): evaluate(candidate, budget) returning a sortable score, lower
+      being better.
+    - min_budget (int): Budget of the first round.
+    - rounds (int): Maximum number of rounds.
+    - eta (int): Elimination rate.
+
+    Returns:
+    - tuple: The best candidate and its score in the last round it was scored.
+    """
+    budget = min_budget
+    for round_index in range(rounds):
+        scores = [evaluate(candidate, budget) for candidate in candidates]
+        order = sorted(range(len(candidates)), key=scores.__getitem__)
+        candidates, scores = [candidates[index] for index in order], [scores[index] for index in order]
+        if len(candidates) == 1 or round_index == rounds - 1:
+            break
+        candidates = candidates[:max(1, len(candidates) // eta)]
+        budget *= eta
+    return candidates[0], scores[0]
+
+
+def scoreSettings(problems, settings, solve):
+    """
+    Runs a seeded solve per problem and returns the mean final cost and mean seconds,
+    compared cost first so that ties at the same cost go to the faster settings.
+
+    Parameters:
+    - problems (list): Scheduling problems to solve.
+    - settings (dict): SolutionService config overrides.
+    - solve (callable): solve(problem, config) returning a flat schedule.
+    """
+    costs, seconds = [], []
+    for seed, problem in enumerate(problems):
+        start = time.perf_counter()
+        best = solve(problem, {**settings, "random_seed": seed})
+        seconds.append(time.perf_counter() - start)
+        costs.append(problem.getCost(best))
+    return float(np.mean(costs)), round(float(np.mean(seconds)), 3)
+
+
+def tuneProfile(problems, solve, rng, candidates=16, rounds=3, eta=2):
+    """
+    Tunes the settings for one (doctors, days, density) class of problems by successive
+    halving over sampled settings, with the number of problems solved as the budget.
+
+    Parameters:
+    - problems (list): Problems of the class; the last round solves eta ** (rounds - 1)
+      of them, so at least that many are needed.
+    - solve (callable): solve(problem, config) returning a flat schedule.
+    - rng (np.random.Generator): Random number generator used to sample settings.
+    - candidates (int): Settings sampled for the first round.
+
+    Returns:
+    - dict: A profile with the class key, the best settings and their score.
+    """
+    doctors, days, density = problemFeatures(problems[0])
+    settings, (cost, seconds) = successiveHalving(
+        sampleSettings(rng, candidates),
+        lambda candidate, budget: scoreSettings(problems[:budget], candidate, solve),
+        rounds=rounds, eta=eta
+    )
+    return {
+        "doctors": doctors, "days": days, "availability": density,
+        "settings": settings, "cost": cost, "seconds": seconds,
+    }
+
+
+def loadProfiles(path=SOLVER_PROFILES_PATH):
+    """
+    Reads a profile file, returning an empty list when it does not exist. A file is read
+    once and then served from memory until its modification time changes.
+    """
+    if not path or not os.path.exists(path):
+        return []
+    path = os.path.abspath(path)
+    modified = os.path.getmtime(path)
+    cached = _loaded_profiles.get(path)
+    if cached is None or cached[0] != modified:
+        with open(path, encoding="utf-8") as handle:
+            cached = _loaded_profiles[path] = (modified, json.load(handle)["profiles"])
+    return cached[1]
+
+
+def saveProfiles(profiles, path=SOLVER_PROFILES_PATH):
+    """
+    Writes profiles, as produced by the tuner, to a JSON profile file.
+    """
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump({"profiles": profiles}, handle, indent=2)
+        handle.write("\n")
+
+
+def selectProfile(profiles, features):
+    """
+    Returns the settings of the profile closest to a problem's (doctors, days, density):
+    doctors and days are compared on a log scale, the density in steps of DENSITY_SCALE.
+
+    Returns:
+    - dict: SolutionService config overrides, or None when there are no profiles.
+    """
+    if not profiles:
+        return None
+    doctors, days, density = features
+
+    def distance(profile):
+        return (
+            abs(math.log2(profile["doctors"] / doctors)) + abs(math.log2(profile["days"] / days)) +
+            abs(profile["availability"] - density) / DENSITY_SCALE
+        )
+    return dict(min(profiles, key=distance)["settings"])
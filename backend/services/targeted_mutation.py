@@ -0,0 +1,169 @@
+import numpy as np
+
+from services.incremental_evaluator import IncrementalEvaluator
+from services.local_search import applyMove
+
+
+def _leastLoaded(evaluator, candidates, rng):
+    """
+    Returns the candidate doctor with the lowest monthly total, breaking ties at random.
+    """
+    totals = np.asarray(evaluator.doctorTotals)[candidates]
+    return int(candidates[np.argmin(totals + rng.random(len(candidates)))])
+
+
+def _freeDoctors(evaluator, day):
+    """
+    Returns the doctors who are available and off duty on a day, and not working either
+    neighbouring day.
+    """
+    matrix = evaluator.matrix
+    free = (matrix[:, day] == 0) & ~evaluator.problem.unavailableArray[:, day]
+    if day > 0:
+        free &= matrix[:, day - 1] == 0
+    if day < matrix.shape[1] - 1:
+        free &= matrix[:, day + 1] == 0
+    return np.flatnonzero(free)
+
+
+def overloadMove(evaluator, rng):
+    """
+    Hands a shift of the most loaded doctor to the least loaded free doctor on the same day.
+
+    Returns:
+    - tuple: A swap move, or None when no doctor can take the shift.
+    """
+    totals = np.asarray(evaluator.doctorTotals)
+    working = np.flatnonzero(totals)
+    if not working.size:
+        return None
+    doctor = int(working[np.argmax(totals[working] + rng.random(working.size))])
+    days = np.flatnonzero(evaluator.matrix[doctor])
+    for day in rng.permutation(days).tolist():
+        candidates = _freeDoctors(evaluator, day)
+        candidates = candidates[totals[candidates] < totals[doctor] - 1]
+        if candidates.size:
+            return "swap", ((doctor, day), (_leastLoaded(evaluator, candidates, rng), day))
+    return None
+
+
+def restMove(evaluator, rng):
+    """
+    Moves one shift of a random doctor to an available day away from the doctor's other
+    shifts, preferring days below minShifts and never filling a day beyond maxShifts.
+
+    Returns:
+    - tuple: A swap move, or None when the doctor has no such day.
+    """
+    problem = evaluator.problem
+    matrix = evaluator.matrix
+    working = np.flatnonzero(np.asarray(evaluator.doctorTotals))
+    if not working.size:
+        return None
+    doctor = int(rng.choice(working))
+    source = int(rng.choice(np.flatnonzero(matrix[doctor])))
+    row = matrix[doctor].copy()
+    row[source] = 0
+    busy = row.astype(bool)
+    busy[1:] |= row[:-1].astype(bool)
+    busy[:-1] |= row[1:].astype(bool)
+    coverage = np.asarray(evaluator.dayCoverage)
+    targets = np.flatnonzero(~busy & ~problem.unavailableArray[doctor] & (coverage < problem.shiftMaxArray))
+    targets = targets[targets != source]
+    if not targets.size:
+        return None
+    short = targets[coverage[targets] < problem.shiftMinArray[targets]]
+    target = int(rng.choice(short if short.size else targets))
+    return "swap", ((doctor, source), (doctor, target))
+
+
+def consecutiveMove(evaluator, rng):
+    """
+    Breaks a pair of shifts on consecutive days by handing one of them to the least loaded
+    free doctor, or by dropping it when the day stays above minShifts.
+
+    Returns:
+    - tuple: A swap or flip move, or None when the schedule has no consecutive shifts.
+    """
+    matrix = evaluator.matrix
+    pairs = np.argwhere(matrix[:, 1:] & matrix[:, :-1])
+    if not len(pairs):
+        return None
+    doctor, day = pairs[rng.integers(len(pairs))].tolist()
+    day += int(rng.integers(2))
+    candidates = _freeDoctors(evaluator, day)
+    if candidates.size:
+        return "swap", ((doctor, day), (_leastLoaded(evaluator, candidates, rng), day))
+    if evaluator.dayCoverage[day] > evaluator.problem.shiftMinArray[day]:
+        return "flip", (doctor, day)
+    return None
+
+
+TARGETED_OPERATORS = {
+    "overload": overloadMove,
+    "rest": restMove,
+    "consecutive": consecutiveMove,
+}
+
+
+class AdaptiveMutation:
+    """
+    Mutation that applies one of the constraint-targeted moves, chosen with probabilities
+    that follow each operator's recent success rate (the share of its moves that lowered
+    the cost). Also acts as a generation hook that updates and reports the probabilities.
+    """
+
+    def __init__(self, problem, representation, rng, min_probability=0.1, decay=0.7):
+        """
+        Initializes the operator.
+
+        Parameters:
+        - problem (DoctorSchedulingProblem): The scheduling problem instance.
+        - representation: Genome representation used to convert individuals to matrices.
+        - rng (np.random.Generator): Random number generator.
+        - min_probability (float): Lower bound on the probability of every operator.
+        - decay (float): Weight of the previous success rate when a generation is folded in.
+        """
+        self.problem = problem
+        self.representation = representation
+        self.rng = rng
+        self.names = list(TARGETED_OPERATORS)
+        self.fields = [f"p_{name}" for name in self.names]
+        self.min_probability = min_probability
+        self.decay = decay
+        self.rates = np.full(len(self.names), 0.5)
+        self.probabilities = np.full(len(self.names), 1.0 / len(self.names))
+        self.trials = np.zeros(len(self.names), dtype=np.int64)
+        self.successes = np.zeros(len(self.names), dtype=np.int64)
+
+    def mutate(self, individual):
+        """
+        Applies one targeted move to the individual in place. When the individual still
+        carries a valid fitness, the new cost is stored as ``fitnessHint``.
+        """
+        evaluator = IncrementalEvaluator(self.problem, self.representation.decode(individual))
+        index = int(self.rng.choice(len(self.names), p=self.probabilities))
+        move = TARGETED_OPERATORS[self.names[index]](evaluator, self.rng)
+        self.trials[index] += 1
+        delta = 0
+        if move is not None:
+            delta = applyMove(evaluator, move)
+            self.successes[index] += delta < 0
+            individual[:] = self.representation.fromMatrix(evaluator.matrix[np.newaxis])[0]
+        if individual.fitness.valid:
+            individual.fitnessHint = (individual.fitness.values[0] + delta,)
+        return individual,
+
+    def __call__(self, gen, population, halloffame):
+        """
+        Generation hook: folds the generation's success rates into the operator
+        probabilities and reports them.
+        """
+        tried = self.trials > 0
+        current = np.divide(self.successes, self.trials, out=np.zeros(len(self.names)), where=tried)
+        self.rates[tried] = self.decay * self.rates[tried] + (1 - self.decay) * current[tried]
+        share = self.rates / self.rates.sum() if self.rates.sum() else np.full(len(self.names), 1.0 / len(self.names))
+        self.probabilities = self.min_probability + (1 - len(self.names) * self.min_probability) * share
+        self.trials[:] = 0
+        self.successes[:] = 0
+        return {field: round(float(probability), 3) for field, probability in zip(self.fields, self.probabilities)}
@@ -1,8 +1,10 @@
+import numpy as np
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from database.models import Base, Doctor, Schedule, Shift
 from database.database_setup import Session
+from services.doctor_scheduling_service import DoctorSchedulingProblem
 
 # Setup an in-memory SQLite database for testing
 @pytest.fixture(scope='function')
@@ -13,3 +15,42 @@ def test_session():
     session = TestingSession()
     yield session
     session.close()
+
+
+@pytest.fixture
+def problem():
+    """Fixture for the 3-doctor, 7-day DoctorSchedulingProblem shared by the solver tests.
+    Test modules that need another problem define their own problem fixture."""
+    return DoctorSchedulingProblem(
+        hardConstraintPenalty=100,
+        listOfDoctors=["Dr. Alice", "Dr. Bob", "Dr. Carol"],
+        listOfDoctorPreferce=[[1, 1, 0, 1, 1, 0, 1], [1, 0, 1, 0, 1, 1, 0], [1, 1, 1, 1, 0, 1, 1]],
+        doctorshiftMax=[2, 2, 2, 2, 2, 2, 2],
+        doctorshiftMin=[1, 1, 1, 1, 1, 1, 1],
+        weekendPositionArray=[0, 0, 0, 0, 1, 1, 0],
+        doctorExperience=[1, 1, 1],
+        num_days=7
+    )
+
+
+@pytest.fixture
+def penalty():
+    """Hard constraint penalty of month_problem; a test module overrides this fixture to change it."""
+    return 100
+
+
+@pytest.fixture
+def month_problem(penalty):
+    """Fixture for a 10-doctor, 28-day problem with some requested days off."""
+    rng = np.random.default_rng(4)
+    preferences = (rng.random((10, 28)) > 0.15).astype(int).tolist()
+    return DoctorSchedulingProblem(
+        hardConstraintPenalty=penalty,
+        listOfDoctors=[f"Dr. {index}" for index in range(10)],
+        listOfDoctorPreferce=preferences,
+        doctorshiftMax=[3] * 28,
+        doctorshiftMin=[2] * 28,
+        weekendPositionArray=[0] * 28,
+        doctorExperience=[1] * 10,
+        num_days=28
+    )
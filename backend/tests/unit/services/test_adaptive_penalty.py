@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from deap import base, creator, tools
+from services.adaptive_penalty import AdaptivePenalty
+from services.fitness_cache import FitnessCache
+from services.genome_representations import BinaryRepresentation
+
+@pytest.fixture
+def representation(problem):
+    creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
+    representation = BinaryRepresentation(problem)
+    representation.register(base.Toolbox(), indpb=0.1)
+    return representation
+
+def test_weighted_costs_default_to_unweighted(problem):
+    """Test that unit weights reproduce the plain population costs."""
+    population = np.random.default_rng(0).integers(0, 2, size=(10, 3, 7))
+    assert np.allclose(problem.getPopulationCosts(population, np.ones(4)), problem.getPopulationCosts(population))
+
+def test_weights_follow_violated_constraints(problem, representation):
+    """Test that a constraint violated across the population gains weight and the run is re-scored."""
+    # Every doctor works every available day: coverage and monthly totals are off, no day off is taken
+    schedule = (~problem.unavailableArray).astype(int).ravel().tolist()
+    population = [creator.Individual(schedule) for _ in range(4)]
+    for individual in population:
+        individual.fitness.values = (0,)
+    hof = tools.HallOfFame(2)
+    hof.update(population)
+    cache = FitnessCache(maxsize=10)
+    cache.store([b"stale"], [1])
+    penalty = AdaptivePenalty(problem, representation, cache)
+
+    record = penalty(1, population, hof)
+
+    assert record["w_preference"] == 1.0
+    assert record["w_consecutive"] > 1.0
+    assert cache.lookup([b"stale"]) == [None]
+    expected = penalty.costs(population)[0]
+    assert expected > problem.getPopulationCosts([schedule])[0]
+    assert all(individual.fitness.values[0] == expected for individual in population)
+    assert hof[0].fitness.values[0] == expected
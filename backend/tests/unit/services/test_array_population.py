@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from services.array_population import (
+    ArrayPopulation, cxTwoPointArray, eaArrayElitism, mutFlipBitArray, selTournamentArray
+)
+from services.genetic_algorithm import EarlyStopping
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+def test_take_copies_rows_and_fitness(rng):
+    """Test that cloning by index copies genomes and fitness without sharing memory."""
+    population = ArrayPopulation(rng.integers(0, 2, size=(6, 3, 4)), fitness=np.arange(6.0))
+    clone = population.take([5, 5, 0])
+    clone.genomes[0, 0] ^= 1
+    assert clone.genomes.shape == (3, 12)
+    assert clone.fitness.tolist() == [5.0, 5.0, 0.0]
+    assert np.array_equal(clone.genomes[1], population.genomes[5])
+    assert not np.array_equal(clone.genomes[0], population.genomes[5])
+
+def test_best_skips_duplicate_genomes():
+    """Test that the elites are the best individuals with distinct genomes."""
+    population = ArrayPopulation([[0, 1], [0, 1], [1, 1], [0, 0]], fitness=[1.0, 1.0, 3.0, 2.0])
+    assert population.best(3).tolist() == [0, 3, 2]
+
+def test_tournament_picks_the_lowest_fitness(rng):
+    """Test that every winner beats the other contestants of its tournament."""
+    fitness = rng.random(50)
+    winners = selTournamentArray(fitness, 1000, 50, rng)
+    assert np.mean(winners == np.argmin(fitness)) > 0.5
+
+def test_variation_operators(rng):
+    """Test that crossover only exchanges genes within pairs and mutation respects mutpb."""
+    genomes = rng.integers(0, 2, size=(20, 30), dtype=np.uint8)
+    parents = genomes.copy()
+    cxTwoPointArray(genomes, 1.0, rng)
+    assert np.array_equal(genomes[0::2] + genomes[1::2], parents[0::2] + parents[1::2])
+    assert not np.array_equal(genomes, parents)
+
+    crossed = genomes.copy()
+    mutFlipBitArray(genomes, 0.0, 1.0, rng)
+    assert np.array_equal(genomes, crossed)
+    mutFlipBitArray(genomes, 1.0, 1.0, rng)
+    assert np.array_equal(genomes, 1 - crossed)
+
+def test_elitist_run_keeps_improving_and_evaluates_only_changed_rows(rng):
+    """Test that the elites never get worse and unchanged offspring keep their fitness."""
+    evaluations = []
+    def evaluate(genomes):
+        evaluations.append(len(genomes))
+        return genomes.sum(axis=1).astype(float)
+    population = ArrayPopulation(rng.integers(0, 2, size=(40, 20)))
+    population, elites, logbook = eaArrayElitism(
+        population, evaluate, cxpb=0.5, mutpb=0.2, indpb=0.05, ngen=30, elite_size=4, rng=rng,
+        stopping=EarlyStopping(target_cost=0)
+    )
+    best = logbook.select("min")
+    assert all(later <= earlier for earlier, later in zip(best, best[1:]))
+    assert logbook.select("nevals") == evaluations
+    assert max(evaluations[1:]) < 36
+    assert len(population) == 40
+    assert elites.fitness[0] == best[-1] == elites.genomes[0].sum()
+    assert logbook[-1]["stop"] in ("target", "max_generations")
@@ -0,0 +1,53 @@
+import pytest
+from services.clinic_request_precheck import check_clinic_request
+from services.monthly_clinic_request import create_synthetic_clinic_request
+
+def request(preferences, minShifts, maxShifts=None):
+    """Builds a minimal clinic request for the pre-check."""
+    return {
+        "doctorNames": [f"Dr. {index}" for index in range(len(preferences))],
+        "doctorPreference": preferences,
+        "minShifts": minShifts,
+        "maxShifts": maxShifts or [max(minShifts)] * len(minShifts),
+    }
+
+def test_feasible_request_passes():
+    """Test that a well-staffed synthetic request has no errors or warnings."""
+    diagnostic = check_clinic_request(create_synthetic_clinic_request(12, 31, availability=0.85, seed=1), 5, 7)
+    assert diagnostic == {"feasible": True, "errors": [], "warnings": []}
+
+def test_request_without_doctors_is_reported():
+    """Test that a request with no doctors is infeasible instead of failing on the reshape."""
+    diagnostic = check_clinic_request(request([], [1, 2, 1], [2, 2, 2]), 5, 7)
+    assert not diagnostic["feasible"]
+    assert [issue["code"] for issue in diagnostic["errors"]] == ["no_doctors"]
+    assert diagnostic["errors"][0]["required"] == 4
+
+def test_understaffed_day_is_reported():
+    """Test that a day with fewer available doctors than minShifts is listed."""
+    diagnostic = check_clinic_request(request([[1, 1, 0], [1, 0, 1]], [1, 2, 1]), 0, 3)
+    assert not diagnostic["feasible"]
+    issue = diagnostic["errors"][0]
+    assert issue["code"] == "day_understaffed"
+    assert issue["days"] == [{"day": 2, "available": 1, "required": 2}]
+
+def test_capacity_below_coverage_is_reported():
+    """Test that the total doctor capacity is compared with the required coverage."""
+    diagnostic = check_clinic_request(request([[1, 1, 1], [1, 1, 1]], [2, 2, 2]), 0, 2)
+    assert [issue["code"] for issue in diagnostic["errors"]] == ["capacity"]
+    assert diagnostic["errors"][0]["available"] == 4
+
+def test_flow_bound_catches_what_counts_miss():
+    """Test that coverage blocked by who is available where is found by the flow bound."""
+    preferences = [[1, 0, 0], [1, 0, 0], [0, 1, 1]]
+    diagnostic = check_clinic_request(request(preferences, [1, 1, 1]), 0, 1)
+    assert [issue["code"] for issue in diagnostic["errors"]] == ["coverage_flow"]
+    assert diagnostic["errors"][0]["available"] == 2
+
+def test_doctor_rules_are_warnings():
+    """Test that unreachable monthly minimums and forced consecutive shifts only warn."""
+    diagnostic = check_clinic_request(request([[1, 1, 1], [0, 0, 0]], [1, 1, 1]), 2, 3)
+    assert diagnostic["feasible"]
+    codes = [issue["code"] for issue in diagnostic["warnings"]]
+    assert codes == ["doctor_monthly_minimum", "adjacent_days", "rest_capacity"]
+    assert diagnostic["warnings"][0]["doctors"] == [{"doctor": "Dr. 1", "available": 0, "required": 2}]
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from services.doctor_scheduling_service import DoctorSchedulingProblem
 
 @pytest.fixture
@@ -73,3 +74,28 @@ def test_cost_calculation(problem):
     schedule = [1, 1, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 1, 1]
     cost = problem.getCost(schedule)
     assert cost > 0
+
+def test_population_costs_match_get_cost(problem):
+    """Test that the vectorized population evaluator agrees with getCost."""
+    rng = np.random.default_rng(0)
+    population = rng.integers(0, 2, size=(50, len(problem))).tolist()
+    costs = problem.getPopulationCosts(population)
+    assert costs.tolist() == [problem.getCost(schedule) for schedule in population]
+
+def test_population_violations_per_constraint(problem):
+    """Test the per-constraint breakdown of the vectorized evaluator."""
+    schedule = [1, 1, 0, 0, 1, 1, 0, 1, 1, 0, 0, 1, 1, 1]
+    violations = problem.getPopulationViolations([schedule])
+    doctor_shifts = problem.getDoctorWeekShifts(schedule)
+    assert violations.shape == (1, 4)
+    assert violations[0, 0] == problem.doctorCountShiftPreferenceViolations(doctor_shifts)
+    assert violations[0, 1] == problem.doctorsCountShiftsPerDayViolation(doctor_shifts)
+    assert violations[0, 2] == problem.doctorCountShiftsPerWeekViolations(doctor_shifts)
+    assert violations[0, 3] == problem.doctorCountConsecutiveShiftViolations(doctor_shifts)
+
+def test_population_soft_violations(problem):
+    """Test the weekend and rest spacing counts of the prototype's soft constraints."""
+    schedule = [1, 0, 1, 0, 1, 1, 0, 0, 1, 0, 1, 0, 1, 0]
+    assert problem.getPopulationSoftViolations([schedule]).tolist() == [[0, 4]]
+    problem.weekendArray[:] = True
+    assert problem.getPopulationSoftViolations([schedule]).tolist() == [[3, 4]]
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+from deap import base, creator, tools
+from services.elite_archive import EliteArchive
+
+@pytest.fixture
+def individual():
+    """Fixture for a list individual with a minimized fitness."""
+    creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
+    creator.create("Individual", list, fitness=creator.FitnessMin)
+
+    def make(genome, cost):
+        ind = creator.Individual(genome)
+        ind.fitness.values = (cost,)
+        return ind
+    return make
+
+def test_matches_deap_hall_of_fame(individual):
+    """Test that the archive keeps the same elites in the same order as HallOfFame."""
+    rng = random.Random(0)
+    archive, hof = EliteArchive(10), tools.HallOfFame(10)
+    for _ in range(30):
+        population = []
+        for _ in range(40):
+            genome = [rng.randint(0, 1) for _ in range(6)]
+            population.append(individual(genome, sum(genome) * 10 + rng.randint(0, 2)))
+        archive.update(population)
+        hof.update(population)
+        assert [(list(ind), ind.fitness.values) for ind in archive.items] == \
+               [(list(ind), ind.fitness.values) for ind in hof.items]
+    assert len(archive) == 10
+    assert archive[0].fitness.values == hof[0].fitness.values
+
+def test_rejects_duplicates_and_stores_copies(individual):
+    """Test that a genome enters once and later changes to the original do not leak in."""
+    archive = EliteArchive(3)
+    original = individual([1, 0, 1], 5)
+    archive.update([original, individual([1, 0, 1], 1), individual([0, 0, 1], 7)])
+    assert [list(ind) for ind in archive.items] == [[1, 0, 1], [0, 0, 1]]
+    original[0] = 0
+    assert list(archive[0]) == [1, 0, 1]
+    assert archive[0] is not original
+
+def test_evicts_the_worst_and_clears(individual):
+    """Test that a better individual replaces the worst elite and that clear empties the archive."""
+    archive = EliteArchive(2)
+    archive.update([individual([0], 3), individual([1], 2)])
+    archive.update([individual([2], 3)])
+    assert [ind.fitness.values[0] for ind in archive] == [2, 3]
+    assert list(archive[1]) == [0]
+    archive.update([individual([3], 1)])
+    assert [list(ind) for ind in archive.items] == [[3], [1]]
+    archive.clear()
+    assert len(archive) == 0 and not archive.items
+    archive.update([individual([0], 4)])
+    assert [list(ind) for ind in archive.items] == [[0]]
@@ -0,0 +1,29 @@
+import itertools
+
+import pytest
+from services.doctor_scheduling_service import DoctorSchedulingProblem
+from services.exact_solver import solveExact
+
+@pytest.fixture
+def problem():
+    """Fixture for a tiny over-constrained problem that can be enumerated exhaustively."""
+    return DoctorSchedulingProblem(
+        hardConstraintPenalty=100,
+        listOfDoctors=["Dr. Alice", "Dr. Bob"],
+        listOfDoctorPreferce=[[1, 0, 1, 1, 1], [1, 1, 0, 1, 0]],
+        doctorshiftMax=[2, 1, 1, 2, 1],
+        doctorshiftMin=[2, 1, 1, 1, 1],
+        weekendPositionArray=[0, 0, 0, 0, 0],
+        doctorExperience=[1, 1],
+        num_days=5
+    )
+
+def test_exact_solver_matches_exhaustive_search(problem):
+    """Test that the exact solver finds the minimum cost and proves it."""
+    schedule, cost, logbook = solveExact(problem, time_limit=10)
+    schedules = [list(bits) for bits in itertools.product([0, 1], repeat=len(problem))]
+    assert cost == problem.getCost(schedule) == min(problem.getPopulationCosts(schedules))
+    assert cost > 0
+    assert logbook[-1]["bound"] == cost
+    assert logbook[-1]["gap"] == 0.0
+    assert logbook[-1]["status"] == "optimal"
@@ -0,0 +1,28 @@
+import numpy as np
+from services.fitness_cache import FitnessCache
+
+def test_lookup_counts_hits_and_misses():
+    """Test that lookups report cached costs and count hits and misses."""
+    cache = FitnessCache(maxsize=10)
+    population = np.array([[[1, 0, 1], [0, 1, 0]], [[0, 0, 1], [1, 1, 0]]], dtype=np.uint8)
+    keys = cache.keys(population)
+    assert cache.lookup(keys) == [None, None]
+    cache.store(keys, [100, 200])
+    assert cache.lookup(keys) == [100, 200]
+    assert cache(1, [], None) == {"hits": 2, "misses": 2}
+    assert cache(2, [], None) == {"hits": 0, "misses": 0}
+
+def test_identical_genomes_share_a_key():
+    """Test that byte-identical genomes map to the same key."""
+    population = np.array([[[1, 0], [0, 1]], [[1, 0], [0, 1]], [[1, 1], [0, 1]]], dtype=np.uint8)
+    keys = FitnessCache.keys(population)
+    assert keys[0] == keys[1]
+    assert keys[0] != keys[2]
+
+def test_least_recently_used_entry_is_evicted():
+    """Test that the cache stays within its bound and drops the oldest entry."""
+    cache = FitnessCache(maxsize=2)
+    cache.store([b"a", b"b"], [1, 2])
+    cache.lookup([b"a"])
+    cache.store([b"c"], [3])
+    assert cache.lookup([b"a", b"b", b"c"]) == [1, None, 3]
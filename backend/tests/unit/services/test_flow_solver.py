@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from services.doctor_scheduling_service import DoctorSchedulingProblem
+from services.flow_solver import solveCoverageFlow
+from services.monthly_clinic_request import create_synthetic_clinic_request
+
+@pytest.fixture
+def problem():
+    """Fixture for a feasible 12-doctor, 31-day synthetic problem."""
+    request = create_synthetic_clinic_request(12, 31, availability=0.85, seed=3)
+    return DoctorSchedulingProblem(
+        hardConstraintPenalty=100,
+        listOfDoctors=request['doctorNames'],
+        listOfDoctorPreferce=request['doctorPreference'],
+        doctorshiftMax=request['maxShifts'],
+        doctorshiftMin=request['minShifts'],
+        weekendPositionArray=request['weekendPositions'],
+        doctorExperience=[1] * 12,
+        num_days=31
+    )
+
+def test_flow_schedule_meets_coverage_and_monthly_bounds(problem):
+    """Test that the flow schedule respects days off, daily coverage and monthly bounds."""
+    schedule = solveCoverageFlow(problem)
+    assert len(schedule) == len(problem)
+    preference, per_day, per_month, _ = problem.getPopulationViolations([schedule])[0]
+    assert (preference, per_day, per_month) == (0, 0, 0)
+
+def test_flow_noise_changes_schedule(problem):
+    """Test that perturbed arc costs yield different schedules of equal coverage."""
+    first = solveCoverageFlow(problem, noise=0.5, rng=np.random.default_rng(0))
+    second = solveCoverageFlow(problem, noise=0.5, rng=np.random.default_rng(1))
+    assert first != second
+    assert problem.getPopulationViolations([first, second])[:, 1].tolist() == [0, 0]
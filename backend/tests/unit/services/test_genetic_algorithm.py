@@ -0,0 +1,55 @@
+import random
+import pytest
+from deap import base, creator, tools
+from services.genetic_algorithm import eaSimpleWithElitism, EarlyStopping
+
+@pytest.fixture
+def toolbox():
+    """Fixture for a OneMax-style toolbox minimising the number of ones."""
+    random.seed(0)
+    creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
+    creator.create("Individual", list, fitness=creator.FitnessMin)
+    toolbox = base.Toolbox()
+    toolbox.register("zeroOrOne", random.randint, 0, 1)
+    toolbox.register("individualCreator", tools.initRepeat, creator.Individual, toolbox.zeroOrOne, 20)
+    toolbox.register("populationCreator", tools.initRepeat, list, toolbox.individualCreator)
+    toolbox.register("evaluate", lambda ind: (sum(ind),))
+    toolbox.register("select", tools.selTournament, tournsize=2)
+    toolbox.register("mate", tools.cxTwoPoint)
+    toolbox.register("mutate", tools.mutFlipBit, indpb=0.05)
+    return toolbox
+
+def run(toolbox, ngen=50, **kwargs):
+    population = toolbox.populationCreator(n=40)
+    return eaSimpleWithElitism(population, toolbox, cxpb=0.9, mutpb=0.3, ngen=ngen,
+                               halloffame=tools.HallOfFame(4), verbose=False, **kwargs)
+
+def test_runs_all_generations_without_stopping_rules(toolbox):
+    """Test that the default run records every generation and the stop reason."""
+    _, logbook = run(toolbox, ngen=5)
+    assert len(logbook) == 6
+    assert logbook[-1]["stop"] == "max_generations"
+
+def test_stops_when_target_cost_is_reached(toolbox):
+    """Test that the run ends once the best individual reaches the target."""
+    _, logbook = run(toolbox, stopping=EarlyStopping(target_cost=3))
+    assert logbook[-1]["stop"] == "target"
+    assert len(logbook) < 51
+
+def test_stops_after_stalled_generations(toolbox):
+    """Test that the run ends when the best individual stops improving."""
+    _, logbook = run(toolbox, ngen=500, stopping=EarlyStopping(stall_generations=5))
+    assert logbook[-1]["stop"] == "stall"
+
+def test_hooks_are_recorded(toolbox):
+    """Test that generation hooks add their values to the logbook."""
+    hook = lambda gen, population, halloffame: {"best": halloffame[0].fitness.values[0]}
+    _, logbook = run(toolbox, ngen=3, hooks=[hook])
+    assert len(logbook.select("best")) == 4
+
+def test_hooks_can_set_rates(toolbox):
+    """Test that rates returned by a hook replace cxpb and mutpb from the next generation."""
+    hook = lambda gen, population, halloffame: {"cxpb": 0.0, "mutpb": 0.0}
+    _, logbook = run(toolbox, ngen=3, hooks=[hook])
+    assert logbook.select("nevals")[1:] == [0, 0, 0]
+    assert logbook.select("mutpb") == [0.0] * 4
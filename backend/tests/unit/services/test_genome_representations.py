@@ -0,0 +1,149 @@
+import random
+import numpy as np
+import pytest
+from deap import base, creator, tools
+from services.genome_representations import (
+    REPRESENTATIONS, BitPackedRepresentation, DaySetRepresentation, ReducedRepresentation, crossoverMask,
+    cxTwoPointPacked, mutFlipBitPacked, mutReplaceDoctor, weekIds
+)
+
+@pytest.fixture
+def representation(problem):
+    return BitPackedRepresentation(problem)
+
+def registered(representation, toolbox=None):
+    """Creates the DEAP classes the representation builds individuals from."""
+    creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
+    representation.register(base.Toolbox() if toolbox is None else toolbox, indpb=0.1)
+    return representation
+
+def test_pack_and_decode_round_trip(representation):
+    """Test that packing rows and decoding the masks gives back the flat schedule."""
+    schedule = [1, 0, 1, 1, 0, 0, 1, 0, 1, 0, 0, 1, 1, 0, 1, 1, 1, 0, 0, 0, 1]
+    packed = [representation.pack(schedule[i * 7:(i + 1) * 7]) for i in range(3)]
+    assert representation.decode(packed) == schedule
+    assert representation.toMatrix([packed]).reshape(-1).tolist() == schedule
+
+def test_popcount_evaluation_matches_get_cost(problem, representation):
+    """Test that the popcount kernels agree with the reference cost function."""
+    random.seed(1)
+    population = [[random.getrandbits(7) for _ in range(3)] for _ in range(40)]
+    costs = representation.evaluate(population)
+    assert costs.tolist() == [problem.getCost(representation.decode(ind)) for ind in population]
+
+def test_packed_crossover_matches_flat_two_point(representation):
+    """Test that packed crossover exchanges the same cells as cxTwoPoint on flat genomes."""
+    random.seed(2)
+    for _ in range(20):
+        first = [random.getrandbits(7) for _ in range(3)]
+        second = [random.getrandbits(7) for _ in range(3)]
+        flat_first, flat_second = representation.decode(first), representation.decode(second)
+        state = random.getstate()
+        cxTwoPointPacked(first, second, num_days=7)
+        random.setstate(state)
+        tools.cxTwoPoint(flat_first, flat_second)
+        assert representation.decode(first) == flat_first
+        assert representation.decode(second) == flat_second
+
+def test_packed_mutation_flips_bits(representation):
+    """Test that mutation with indpb=1 flips every cell and indpb=0 flips none."""
+    individual = [0b1010101, 0b0000000, 0b1111111]
+    mutFlipBitPacked(individual, indpb=0.0, num_days=7)
+    assert individual == [0b1010101, 0b0000000, 0b1111111]
+    mutFlipBitPacked(individual, indpb=1.0, num_days=7)
+    assert individual == [0b0101010, 0b1111111, 0b0000000]
+
+def test_reduced_genome_covers_available_cells_only(problem):
+    """Test that reduced genomes expand to schedules without shifts on days off."""
+    reduced = registered(ReducedRepresentation(problem))
+    assert len(reduced.cells) == int((~problem.unavailableArray).sum())
+    random.seed(2)
+    population = [[random.randint(0, 1) for _ in reduced.cells] for _ in range(20)]
+    schedules = reduced.toMatrix(population)
+    assert not (schedules.astype(bool) & problem.unavailableArray).any()
+    assert [list(ind) for ind in reduced.fromMatrix(schedules)] == population
+    assert reduced.evaluate(population).tolist() == [problem.getCost(reduced.decode(ind)) for ind in population]
+
+def test_day_set_converters_round_trip(problem):
+    """Test that day-set individuals convert to matrices and back unchanged."""
+    dayset = registered(DaySetRepresentation(problem))
+    random.seed(3)
+    population = [dayset.randomIndividual() for _ in range(20)]
+    schedules = dayset.toMatrix(population)
+    assert schedules.shape == (20, 3, 7)
+    assert [list(ind) for ind in dayset.fromMatrix(schedules)] == [list(ind) for ind in population]
+    assert dayset.evaluate(population).tolist() == [problem.getCost(dayset.decode(ind)) for ind in population]
+
+def test_day_set_operators_keep_coverage_bounds(problem):
+    """Test that day exchange and doctor replacement never leave the daily size bounds."""
+    dayset = registered(DaySetRepresentation(problem))
+    random.seed(4)
+    population = [dayset.randomIndividual() for _ in range(20)]
+    for first, second in zip(population[::2], population[1::2]):
+        tools.cxTwoPoint(first, second)
+    for individual in population:
+        mutReplaceDoctor(individual, 1.0, 3, dayset.minSizes, dayset.maxSizes)
+        coverage = dayset.toMatrix([individual])[0].sum(axis=0)
+        assert (coverage >= problem.shiftMinArray).all() and (coverage <= problem.shiftMaxArray).all()
+        assert all(len(set(day)) == len(day) for day in individual)
+
+@pytest.mark.parametrize("name", ["binary", "reduced", "dayset"])
+def test_default_mutation_changes_one_gene_per_call(problem, name):
+    """Test that the representation's own indpb mutates about one gene per mutation."""
+    creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
+    toolbox = base.Toolbox()
+    representation = REPRESENTATIONS[name](problem)
+    representation.register(toolbox, indpb=representation.defaultIndpb())
+    random.seed(6)
+    changed = []
+    for _ in range(2000):
+        individual = toolbox.individualCreator()
+        before = list(individual)
+        mutant, = toolbox.mutate(individual)
+        changed.append(sum(old != new for old, new in zip(before, mutant)))
+    assert 0.8 <= sum(changed) / len(changed) <= 1.2
+
+def test_week_ids_start_after_weekends(problem):
+    """Test that a new week starts on the first weekday after a weekend."""
+    assert weekIds(problem).tolist() == [0, 0, 0, 0, 0, 0, 1]
+
+@pytest.mark.parametrize("kind", ["rows", "columns", "weeks"])
+@pytest.mark.parametrize("name", ["binary", "bitpacked", "reduced"])
+def test_matrix_crossover_exchanges_masked_cells(problem, name, kind):
+    """Test that matrix crossovers swap exactly the masked cells between the parents."""
+    toolbox = base.Toolbox()
+    representation = registered(REPRESENTATIONS[name](problem), toolbox)
+    mate = representation.matrixCrossover(kind)
+    random.seed(5)
+    for _ in range(10):
+        first, second = toolbox.individualCreator(), toolbox.individualCreator()
+        before = representation.toMatrix([first, second])
+        state = random.getstate()
+        mask = crossoverMask(kind, 3, representation.weekIds)
+        random.setstate(state)
+        mate(first, second)
+        after = representation.toMatrix([first, second])
+        assert (after[0] == (before[0] & ~mask | before[1] & mask)).all()
+        assert (after[1] == (before[1] & ~mask | before[0] & mask)).all()
+        if kind == "rows":
+            assert (mask == mask[:, :1]).all()
+        if kind == "columns":
+            assert (mask == mask[:1]).all()
+
+@pytest.mark.parametrize("kind", ["rows", "columns"])
+def test_crossover_mask_draws_any_number_of_bits(kind):
+    """Test that row and column masks work beyond 64 doctors or days and match the drawn bits."""
+    week_ids = np.zeros(70, dtype=int)
+    random.seed(7)
+    state = random.getstate()
+    mask = crossoverMask(kind, 70, week_ids)
+    random.setstate(state)
+    bits = random.getrandbits(70)
+    assert mask.shape == (70, 70)
+    line = mask[:, 0] if kind == "rows" else mask[0]
+    assert line.tolist() == [bool(bits >> index & 1) for index in range(70)]
+
+def test_day_set_rejects_row_crossover(problem):
+    """Test that crossovers splitting a day are refused for day-set genomes."""
+    with pytest.raises(ValueError):
+        DaySetRepresentation(problem).matrixCrossover("rows")
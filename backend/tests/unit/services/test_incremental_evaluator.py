@@ -0,0 +1,55 @@
+import random
+import pytest
+from deap import base, creator
+from services.incremental_evaluator import IncrementalEvaluator, flipPositions, mutFlipBitDelta
+
+@pytest.fixture
+def schedule():
+    random.seed(3)
+    return [random.randint(0, 1) for _ in range(21)]
+
+def test_initial_cost_matches_get_cost(problem, schedule):
+    """Test that the evaluator starts from the full cost of the schedule."""
+    evaluator = IncrementalEvaluator(problem, schedule)
+    assert evaluator.cost == problem.getCost(schedule)
+
+def test_flip_delta_matches_full_evaluation(problem, schedule):
+    """Test that every single-cell flip delta equals the re-scored difference."""
+    evaluator = IncrementalEvaluator(problem, schedule)
+    base_cost = problem.getCost(schedule)
+    for doctor in range(3):
+        for day in range(7):
+            flipped = list(schedule)
+            flipped[doctor * 7 + day] ^= 1
+            expected = problem.getCost(flipped) - base_cost
+            assert evaluator.flipDelta(doctor, day) == expected
+
+def test_flip_and_swap_keep_counters_consistent(problem, schedule):
+    """Test that applied moves keep the evaluator in sync with the schedule."""
+    evaluator = IncrementalEvaluator(problem, schedule)
+    evaluator.flip(0, 3)
+    predicted = evaluator.swapDelta((1, 2), (2, 5))
+    delta = evaluator.swap((1, 2), (2, 5))
+    assert predicted == delta
+    assert evaluator.cost == problem.getCost(evaluator.schedule())
+
+def test_mut_flip_bit_delta_sets_fitness_hint(problem, schedule):
+    """Test that mutating an evaluated individual records its new cost as a hint."""
+    creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
+    creator.create("Individual", list, fitness=creator.FitnessMin)
+    individual = creator.Individual(schedule)
+    individual.fitness.values = (problem.getCost(schedule),)
+    random.seed(5)
+    mutant, = mutFlipBitDelta(individual, indpb=0.3, problem=problem)
+    assert mutant.fitnessHint == (problem.getCost(list(mutant)),)
+
+def test_flip_positions_follow_indpb():
+    """Test that geometric skips flip each gene with probability indpb."""
+    random.seed(6)
+    counts = [0] * 50
+    for _ in range(4000):
+        for position in flipPositions(50, 0.1):
+            counts[position] += 1
+    assert all(300 <= count <= 500 for count in counts)
+    assert list(flipPositions(5, 1.0)) == [0, 1, 2, 3, 4]
+    assert list(flipPositions(5, 0.0)) == []
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from services.incremental_evaluator import IncrementalEvaluator
+from services.population_seeding import seedPopulation
+from services.local_search import simulatedAnnealing, tabuSearch, hillClimb, moveDelta, neighbourhood
+
+@pytest.fixture
+def start(month_problem):
+    return np.random.default_rng(0).integers(0, 2, size=len(month_problem)).tolist()
+
+def test_simulated_annealing_improves_schedule(month_problem, start):
+    """Test that annealing returns a cheaper schedule whose cost is reported correctly."""
+    best, cost, logbook = simulatedAnnealing(month_problem, start, np.random.default_rng(1), max_moves=20000)
+    assert cost == month_problem.getCost(best)
+    assert cost < month_problem.getCost(start)
+    assert logbook[-1]["best"] == cost
+
+@pytest.mark.parametrize("search", [simulatedAnnealing, tabuSearch])
+def test_local_search_reports_improvements(month_problem, start, search):
+    """Test that the progress callback gets the start and then only strict improvements."""
+    reports = []
+    best, cost, _ = search(month_problem, start, np.random.default_rng(1), time_limit=5,
+                           progress=lambda schedule, cost: reports.append((list(schedule), cost)))
+    costs = [reported for _, reported in reports]
+    assert reports[0] == (start, month_problem.getCost(start))
+    assert costs == sorted(set(costs), reverse=True)
+    assert all(month_problem.getCost(schedule) == reported for schedule, reported in reports)
+    assert costs[-1] >= cost
+
+def test_tabu_search_improves_schedule(month_problem, start):
+    """Test that tabu search returns a cheaper schedule whose cost is reported correctly."""
+    best, cost, logbook = tabuSearch(month_problem, start, np.random.default_rng(1), max_iterations=300)
+    assert cost == month_problem.getCost(best)
+    assert cost < month_problem.getCost(start)
+
+@pytest.fixture
+def near(month_problem):
+    """A greedy seed schedule with a few cells flipped, as left behind by the GA."""
+    rng = np.random.default_rng(2)
+    schedule = seedPopulation(month_problem, 1, rng)[0].ravel()
+    schedule[rng.choice(len(schedule), size=15, replace=False)] ^= 1
+    return schedule.tolist()
+
+@pytest.mark.parametrize("strategy", ["first", "steepest"])
+def test_hill_climb_reaches_local_optimum(month_problem, near, strategy):
+    """Test that hill climbing only improves and stops where no single move helps."""
+    best, cost, logbook = hillClimb(month_problem, near, np.random.default_rng(1), strategy=strategy, max_moves=10**6)
+    assert cost == month_problem.getCost(best)
+    assert cost < month_problem.getCost(near)
+    assert logbook.select("cost") == sorted(logbook.select("cost"), reverse=True)
+    evaluator = IncrementalEvaluator(month_problem, best)
+    assert cost == 0 or min(moveDelta(evaluator, move) for move in neighbourhood(evaluator)) >= 0
+
+def test_hill_climb_respects_move_budget(month_problem, start):
+    """Test that the climb stops once the evaluated move budget is spent."""
+    _, _, logbook = hillClimb(month_problem, start, np.random.default_rng(1), max_moves=50)
+    assert logbook[-1]["moves"] == 50
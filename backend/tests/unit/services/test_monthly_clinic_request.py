@@ -1,5 +1,5 @@
 import pytest
-from services.monthly_clinic_request import create_monthly_clinic_request
+from services.monthly_clinic_request import create_monthly_clinic_request, create_synthetic_clinic_request
 
 
 def test_create_monthly_clinic_request_with_all_parameters():
@@ -63,3 +63,12 @@ def test_create_monthly_clinic_request_partial_parameters():
     assert request["totalShifts"] == []
     assert request["minShifts"] == []
     assert request["maxShifts"] == []
+
+
+def test_create_synthetic_clinic_request_is_reproducible():
+    """Test that synthetic requests have the requested shape and depend only on the seed."""
+    request = create_synthetic_clinic_request(5, 30, availability=0.8, seed=7)
+    assert len(request["doctorNames"]) == 5
+    assert all(len(row) == 30 for row in request["doctorPreference"])
+    assert request["weekendPositions"][5:7] == [1, 1]
+    assert request == create_synthetic_clinic_request(5, 30, availability=0.8, seed=7)
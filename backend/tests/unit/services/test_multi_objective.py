@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from services.doctor_scheduling_service import DoctorSchedulingProblem
+from services.multi_objective import OBJECTIVES, getPopulationObjectives, solveParetoFront
+
+@pytest.fixture
+def problem():
+    """Fixture for a problem whose weekends and rest spacing pull against the coverage."""
+    return DoctorSchedulingProblem(
+        hardConstraintPenalty=100,
+        listOfDoctors=["Dr. Alice", "Dr. Bob", "Dr. Carol", "Dr. Dave"],
+        listOfDoctorPreferce=[[1] * 14, [1] * 14, [1, 0] * 7, [0, 1] * 7],
+        doctorshiftMax=[2] * 14,
+        doctorshiftMin=[2] * 14,
+        weekendPositionArray=[0, 0, 0, 0, 0, 1, 1] * 2,
+        doctorExperience=[1, 1, 1, 1],
+        num_days=14
+    )
+
+def test_objectives_stack_hard_cost_and_soft_violations(problem):
+    """Test that the objectives are the hard cost followed by the soft violation counts."""
+    population = np.random.default_rng(0).integers(0, 2, size=(20, len(problem)))
+    objectives = getPopulationObjectives(problem, population)
+    assert objectives.shape == (20, len(OBJECTIVES))
+    assert objectives[:, 0].tolist() == [problem.getCost(schedule) for schedule in population.tolist()]
+    assert np.array_equal(objectives[:, 1:], problem.getPopulationSoftViolations(population))
+
+def test_pareto_front_is_non_dominated(problem):
+    """Test that the returned front is sorted, scored correctly and free of dominated points."""
+    schedules, objectives, logbook = solveParetoFront(problem, np.random.default_rng(0),
+                                                      population_size=30, generations=10)
+    assert len(schedules) == len(objectives) >= 1
+    assert np.array_equal(getPopulationObjectives(problem, schedules), objectives)
+    assert objectives.tolist() == sorted(objectives.tolist())
+    for first in objectives:
+        for second in objectives:
+            assert not (np.all(first <= second) and np.any(first < second))
+    assert len(logbook) == 11
+    assert logbook[-1]["hard"] <= logbook[0]["hard"]
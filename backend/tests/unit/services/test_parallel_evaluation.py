@@ -0,0 +1,10 @@
+import numpy as np
+from services.parallel_evaluation import ParallelEvaluator
+
+def test_parallel_costs_match_in_process_costs(problem):
+    """Test that the process pool returns the same costs as the in-process evaluator."""
+    rng = np.random.default_rng(0)
+    with ParallelEvaluator(problem, workers=2) as evaluator:
+        for size in (100, 37, 250):
+            population = problem.toMatrix(rng.integers(0, 2, size=(size, len(problem))))
+            assert evaluator.evaluate(population).tolist() == problem.getPopulationCosts(population).tolist()
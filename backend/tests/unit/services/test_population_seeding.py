@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+from services.population_seeding import seedPopulation
+
+@pytest.fixture
+def penalty():
+    """Unit penalty, so that costs count violations."""
+    return 1
+
+def test_seeded_schedules_respect_days_off(month_problem):
+    """Test that no seeded schedule assigns a requested day off."""
+    population = seedPopulation(month_problem, 50, np.random.default_rng(0))
+    assert population.shape == (50, 10, 28)
+    assert not (population.astype(bool) & month_problem.unavailableArray).any()
+
+def test_seeded_schedules_are_much_cheaper_than_random(month_problem):
+    """Test that greedy seeding starts far closer to feasibility than uniform bits."""
+    rng = np.random.default_rng(1)
+    seeded = month_problem.getPopulationCosts(seedPopulation(month_problem, 50, rng))
+    uniform = month_problem.getPopulationCosts(rng.integers(0, 2, size=(50, len(month_problem))))
+    assert seeded.mean() * 5 < uniform.mean()
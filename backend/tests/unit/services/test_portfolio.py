@@ -0,0 +1,69 @@
+import time
+
+import pytest
+from services.doctor_scheduling_service import DoctorSchedulingProblem
+from services.portfolio import Portfolio
+from services.solution_service import DEFAULT_CONFIG
+
+@pytest.fixture
+def problem():
+    """Fixture for a problem no schedule solves: Dr. Carol is never available."""
+    return DoctorSchedulingProblem(
+        hardConstraintPenalty=100,
+        listOfDoctors=["Dr. Alice", "Dr. Bob", "Dr. Carol"],
+        listOfDoctorPreferce=[[1] * 14, [1] * 14, [0] * 14],
+        doctorshiftMax=[2] * 14,
+        doctorshiftMin=[1] * 14,
+        weekendPositionArray=[0, 0, 0, 0, 0, 1, 1] * 2,
+        doctorExperience=[1, 1, 1],
+        num_days=14
+    )
+
+CONFIG = {**DEFAULT_CONFIG, "population_size": 30, "hall_of_fame_size": 5, "polish": None}
+
+def test_deadline_returns_best_so_far_and_kills_members(problem):
+    """Test that members still running at the deadline are killed and their progress kept."""
+    config = {**CONFIG, "max_generations": 100000, "target_cost": None}
+    start = time.perf_counter()
+    best, cost, logbook = Portfolio(problem, config, [("ga", 0), ("ga", 1)], deadline=1.0, workers=2).run()
+    assert time.perf_counter() - start < 5
+    assert cost == problem.getCost(best) > 0
+    assert logbook.select("status") == ["killed", "killed"]
+    assert min(logbook.select("cost")) == cost
+
+def test_queued_local_search_members_get_the_time_left(problem):
+    """Test that local-search members stop within the time left and keep their result when queued."""
+    config = {**CONFIG, "local_search_moves": 10 ** 9}
+    members = [("sa", 0), ("sa", 1), ("tabu", 0)]
+    best, cost, logbook = Portfolio(problem, config, members, deadline=3.0, workers=1).run()
+    assert logbook.select("status")[0] == "done"
+    assert "killed" not in logbook.select("status")
+    assert cost == problem.getCost(best) == logbook.select("cost")[0]
+
+def test_finished_members_report_their_results(problem):
+    """Test that every member runs to completion with its own seed when there is time."""
+    config = {**CONFIG, "max_generations": 3, "tabu_iterations": 50}
+    members = [("ga", 0), ("tabu", 0), ("ga", 1)]
+    best, cost, logbook = Portfolio(problem, config, members, deadline=30, workers=2).run()
+    assert logbook.select("status") == ["done"] * 3
+    assert logbook.select("seed") == [0, 0, 1]
+    assert cost == min(logbook.select("cost"))
+
+def test_zero_cost_result_ends_the_race():
+    """Test that the first schedule without violations is returned and the other members are killed."""
+    problem = DoctorSchedulingProblem(
+        hardConstraintPenalty=100,
+        listOfDoctors=["Dr. Alice", "Dr. Bob", "Dr. Carol", "Dr. Dave"],
+        listOfDoctorPreferce=[[1] * 14] * 4,
+        doctorshiftMax=[2] * 14,
+        doctorshiftMin=[1] * 14,
+        weekendPositionArray=[0, 0, 0, 0, 0, 1, 1] * 2,
+        doctorExperience=[1, 1, 1, 1],
+        num_days=14
+    )
+    config = {**CONFIG, "max_generations": 100000, "target_cost": None, "seeding": "random", "repair": False}
+    start = time.perf_counter()
+    best, cost, logbook = Portfolio(problem, config, [("ga", 0), ("tabu", 0)], deadline=30, workers=2).run()
+    assert cost == problem.getCost(best) == 0
+    assert time.perf_counter() - start < 10
+    assert "killed" in logbook.select("status")
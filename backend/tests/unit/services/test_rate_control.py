@@ -0,0 +1,43 @@
+import itertools
+
+import numpy as np
+import pytest
+from deap import base, creator, tools
+from services.genome_representations import BinaryRepresentation
+from services.rate_control import AdaptiveRates, meanHammingDistance
+
+def test_mean_hamming_distance_matches_pairwise_loop():
+    """Test that the count-based diversity equals the average over all pairs."""
+    population = np.random.default_rng(0).integers(0, 2, size=(12, 3, 7))
+    pairs = [np.mean(a != b) for a, b in itertools.combinations(population, 2)]
+    assert meanHammingDistance(population) == pytest.approx(np.mean(pairs))
+    assert meanHammingDistance(population[:1]) == 0.0
+
+def test_rates_explore_when_converged_and_relax_on_improvement(problem):
+    """Test that a stalled, uniform population raises mutation and an improvement lowers it again."""
+    creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
+    representation = BinaryRepresentation(problem)
+    toolbox = base.Toolbox()
+    representation.register(toolbox, indpb=0.05)
+    controller = AdaptiveRates(representation, toolbox.mutate, cxpb=0.9, mutpb=0.3)
+    population = [creator.Individual([0] * len(problem)) for _ in range(10)]
+    for individual in population:
+        individual.fitness.values = (500,)
+    hof = tools.HallOfFame(1)
+    hof.update(population)
+
+    for gen in range(4):
+        record = controller(gen, population, hof)
+    assert record["diversity"] == 0.0
+    assert record["mutpb"] > 0.3 and record["cxpb"] < 0.9
+    assert toolbox.mutate.keywords["indpb"] == pytest.approx(record["indpb"], abs=1e-5) and record["indpb"] > 0.05
+
+    rng = np.random.default_rng(1)
+    for individual in population:
+        individual[:] = rng.integers(0, 2, len(problem)).tolist()
+    population[0].fitness.values = (100,)
+    hof.update(population)
+    relaxed = controller(4, population, hof)
+    assert relaxed["improvement"] > 0
+    assert relaxed["mutpb"] < record["mutpb"]
+    assert relaxed["mutpb"] >= 0.3
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from deap import base, creator
+from services.doctor_scheduling_service import DoctorSchedulingProblem
+from services.genome_representations import BinaryRepresentation
+from services.repair import repairSchedules, RepairOperator
+
+@pytest.fixture
+def problem():
+    """Fixture for a 6-doctor, 14-day problem with some requested days off."""
+    rng = np.random.default_rng(2)
+    preferences = (rng.random((6, 14)) > 0.2).astype(int).tolist()
+    return DoctorSchedulingProblem(
+        hardConstraintPenalty=1,
+        listOfDoctors=[f"Dr. {index}" for index in range(6)],
+        listOfDoctorPreferce=preferences,
+        doctorshiftMax=[2] * 14,
+        doctorshiftMin=[1] * 14,
+        weekendPositionArray=[0] * 14,
+        doctorExperience=[1] * 6,
+        num_days=14
+    )
+
+def test_repair_clears_days_off_and_bounds_coverage(problem):
+    """Test that repaired schedules honour days off and the daily coverage range."""
+    rng = np.random.default_rng(0)
+    population = rng.integers(0, 2, size=(30, 6, 14))
+    repaired = repairSchedules(problem, population, rng)
+    violations = problem.getPopulationViolations(repaired)
+    assert (violations[:, 0] == 0).all()
+    assert (violations[:, 1] == 0).all()
+
+def test_repair_operator_updates_individuals_and_reports(problem):
+    """Test that the operator rewrites changed individuals and reports its repair rate."""
+    creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
+    creator.create("Individual", list, fitness=creator.FitnessMin)
+    operator = RepairOperator(problem, BinaryRepresentation(problem), np.random.default_rng(1))
+    individuals = [creator.Individual([1] * len(problem)) for _ in range(4)]
+    individuals[0].fitnessHint = (0,)
+    operator.repair(individuals)
+    assert (problem.getPopulationViolations(individuals)[:, :2] == 0).all()
+    assert not hasattr(individuals[0], "fitnessHint")
+    record = operator(1, individuals, None)
+    assert record["repaired"] == 1.0
+    assert operator(2, individuals, None)["repaired"] == 0.0
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from services.schedule_service import ScheduleService
+from services.clinic_request_precheck import InfeasibleRequestError
 from database.models import Schedule
 
 
@@ -10,10 +11,15 @@ def session():
     return MagicMock()
 
 
+def scheduling_problem():
+    """Mocked scheduling problem with the monthly shift limits the pre-check reads."""
+    return MagicMock(doctorMinShiftPerMonth=5, doctorMaxShiftPerMonth=7)
+
+
 def test_generate_schedule_success(session):
     """Test generating a schedule successfully."""
     with patch("services.schedule_service.DatabaseToClinicRequestService") as MockClinicService, \
-         patch("services.schedule_service.DoctorSchedulingProblem") as MockSchedulingProblem, \
+         patch("services.schedule_service.DoctorSchedulingProblem", return_value=scheduling_problem()) as MockSchedulingProblem, \
          patch("services.schedule_service.SolutionService") as MockSolutionService, \
          patch("services.schedule_service.ScheduleRepository") as MockScheduleRepo:
 
@@ -44,6 +50,90 @@ def test_generate_schedule_success(session):
         assert response["message"] == "Schedule for January 2025 generated successfully!"
 
 
+def test_generate_schedule_with_local_search_engine(session):
+    """Test that a non-GA engine is dispatched through SolutionService.solve."""
+    with patch("services.schedule_service.DatabaseToClinicRequestService") as MockClinicService, \
+         patch("services.schedule_service.DoctorSchedulingProblem", return_value=scheduling_problem()), \
+         patch("services.schedule_service.SolutionService") as MockSolutionService, \
+         patch("services.schedule_service.ScheduleRepository"):
+
+        MockClinicService.return_value.get_monthly_clinic_request.return_value = {
+            "doctorNames": ["Dr. Alice", "Dr. Bob"],
+            "doctorPreference": [[1, 1, 0], [0, 1, 1]],
+            "weekendPositions": [0, 0, 1],
+            "maxShifts": [2, 2, 2],
+            "minShifts": [1, 1, 1],
+        }
+        mock_solution_service = MockSolutionService.return_value
+        mock_solution_service.solve.return_value = [1] * 62
+
+        ScheduleService.generate_schedule(session, "January", 2025, engine="sa")
+
+        mock_solution_service.solve.assert_called_once_with("sa")
+        mock_solution_service.run_genetic_algorithm.assert_not_called()
+
+
+def test_pareto_point_is_saved_from_the_kept_front(session):
+    """Test that nsga2 returns the whole front and a chosen point is saved without solving again."""
+    with patch("services.schedule_service.DatabaseToClinicRequestService") as MockClinicService, \
+         patch("services.schedule_service.DoctorSchedulingProblem", return_value=scheduling_problem()), \
+         patch("services.schedule_service.SolutionService") as MockSolutionService, \
+         patch("services.schedule_service.ScheduleRepository"):
+
+        MockClinicService.return_value.get_monthly_clinic_request.return_value = {
+            "doctorNames": ["Dr. Alice", "Dr. Bob"],
+            "doctorPreference": [[1, 1, 0], [0, 1, 1]],
+            "weekendPositions": [0, 0, 1],
+            "maxShifts": [2, 2, 2],
+            "minShifts": [1, 1, 1],
+        }
+        front = [
+            {"id": 0, "schedule": [1] * 62, "hard": 0, "weekend": 2, "rest": 1},
+            {"id": 1, "schedule": [0] * 62, "hard": 100, "weekend": 0, "rest": 0},
+        ]
+        mock_solution_service = MockSolutionService.return_value
+        mock_solution_service.solve.return_value = front[0]["schedule"]
+        mock_solution_service.pareto_front = front
+
+        response = ScheduleService.generate_schedule(session, "January", 2025, engine="nsga2")
+        assert response["pareto_front"] == front
+        assert response["pareto_point"] == 0
+
+        result = ScheduleService.save_pareto_point(session, response["pareto_run"], 1)
+        assert result["pareto_point"] == 1
+        mock_solution_service.solve.assert_called_once_with("nsga2")
+        saved = mock_solution_service.save_solution_to_db.call_args[0][3]
+        assert saved.shape == (31, 2) and saved.sum() == 0
+
+        for point in (2, -1, "1"):
+            with pytest.raises(ValueError):
+                ScheduleService.save_pareto_point(session, response["pareto_run"], point)
+        with pytest.raises(LookupError):
+            ScheduleService.save_pareto_point(session, "unknown", 0)
+
+
+def test_generate_schedule_rejects_infeasible_request(session):
+    """Test that an uncoverable request raises before the solver is created."""
+    with patch("services.schedule_service.DatabaseToClinicRequestService") as MockClinicService, \
+         patch("services.schedule_service.SolutionService") as MockSolutionService, \
+         patch("services.schedule_service.ScheduleRepository") as MockScheduleRepo:
+
+        MockClinicService.return_value.get_monthly_clinic_request.return_value = {
+            "doctorNames": ["Dr. Alice", "Dr. Bob"],
+            "doctorPreference": [[1, 0, 0], [0, 0, 1]],
+            "weekendPositions": [0, 0, 1],
+            "maxShifts": [2, 2, 2],
+            "minShifts": [1, 1, 1],
+        }
+
+        with pytest.raises(InfeasibleRequestError) as error:
+            ScheduleService.generate_schedule(session, "January", 2025)
+
+        assert error.value.diagnostic["errors"][0]["days"] == [{"day": 2, "available": 0, "required": 1}]
+        MockSolutionService.assert_not_called()
+        MockScheduleRepo.add_schedule.assert_not_called()
+
+
 def test_get_schedules_success(session):
     """Test retrieving schedules successfully."""
     session.query.return_value.filter.return_value.filter.return_value.all.return_value = [
@@ -82,3 +172,23 @@ def test_export_schedule_as_csv_success(session):
     session.query.assert_called_once()
     assert response.mimetype == "text/csv"
     assert "attachment" in response.headers["Content-Disposition"]
+
+
+def test_generate_schedule_rejects_request_without_doctors(session):
+    """Test that a month without doctors is reported as infeasible, not as a numpy error."""
+    with patch("services.schedule_service.DatabaseToClinicRequestService") as MockClinicService, \
+         patch("services.schedule_service.SolutionService") as MockSolutionService:
+
+        MockClinicService.return_value.get_monthly_clinic_request.return_value = {
+            "doctorNames": [],
+            "doctorPreference": [],
+            "weekendPositions": [0, 0, 1],
+            "maxShifts": [2, 2, 2],
+            "minShifts": [1, 1, 1],
+        }
+
+        with pytest.raises(InfeasibleRequestError) as error:
+            ScheduleService.generate_schedule(session, "January", 2025)
+
+        assert error.value.diagnostic["errors"][0]["code"] == "no_doctors"
+        MockSolutionService.assert_not_called()
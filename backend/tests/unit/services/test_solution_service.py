@@ -0,0 +1,213 @@
+import pytest
+from unittest.mock import patch
+from services.solution_service import SolutionService
+
+SMALL_RUN = {"population_size": 30, "hall_of_fame_size": 5, "max_generations": 3}
+
+@pytest.mark.parametrize("representation", ["binary", "bitpacked", "reduced", "dayset"])
+def test_run_genetic_algorithm_returns_flat_schedule(problem, representation):
+    """Test that every representation returns a flat binary schedule."""
+    service = SolutionService(problem, config={**SMALL_RUN, "representation": representation})
+    best = service.run_genetic_algorithm()
+    assert len(best) == len(problem)
+    assert set(best) <= {0, 1}
+
+def test_unknown_representation_is_rejected(problem):
+    """Test that an unknown representation name raises a ValueError."""
+    with pytest.raises(ValueError):
+        SolutionService(problem, config={"representation": "unknown"})
+
+def test_run_genetic_algorithm_with_workers(problem):
+    """Test that the process pool evaluation mode runs and shuts down cleanly."""
+    service = SolutionService(problem, config={**SMALL_RUN, "population_size": 80, "workers": 2})
+    best = service.run_genetic_algorithm()
+    assert len(best) == len(problem)
+    assert service.parallel_evaluator is None
+
+def test_fitness_cache_statistics_are_logged(problem):
+    """Test that the cache hit/miss counts are recorded for every generation."""
+    service = SolutionService(problem, config=SMALL_RUN)
+    service.run_genetic_algorithm()
+    hits, misses = service.logbook.select("hits", "misses")
+    assert len(hits) == SMALL_RUN["max_generations"] + 1
+    assert misses[0] + hits[0] == SMALL_RUN["population_size"]
+
+@pytest.mark.parametrize("topology", ["ring", "random"])
+def test_island_model_returns_global_best(problem, topology):
+    """Test that the island model runs all islands and logs every epoch."""
+    config = {**SMALL_RUN, "population_size": 40, "max_generations": 4, "islands": 2,
+              "migration_interval": 2, "migration_size": 2, "migration_topology": topology,
+              "target_cost": None}
+    service = SolutionService(problem, config=config)
+    best = service.run_genetic_algorithm()
+    assert len(best) == len(problem)
+    assert service.logbook.select("island") == [0, 1, 0, 1]
+    assert service.logbook.select("gen") == [2, 2, 4, 4]
+    assert service.logbook[-1]["stop"] == "max_generations"
+    assert min(service.logbook.select("min")) == problem.getCost(best)
+
+def test_island_model_picks_adaptive_penalty_result_by_unweighted_cost(problem):
+    """Test that with the adaptive penalty the island model returns the elite of lowest unweighted cost."""
+    config = {**SMALL_RUN, "population_size": 40, "max_generations": 4, "islands": 2,
+              "migration_interval": 2, "migration_size": 2, "target_cost": None,
+              "adaptive_penalty": True}
+    service = SolutionService(problem, config=config)
+    with patch.object(service, "_unweighted_best", wraps=service._unweighted_best) as unweighted_best:
+        best = service.run_genetic_algorithm()
+    elites = unweighted_best.call_args[0][0]
+    assert len(elites) == 2 * config["migration_size"]
+    assert problem.getCost(best) == min(problem.getCost(service.representation.decode(elite)) for elite in elites)
+
+def test_island_model_applies_stall_rule_to_global_best(problem):
+    """Test that the islands stop once the global best stalls, logging the real generation count."""
+    config = {**SMALL_RUN, "population_size": 40, "max_generations": 200, "islands": 2,
+              "migration_interval": 2, "migration_size": 2, "target_cost": None, "stall_generations": 3}
+    service = SolutionService(problem, config=config)
+    service.run_genetic_algorithm()
+    last = service.logbook[-1]
+    assert last["stop"] == "stall"
+    assert last["gen"] < 200 and last["gen"] % 2 == 0
+    assert len(service.logbook) == last["gen"]
+
+@pytest.mark.parametrize("representation", ["binary", "bitpacked", "reduced", "dayset"])
+def test_seeded_population_mixes_in_random_individuals(problem, representation):
+    """Test that greedy seeding fills the population with the configured random share."""
+    service = SolutionService(problem, config={**SMALL_RUN, "representation": representation,
+                                               "seeding_random_fraction": 0.2})
+    population = service.create_population()
+    assert len(population) == SMALL_RUN["population_size"]
+    assert all(type(ind) is type(population[0]) for ind in population)
+    seeded = service.representation.toMatrix(population[:24]).astype(bool)
+    assert not (seeded & problem.unavailableArray).any()
+
+@pytest.mark.parametrize("engine", ["sa", "tabu"])
+def test_solve_with_local_search_engines(problem, engine):
+    """Test that the local search engines return flat schedules like the GA."""
+    service = SolutionService(problem, config={"local_search_moves": 2000, "tabu_iterations": 100})
+    best = service.solve(engine)
+    assert len(best) == len(problem)
+    assert service.logbook[-1]["best"] == problem.getCost(best)
+
+def test_solve_rejects_unknown_engine(problem):
+    """Test that an unknown engine name raises a ValueError."""
+    with pytest.raises(ValueError):
+        SolutionService(problem).solve("unknown")
+
+@pytest.mark.parametrize("fallback", [None, "sa", "ga"])
+def test_solve_with_flow_engine(problem, fallback):
+    """Test that the flow engine returns a flat schedule with or without a fallback engine."""
+    service = SolutionService(problem, config={**SMALL_RUN, "flow_fallback": fallback,
+                                               "local_search_moves": 2000, "flow_seeds": 3})
+    best = service.solve("flow")
+    assert len(best) == len(problem)
+    assert set(best) <= {0, 1}
+
+def test_flow_fallback_to_ga_keeps_config(problem):
+    """Test that the GA fallback seeds from the flow schedule without changing the configured seeding."""
+    service = SolutionService(problem, config={**SMALL_RUN, "flow_fallback": "ga", "flow_seeds": 2})
+    flows = []
+
+    def solve_flow(noise=0.0):
+        flows.append(noise)
+        return [0] * len(problem)
+    service._solve_flow = solve_flow
+    best = service.solve("flow")
+    assert len(best) == len(problem)
+    assert len(flows) == 3
+    assert service.config["seeding"] == "greedy"
+
+def test_solve_with_exact_engine_reports_bound(problem):
+    """Test that the exact engine logs a lower bound that never exceeds the returned cost."""
+    service = SolutionService(problem, config={"exact_time_limit": 10})
+    best = service.solve("exact")
+    assert len(best) == len(problem)
+    record = service.logbook[-1]
+    assert record["cost"] == problem.getCost(best)
+    assert record["bound"] <= record["cost"]
+
+def test_polishing_records_removed_cost(problem):
+    """Test that polishing after the GA logs the cost it removed and never adds cost."""
+    service = SolutionService(problem, config={**SMALL_RUN, "polish": "steepest", "seeding": "random",
+                                               "repair": False})
+    best = service.run_genetic_algorithm()
+    record = service.logbook[-1]
+    assert record["polished"] >= 0
+    assert problem.getCost(best) == record["min"] - record["polished"]
+
+@pytest.mark.parametrize("crossover", ["rows", "columns", "weeks"])
+def test_run_genetic_algorithm_with_matrix_crossover(problem, crossover):
+    """Test that the configured matrix crossover replaces two-point crossover."""
+    service = SolutionService(problem, config={**SMALL_RUN, "crossover": crossover})
+    best = service.run_genetic_algorithm()
+    assert len(best) == len(problem)
+    assert service.toolbox.mate.__name__ == "mate"
+
+def test_targeted_mutation_logs_operator_probabilities(problem):
+    """Test that the targeted mutation reports its operator probabilities every generation."""
+    service = SolutionService(problem, config={**SMALL_RUN, "mutation": "targeted"})
+    best = service.run_genetic_algorithm()
+    assert len(best) == len(problem)
+    assert len(service.logbook.select("p_overload")) == SMALL_RUN["max_generations"] + 1
+
+def test_adaptive_penalty_logs_weights(problem):
+    """Test that the penalty weights are logged every generation of an adaptive run."""
+    service = SolutionService(problem, config={**SMALL_RUN, "adaptive_penalty": True, "seeding": "random"})
+    best = service.run_genetic_algorithm()
+    assert len(best) == len(problem)
+    weights = service.logbook.select("w_per_day")
+    assert len(weights) == SMALL_RUN["max_generations"] + 1
+    assert min(weights) >= 1.0
+
+def test_adaptive_rates_are_logged(problem):
+    """Test that an adaptive-rate run logs its diversity and rates every generation."""
+    service = SolutionService(problem, config={**SMALL_RUN, "adaptive_rates": True, "seeding": "random"})
+    best = service.run_genetic_algorithm()
+    assert len(best) == len(problem)
+    assert len(service.logbook.select("mutpb")) == SMALL_RUN["max_generations"] + 1
+    assert min(service.logbook.select("cxpb")) > 0
+
+def test_adaptive_indpb_reaches_wrapped_mutation(problem):
+    """Test that the adapted indpb is the one the mutation wrapped by the adaptive penalty uses."""
+    service = SolutionService(problem, config={**SMALL_RUN, "adaptive_rates": True, "adaptive_penalty": True})
+    service.rate_controller.max_indpb = 1.0
+    service.rate_controller._setIndpb(1.0)
+    individual = service.toolbox.individualCreator()
+    before = list(individual)
+    mutant, = service.toolbox.mutate(individual)
+    assert all(old != new for old, new in zip(before, mutant))
+
+def test_adaptive_rates_skip_indpb_of_targeted_mutation(problem):
+    """Test that no indpb is adapted or logged when the mutation has none."""
+    service = SolutionService(problem, config={**SMALL_RUN, "adaptive_rates": True, "mutation": "targeted"})
+    service.run_genetic_algorithm()
+    assert "indpb" not in service.logbook.header
+    assert len(service.logbook.select("mutpb")) == SMALL_RUN["max_generations"] + 1
+
+def test_solve_with_nsga2_keeps_pareto_front(problem):
+    """Test that the multi-objective engine returns a front schedule and keeps the front."""
+    service = SolutionService(problem, config={"pareto_population_size": 20, "pareto_generations": 3})
+    best = service.solve("nsga2")
+    assert len(best) == len(problem)
+    assert service.pareto_front
+    assert set(service.pareto_front[0]) == {"id", "schedule", "hard", "weekend", "rest"}
+    assert [point["id"] for point in service.pareto_front] == list(range(len(service.pareto_front)))
+    assert problem.getCost(best) == min(point["hard"] for point in service.pareto_front)
+
+def test_solve_with_portfolio_returns_best_member(problem):
+    """Test that the portfolio runs every engine and seed and returns the best member's schedule."""
+    service = SolutionService(problem, config={**SMALL_RUN, "portfolio_engines": ["tabu", "ga"], "tabu_iterations": 50,
+                                               "portfolio_workers": 2, "portfolio_deadline": 30})
+    best = service.solve("portfolio")
+    assert len(service.logbook) == 4
+    assert service.logbook.select("engine") == ["tabu", "ga", "tabu", "ga"]
+    assert problem.getCost(best) == min(service.logbook.select("cost"))
+
+def test_array_population_run(problem):
+    """Test that the array-backed population returns a schedule and rejects unsupported options."""
+    service = SolutionService(problem, config={**SMALL_RUN, "population": "array"})
+    best = service.run_genetic_algorithm()
+    assert len(best) == len(problem)
+    assert problem.getCost(best) == min(service.logbook.select("min"))
+    assert len(service.logbook) == SMALL_RUN["max_generations"] + 1
+    with pytest.raises(ValueError, match="mutation"):
+        SolutionService(problem, config={**SMALL_RUN, "population": "array", "mutation": "targeted"}).run_genetic_algorithm()
@@ -0,0 +1,64 @@
+import json
+from unittest.mock import patch
+
+import numpy as np
+from services.solution_service import SolutionService
+from services.solver_profiles import (
+    loadProfiles, problemFeatures, sampleSettings, saveProfiles, selectProfile, successiveHalving, tuneProfile
+)
+
+def profile(doctors, days, availability, population_size):
+    return {"doctors": doctors, "days": days, "availability": availability,
+            "settings": {"population_size": population_size}, "cost": 0.0, "seconds": 0.1}
+
+def test_sampled_settings_are_distinct_and_consistent():
+    """Test that sampled settings do not repeat and keep the hall of fame within the population."""
+    samples = sampleSettings(np.random.default_rng(0), 20)
+    assert len({tuple(sorted(settings.items())) for settings in samples}) == 20
+    assert all(1 <= settings["hall_of_fame_size"] <= settings["population_size"] for settings in samples)
+
+def test_successive_halving_keeps_the_best_and_grows_the_budget():
+    """Test that halving returns the best candidate and spends more budget on survivors."""
+    budgets = {}
+    def evaluate(candidate, budget):
+        budgets.setdefault(candidate, []).append(budget)
+        return abs(candidate - 5)
+    best, score = successiveHalving(list(range(8)), evaluate, rounds=3)
+    assert (best, score) == (5, 0)
+    assert budgets[5] == [1, 2, 4]
+    assert sum(len(spent) for spent in budgets.values()) == 8 + 4 + 2
+
+def test_select_profile_picks_the_closest_class():
+    """Test that the profile closest in size and density is selected."""
+    profiles = [profile(10, 31, 0.85, 100), profile(20, 31, 0.85, 400), profile(10, 31, 0.5, 900)]
+    assert selectProfile(profiles, (12, 30, 0.8)) == {"population_size": 100}
+    assert selectProfile(profiles, (18, 31, 0.9)) == {"population_size": 400}
+    assert selectProfile([], (18, 31, 0.9)) is None
+
+def test_tuned_profile_round_trips_and_is_applied(problem, tmp_path):
+    """Test that a tuned profile is saved, loaded and applied under explicit overrides."""
+    solve = lambda problem, config: [0] * len(problem)
+    tuned = tuneProfile([problem] * 4, solve, np.random.default_rng(0), candidates=4)
+    assert (tuned["doctors"], tuned["days"], tuned["availability"]) == problemFeatures(problem)
+    path = tmp_path / "profiles.json"
+    saveProfiles([tuned], path)
+    assert loadProfiles(path) == [tuned]
+
+    service = SolutionService(problem, config={"solver_profiles": str(path), "p_mutation": 0.42})
+    assert service.profile == tuned["settings"]
+    assert service.config["population_size"] == tuned["settings"]["population_size"]
+    assert service.config["p_mutation"] == 0.42
+    assert SolutionService(problem, config={"solver_profiles": None}).profile is None
+
+def test_profiles_are_read_once_and_hall_of_fame_fits_the_population(problem, tmp_path):
+    """Test that a profile file is read once and its hall of fame is capped by an explicit population."""
+    path = tmp_path / "profiles.json"
+    saveProfiles([{
+        "doctors": 3, "days": 7, "availability": 1.0, "cost": 0, "seconds": 0,
+        "settings": {"population_size": 400, "hall_of_fame_size": 200},
+    }], path)
+    with patch("services.solver_profiles.json.load", wraps=json.load) as load:
+        SolutionService(problem, config={"solver_profiles": str(path)})
+        service = SolutionService(problem, config={"solver_profiles": str(path), "population_size": 50})
+    assert load.call_count == 1
+    assert service.config["hall_of_fame_size"] == 50
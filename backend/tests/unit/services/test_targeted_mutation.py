@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from deap import base, creator
+from services.genome_representations import BinaryRepresentation
+from services.incremental_evaluator import IncrementalEvaluator
+from services.local_search import applyMove
+from services.targeted_mutation import AdaptiveMutation, consecutiveMove, overloadMove, restMove
+
+@pytest.fixture
+def schedules(month_problem):
+    rng = np.random.default_rng(0)
+    return [(rng.random(len(month_problem)) < 0.3).astype(int).tolist() for _ in range(20)]
+
+def test_overload_move_keeps_day_coverage(month_problem, schedules):
+    """Test that a shift is handed on the same day to a less loaded doctor."""
+    rng = np.random.default_rng(1)
+    for schedule in schedules:
+        evaluator = IncrementalEvaluator(month_problem, schedule)
+        move = overloadMove(evaluator, rng)
+        (giver, day), (taker, other_day) = move[1]
+        assert day == other_day
+        assert evaluator.doctorTotals[taker] < evaluator.doctorTotals[giver]
+        coverage = list(evaluator.dayCoverage)
+        applyMove(evaluator, move)
+        assert evaluator.dayCoverage == coverage
+
+def test_rest_move_avoids_adjacent_days(month_problem, schedules):
+    """Test that a moved shift lands on an available day next to no other shift."""
+    rng = np.random.default_rng(2)
+    for schedule in schedules:
+        evaluator = IncrementalEvaluator(month_problem, schedule)
+        move = restMove(evaluator, rng)
+        if move is None:
+            continue
+        (doctor, _), (_, target) = move[1]
+        applyMove(evaluator, move)
+        row = evaluator.matrix[doctor]
+        assert not month_problem.unavailableArray[doctor, target]
+        assert row[max(target - 1, 0):target].sum() + row[target + 1:target + 2].sum() == 0
+        assert evaluator.dayCoverage[target] <= month_problem.shiftMaxArray[target]
+
+def test_consecutive_move_breaks_a_pair(month_problem, schedules):
+    """Test that breaking a consecutive pair lowers the consecutive shift count."""
+    rng = np.random.default_rng(3)
+    for schedule in schedules:
+        evaluator = IncrementalEvaluator(month_problem, schedule)
+        before = evaluator.violations[3]
+        move = consecutiveMove(evaluator, rng)
+        if move is None:
+            assert before == 0
+            continue
+        applyMove(evaluator, move)
+        assert evaluator.violations[3] < before
+
+def test_adaptive_mutation_hint_and_probabilities(month_problem, schedules):
+    """Test that mutated individuals carry a correct cost hint and that probabilities adapt."""
+    creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
+    representation = BinaryRepresentation(month_problem)
+    representation.register(base.Toolbox(), indpb=0.1)
+    mutation = AdaptiveMutation(month_problem, representation, np.random.default_rng(4))
+    for schedule in schedules * 5:
+        individual = creator.Individual(schedule)
+        individual.fitness.values = (month_problem.getCost(schedule),)
+        mutation.mutate(individual)
+        assert individual.fitnessHint == (month_problem.getCost(list(individual)),)
+    record = mutation(1, [], None)
+    probabilities = np.array([record[field] for field in mutation.fields])
+    assert probabilities.sum() == pytest.approx(1.0, abs=1e-2)
+    assert (probabilities >= mutation.min_probability - 1e-9).all()
+    assert not np.allclose(probabilities, 1.0 / 3)
@@ -0,0 +1,62 @@
+"""
+Benchmarks the solver engines on synthetic clinic requests.
+
+Reports, for every engine and roster size, the wall time until the engine stopped and
+the cost it reached, so the time-to-zero-hard-cost of each engine can be compared.
+
+Usage (from the repository root):
+    python dev_utils/benchmark_engines.py --engines ga sa tabu flow exact --sizes 10 14 18 --seeds 3
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+
+from services.doctor_scheduling_service import DoctorSchedulingProblem
+from services.monthly_clinic_request import create_synthetic_clinic_request
+from services.solution_service import SolutionService
+
+
+def build_problem(num_doctors, num_days, availability, seed):
+    request = create_synthetic_clinic_request(num_doctors, num_days, availability, seed)
+    return DoctorSchedulingProblem(
+        hardConstraintPenalty=10000,
+        listOfDoctors=request['doctorNames'],
+        listOfDoctorPreferce=request['doctorPreference'],
+        doctorshiftMax=request['maxShifts'],
+        doctorshiftMin=request['minShifts'],
+        weekendPositionArray=request['weekendPositions'],
+        doctorExperience=[1] * num_doctors,
+        num_days=num_days
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--engines', nargs='+', default=['ga', 'sa', 'tabu', 'flow', 'exact'])
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10, 14, 18])
+    parser.add_argument('--days', type=int, default=31)
+    parser.add_argument('--availability', type=float, default=0.85)
+    parser.add_argument('--seeds', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'engine':<8}{'doctors':>8}{'seed':>6}{'seconds':>10}{'cost':>10}{'zero':>6}")
+    for size in args.sizes:
+        for seed in range(args.seeds):
+            for engine in args.engines:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    problem = build_problem(size, args.days, args.availability, seed)
+                    service = SolutionService(problem, config={"random_seed": seed, "verbose": False})
+                    start = time.perf_counter()
+                    best = service.solve(engine)
+                    elapsed = time.perf_counter() - start
+                cost = problem.getCost(best)
+                print(f"{engine:<8}{size:>8}{seed:>6}{elapsed:>10.2f}{cost:>10}{'yes' if cost == 0 else 'no':>6}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Tunes the genetic algorithm settings per clinic size on synthetic clinic requests.
+
+For every combination of roster size, month length and availability density, samples
+settings from services.solver_profiles.SEARCH_SPACE and narrows them down by successive
+halving over seeded GA runs: each round solves twice as many requests with the better
+half of the settings. Settings are ranked by mean final cost, then mean run time. The
+winners are written to the profile file SolutionService loads at startup.
+
+Usage (from the repository root):
+    python dev_utils/tune_solver_profiles.py --sizes 10 14 18 --days 28 31 --availability 0.7 0.85
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+
+from benchmark_engines import build_problem
+from services.solution_service import SolutionService
+from services.solver_profiles import SOLVER_PROFILES_PATH, saveProfiles, tuneProfile
+
+
+def solve(problem, config):
+    with contextlib.redirect_stdout(io.StringIO()):
+        service = SolutionService(problem, config={**config, "verbose": False, "solver_profiles": None})
+        return service.run_genetic_algorithm()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10, 14, 18])
+    parser.add_argument('--days', nargs='+', type=int, default=[31])
+    parser.add_argument('--availability', nargs='+', type=float, default=[0.85])
+    parser.add_argument('--candidates', type=int, default=16)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=SOLVER_PROFILES_PATH)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    profiles = []
+    for size in args.sizes:
+        for days in args.days:
+            for availability in args.availability:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    problems = [build_problem(size, days, availability, seed) for seed in range(2 ** (args.rounds - 1))]
+                profile = tuneProfile(problems, solve, rng, candidates=args.candidates, rounds=args.rounds)
+                profiles.append(profile)
+                print(f"{size:>4} doctors {days:>3} days {availability:.2f} available: "
+                      f"cost {profile['cost']:.0f} in {profile['seconds']:.2f}s with {profile['settings']}")
+    saveProfiles(profiles, args.output)
+    print(f"Wrote {len(profiles)} profile(s) to {args.output}")
+
+
+if __name__ == '__main__':
+    main()